@@ -0,0 +1,40 @@
+import os
+import stat
+
+import pytest
+
+from voxtext_cache import atomic_write_bytes
+
+
+def mode(path):
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+@pytest.fixture
+def umask():
+    previous = os.umask(0o022)
+    yield os.umask
+    os.umask(previous)
+
+
+@pytest.mark.skipif(os.name != 'posix', reason="POSIX permissions")
+def test_outputs_follow_the_umask(tmp_path, umask):
+    umask(0o077)
+    atomic_write_bytes(tmp_path / 'private.txt', b'text', private=False)
+    umask(0o022)
+    atomic_write_bytes(tmp_path / 'shared.txt', b'text', private=False)
+    assert mode(tmp_path / 'private.txt') == 0o600
+    assert mode(tmp_path / 'shared.txt') == 0o644
+
+
+@pytest.mark.skipif(os.name != 'posix', reason="POSIX permissions")
+def test_overwriting_keeps_permissions_and_caches_stay_private(tmp_path, umask):
+    path = tmp_path / 'transcript.srt'
+    path.write_bytes(b'old')
+    os.chmod(path, 0o640)
+    atomic_write_bytes(path, b'new', private=False)
+    atomic_write_bytes(tmp_path / 'entry.json', b'{}')
+    assert path.read_bytes() == b'new'
+    assert mode(path) == 0o640
+    assert mode(tmp_path / 'entry.json') == 0o600
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['entry.json', 'transcript.srt']
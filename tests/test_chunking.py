@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+
+from voxtext_audio import SAMPLE_RATE
+from voxtext_chunking import Chunk, plan_chunks, stitch_results
+
+
+def seconds(value):
+    return int(value * SAMPLE_RATE)
+
+
+def segment(start, end, text, **fields):
+    return dict({'start': start, 'end': end, 'text': text}, **fields)
+
+
+def two_chunks():
+    """0-10 s and 10-20 s keep regions, each decoded with 2 s of overlap"""
+    return [
+        Chunk(0, 0, seconds(12), 0, seconds(10)),
+        Chunk(1, seconds(8), seconds(20), seconds(10), seconds(20)),
+    ]
+
+
+def texts(result):
+    return [s['text'] for s in result['segments']]
+
+
+def test_short_recording_is_one_chunk():
+    audio = np.zeros(seconds(60), dtype=np.float32)
+    chunks = plan_chunks(audio, chunk_seconds=60)
+    assert len(chunks) == 1
+    assert (chunks[0].start, chunks[0].end) == (0, len(audio))
+
+
+def test_chunks_cut_at_silence_and_tile_the_recording():
+    rng = np.random.default_rng(0)
+    audio = (rng.standard_normal(seconds(200)) * 0.1).astype(np.float32)
+    audio[seconds(62):seconds(63)] = 0  # the only quiet spot near the first target
+    audio[seconds(121):seconds(122)] = 0
+    chunks = plan_chunks(audio, chunk_seconds=60, overlap_seconds=2)
+    
+    assert len(chunks) == 3
+    assert seconds(62) <= chunks[1].keep_start <= seconds(63)
+    assert seconds(121) <= chunks[2].keep_start <= seconds(122)
+    # Keep regions cover every sample exactly once; decoded slices add the overlap
+    assert chunks[0].keep_start == 0 and chunks[-1].keep_end == len(audio)
+    for previous, chunk in zip(chunks, chunks[1:]):
+        assert previous.keep_end == chunk.keep_start
+        assert chunk.start == chunk.keep_start - seconds(2)
+        assert previous.end == previous.keep_end + seconds(2)
+
+
+def test_timestamps_are_moved_onto_the_absolute_timeline():
+    first = {'segments': [segment(0.0, 4.0, " One.", seek=0)], 'language': 'en'}
+    words = [{'word': " Three", 'start': 4.0, 'end': 5.0, 'probability': 0.9}]
+    second = {'segments': [segment(4.0, 8.0, " Three.", seek=400, words=words)], 'language': 'en'}
+    result = stitch_results(two_chunks(), [first, second])
+    
+    one, three = result['segments']
+    assert (one['start'], one['end']) == (0.0, 4.0)
+    assert (three['start'], three['end']) == (12.0, 16.0)
+    assert three['seek'] == 1200
+    assert (three['words'][0]['start'], three['words'][0]['end']) == (12.0, 13.0)
+    assert second['segments'][0]['start'] == 4.0  # the chunk results are not modified
+    assert [s['id'] for s in result['segments']] == [0, 1]
+    assert result['text'] == " One. Three."
+    assert result['language'] == 'en'
+
+
+def test_overlap_segments_belong_to_the_chunk_holding_their_midpoint():
+    first = {'segments': [
+        segment(0.0, 4.0, " One."),
+        segment(4.0, 9.5, " Two."),
+        segment(9.5, 11.5, " Seam."),  # midpoint 10.5: the second chunk's
+    ]}
+    second = {'segments': [
+        segment(0.0, 1.5, " Two."),  # 8-9.5 s: the first chunk's
+        segment(1.5, 3.5, " Seam."),
+        segment(4.0, 8.0, " Three."),
+    ]}
+    result = stitch_results(two_chunks(), [first, second])
+    
+    assert texts(result) == [" One.", " Two.", " Seam.", " Three."]
+    assert [(s['start'], s['end']) for s in result['segments']] == [
+        (0.0, 4.0), (4.0, 9.5), (9.5, 11.5), (12.0, 16.0)
+    ]
+
+
+def test_same_words_decoded_on_both_sides_of_a_seam_are_kept_once():
+    first = {'segments': [segment(8.5, 10.4, " Hello there.")]}
+    # Decoded again with later times, so its midpoint (11 s) is in the second chunk
+    second = {'segments': [segment(1.8, 4.2, " hello there"), segment(5.0, 7.0, " Next.")]}
+    result = stitch_results(two_chunks(), [first, second])
+    
+    assert texts(result) == [" Hello there.", " Next."]
+
+
+def test_stitched_segments_never_overlap():
+    first = {'segments': [segment(6.0, 9.9, " Long sentence.")]}
+    second = {'segments': [segment(1.0, 3.0, " Starts early.")]}  # 9-11 s
+    result = stitch_results(two_chunks(), [first, second])
+    
+    previous, following = result['segments']
+    assert following['start'] == pytest.approx(previous['end'])
+    assert following['end'] == pytest.approx(11.0)
+
+
+def test_empty_chunks_stitch_to_an_empty_result():
+    result = stitch_results(two_chunks(), [{'segments': []}, {}])
+    assert result == {'text': '', 'segments': [], 'language': None}
@@ -0,0 +1,21 @@
+from voxtext_metrics import MetricsRecorder
+
+
+def record(source):
+    return {
+        'file': str(source), 'output_dir': None, 'model': 'tiny', 'backend': 'whisper', 'cached': False,
+        'audio_seconds': 60.0, 'wall_seconds': 6.0, 'cpu_seconds': 12.0, 'stages': {'transcribe': 5.0},
+        'peak_rss_mb': 300.0, 'realtime_factor': 10.0,
+    }
+
+
+def test_unwritable_metrics_files_do_not_stop_the_batch(tmp_path, capsys):
+    blocker = tmp_path / 'not-a-folder'
+    blocker.write_text('')
+    recorder = MetricsRecorder(json_files=True, prometheus_path=blocker / 'voxtext.prom')
+    recorder(0, record(blocker / 'lecture.wav'))
+    recorder(1, record(tmp_path / 'talk.wav'))
+    
+    assert len(recorder.records) == 2
+    assert (tmp_path / 'talk_metrics.json').exists()
+    assert capsys.readouterr().err.count('Note: could not write') == 3
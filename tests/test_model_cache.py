@@ -0,0 +1,30 @@
+from voxtext_backends import FasterWhisperBackend
+from voxtext_engine import ModelCache
+
+
+class CTranslate2Model:
+    """Stands in for a faster-whisper model: no torch parameters, weights freed by unload_model()"""
+    
+    def __init__(self, memory_bytes):
+        self.memory_bytes = memory_bytes
+        self.unloaded = False
+    
+    @property
+    def model(self):
+        return self
+    
+    def unload_model(self):
+        self.unloaded = True
+
+
+def test_models_without_torch_tensors_count_against_the_budget():
+    backend = FasterWhisperBackend()
+    cache = ModelCache(budget_mb=1000)
+    small = backend.memory_estimate('small')
+    in_use = cache.get('small', lambda name: CTranslate2Model(small), backend.unload)
+    assert cache.used_mb() == small / (1024 * 1024)
+    
+    cache.get('medium', lambda name: CTranslate2Model(backend.memory_estimate('medium')), backend.unload)
+    # Over budget: 'small' leaves the cache, but a job still holding it keeps working weights
+    assert [name for name, _ in cache.resident()] == ['medium']
+    assert not in_use.unloaded
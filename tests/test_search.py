@@ -0,0 +1,46 @@
+import json
+
+from voxtext_search import SearchIndex
+
+
+def result(*texts):
+    return {'language': 'en', 'text': ''.join(texts), 'segments': [
+        {'start': float(i), 'end': float(i + 1), 'text': text} for i, text in enumerate(texts)
+    ]}
+
+
+def test_saved_transcript_from_a_job_updates_its_entry(tmp_path):
+    media = tmp_path / 'lecture.mp4'
+    media.write_bytes(b'')
+    saved = tmp_path / 'lecture.json'
+    saved.write_text(json.dumps(result(' photosynthesis in leaves')), encoding='utf-8')
+    
+    with SearchIndex(tmp_path / 'search.db') as index:
+        index.add(media, result(' photosynthesis in plants'), [saved], model='base')
+        index.add_saved(saved)
+        hits = index.search('photosynthesis')
+        assert index.counts() == (1, 1)
+    assert [(hit['media'], hit['text']) for hit in hits] == [(str(media.resolve()), 'photosynthesis in leaves')]
+
+
+def test_transcribing_replaces_an_entry_added_from_its_transcript(tmp_path):
+    media = tmp_path / 'talk.wav'
+    media.write_bytes(b'')
+    saved = tmp_path / 'talk.vxt'
+    saved.write_text(json.dumps(result(' mitochondria')), encoding='utf-8')
+    
+    with SearchIndex(tmp_path / 'search.db') as index:
+        index.add_saved(saved)
+        index.add(media, result(' mitochondria'), [saved])
+        assert index.counts() == (1, 1)
+        assert index.search('mitochondria')[0]['media'] == str(media.resolve())
+
+
+def test_prune_forgets_entries_whose_files_are_gone(tmp_path):
+    kept, gone = tmp_path / 'kept.wav', tmp_path / 'gone.wav'
+    kept.write_bytes(b'')
+    with SearchIndex(tmp_path / 'search.db') as index:
+        index.add(kept, result(' kept'))
+        index.add(gone, result(' gone'))
+        assert index.prune() == 1
+        assert index.counts() == (1, 1)
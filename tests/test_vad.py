@@ -0,0 +1,66 @@
+import numpy as np
+
+from voxtext_audio import SAMPLE_RATE
+from voxtext_bench import synthesize_reference
+from voxtext_vad import detect_speech
+
+
+def noise(seconds, amplitude, seed=1):
+    rng = np.random.default_rng(seed)
+    return (rng.standard_normal(int(seconds * SAMPLE_RATE)) * amplitude).astype(np.float32)
+
+
+def test_clean_speech_skips_the_pauses():
+    speech_map = detect_speech(synthesize_reference(60))
+    assert speech_map.is_reliable
+    assert 0 < speech_map.skipped_seconds < 60
+
+
+def test_leading_silence_is_skipped_and_timestamps_map_back():
+    audio = np.concatenate([np.zeros(10 * SAMPLE_RATE, dtype=np.float32), synthesize_reference(30)])
+    speech_map = detect_speech(audio)
+    assert speech_map.is_reliable
+    assert speech_map.regions[0][0] >= 9 * SAMPLE_RATE
+    assert speech_map.to_original(0.0) == speech_map.regions[0][0] / SAMPLE_RATE
+
+
+def test_speech_under_noise_or_steady_noise_is_not_trusted():
+    # The noise floor sits just under the voice, so almost nothing clears the threshold
+    assert not detect_speech(synthesize_reference(60) + noise(60, 0.05)).is_reliable
+    assert not detect_speech(noise(60, 0.1)).is_reliable
+
+
+def noisy_engine(monkeypatch, tmp_path, segments):
+    """An engine with voice detection whose model returns segments; records the samples it gets"""
+    import voxtext_audio
+    from voxtext_engine import TranscriptionEngine
+    
+    monkeypatch.setenv('VOXTEXT_CACHE_DIR', str(tmp_path / 'cache'))
+    audio = synthesize_reference(60) + noise(60, 0.05)
+    monkeypatch.setattr(voxtext_audio, 'load_audio', lambda file_path, cache=None: audio)
+    engine = TranscriptionEngine('tiny', [], options={'vad': True, 'pcm_cache': False})
+    engine.decoded = []
+    
+    def run_model(samples, decode_options):
+        engine.decoded.append(len(samples))
+        return {'text': '', 'segments': [dict(s) for s in segments], 'language': 'en'}
+    
+    monkeypatch.setattr(engine, '_run_model', run_model)
+    media = tmp_path / 'noisy.wav'
+    media.write_bytes(b'not decoded')
+    return engine, media, len(audio)
+
+
+def test_engine_decodes_the_full_audio_when_detection_finds_no_speech(monkeypatch, tmp_path):
+    segments = [{'start': 1.0, 'end': 2.0, 'text': ' hello'}]
+    engine, media, samples = noisy_engine(monkeypatch, tmp_path, segments)
+    result = engine.transcribe(media)
+    assert engine.decoded == [samples]
+    assert result['segments'] == segments
+
+
+def test_empty_voice_detection_result_is_not_cached(monkeypatch, tmp_path):
+    engine, media, samples = noisy_engine(monkeypatch, tmp_path, [])
+    engine.transcribe(media)
+    engine.transcribe(media)
+    assert engine.decoded == [samples, samples]
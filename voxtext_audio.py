@@ -0,0 +1,66 @@
+"""
+Voxtext audio helpers
+
+Decoding media to the 16 kHz mono float32 PCM that Whisper consumes, and
+cheap frame-energy analysis used to find silence in it.
+"""
+
+SAMPLE_RATE = 16000  # Whisper's fixed input rate
+FRAME_SECONDS = 0.02  # 20 ms analysis frames
+
+
+def load_audio(file_path, cache=None):
+    """
+    Decode any ffmpeg-readable media file to 16 kHz mono float32 samples.
+    With a PcmCache, a file decoded before is memory-mapped from the cache
+    instead of running ffmpeg again, and a new decode is stored in it.
+    """
+    from whisper.audio import load_audio as whisper_load_audio
+    
+    if cache is None:
+        return whisper_load_audio(str(file_path), sr=SAMPLE_RATE)
+    
+    from voxtext_cache import file_digest
+    
+    key = cache.key(file_digest(file_path))
+    audio = cache.get(key)
+    if audio is None:
+        audio = whisper_load_audio(str(file_path), sr=SAMPLE_RATE)
+        try:
+            cache.put(key, audio)
+        except OSError:
+            pass  # a full or read-only cache never fails the job
+    return audio
+
+
+def duration_seconds(audio):
+    return len(audio) / SAMPLE_RATE
+
+
+def frame_energies(audio, frame_seconds=FRAME_SECONDS):
+    """
+    RMS level in dBFS for consecutive frames of the signal.
+    Computed in blocks so multi-hour recordings never need a second full-size copy.
+    """
+    import numpy as np
+    
+    frame = int(SAMPLE_RATE * frame_seconds)
+    n_frames = len(audio) // frame
+    energies = np.empty(n_frames, dtype=np.float32)
+    block = 3000  # frames per block (one minute at 20 ms)
+    for first in range(0, n_frames, block):
+        last = min(first + block, n_frames)
+        chunk = np.asarray(audio[first * frame:last * frame], dtype=np.float32).reshape(-1, frame)
+        rms = np.sqrt(np.mean(chunk * chunk, axis=1))
+        energies[first:last] = 20 * np.log10(rms + 1e-10)
+    return energies
+
+
+def smooth(values, width):
+    """Moving average over `width` frames (same length as the input)"""
+    import numpy as np
+    
+    if width <= 1 or len(values) == 0:
+        return values
+    kernel = np.ones(width, dtype=np.float32) / width
+    return np.convolve(values, kernel, mode='same')
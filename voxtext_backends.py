@@ -0,0 +1,272 @@
+"""
+Voxtext inference backends
+
+A backend loads a model and transcribes audio (a media path or 16 kHz mono
+float32 samples) into the result structure every other part of Voxtext
+consumes, whatever library produced it:
+
+    {'text': str, 'language': str, 'segments': [
+        {'id': int, 'start': float, 'end': float, 'text': str,
+         'words': [{'word', 'start', 'end', 'probability'}]  # when requested
+         ...backend-specific extras (tokens, avg_logprob, ...)}
+    ]}
+
+The writers, result cache, chunk stitching and voice-detection remapping only
+rely on these keys. openai-whisper (PyTorch) is the reference backend;
+faster-whisper (CTranslate2) is a much faster CPU runtime.
+"""
+
+import time
+import threading
+import importlib
+import importlib.util
+from contextlib import contextmanager
+
+from voxtext_engine import (
+    FRAMES_PER_SECOND, TranscriptionCancelled, decode_progress, cancellation_hooks,
+    load_whisper_model, prepare_whisper_model, model_cache_key
+)
+
+DEFAULT_BACKEND = 'whisper'
+# Parameter counts of the Whisper models (large = large-v3), for memory estimates
+WHISPER_PARAMETERS = {'tiny': 39e6, 'base': 74e6, 'small': 244e6, 'medium': 769e6, 'large': 1550e6}
+
+
+def _add_stage(stages, name, seconds):
+    if stages is not None:
+        stages[name] = stages.get(name, 0.0) + seconds
+
+
+_alignment = threading.local()
+
+
+def _install_alignment_timer():
+    """Time whisper.transcribe's word alignment on the calling thread (wrapped once per process)"""
+    module = importlib.import_module('whisper.transcribe')
+    original = module.add_word_timestamps
+    if getattr(original, 'voxtext_timed', False):
+        return
+    
+    def add_word_timestamps(*args, **kwargs):
+        _alignment.active = True
+        started = time.perf_counter()
+        try:
+            return original(*args, **kwargs)
+        finally:
+            _alignment.seconds = getattr(_alignment, 'seconds', 0.0) + time.perf_counter() - started
+            _alignment.active = False
+    
+    add_word_timestamps.voxtext_timed = True
+    module.add_word_timestamps = add_word_timestamps
+
+
+@contextmanager
+def _whisper_stage_timing(model, stages):
+    """
+    Split a model.transcribe() call into 'mel' (loading the audio and the
+    log-mel spectrogram, everything before the first encoder pass), 'encode'
+    (encoder passes), 'word_alignment' (word timestamps, including the extra
+    forward passes they take) and 'decode' (the rest: token decoding and
+    segment timestamps).
+    """
+    if stages is None or not hasattr(model, 'encoder'):
+        yield
+        return
+    _install_alignment_timer()
+    _alignment.seconds = 0.0
+    started = time.perf_counter()
+    passes = {'first': None, 'current': None, 'encode': 0.0}
+    
+    def before(module, inputs):
+        if getattr(_alignment, 'active', False):
+            return
+        passes['current'] = time.perf_counter()
+        if passes['first'] is None:
+            passes['first'] = passes['current']
+    
+    def after(module, inputs, output):
+        if getattr(_alignment, 'active', False):
+            return
+        passes['encode'] += time.perf_counter() - passes['current']
+    
+    handles = [model.encoder.register_forward_pre_hook(before), model.encoder.register_forward_hook(after)]
+    try:
+        yield
+    finally:
+        for handle in handles:
+            handle.remove()
+        total = time.perf_counter() - started
+        mel = (passes['first'] or started + total) - started
+        _add_stage(stages, 'mel', mel)
+        _add_stage(stages, 'encode', passes['encode'])
+        if _alignment.seconds:
+            _add_stage(stages, 'word_alignment', _alignment.seconds)
+        _add_stage(stages, 'decode', max(total - mel - passes['encode'] - _alignment.seconds, 0.0))
+
+
+class WhisperBackend:
+    """openai-whisper on PyTorch (the reference implementation)"""
+    name = 'whisper'
+    label = "OpenAI Whisper (PyTorch)"
+    module = 'whisper'
+    
+    def is_available(self):
+        return importlib.util.find_spec(self.module) is not None
+    
+    def cache_key(self, model_name, quantize=False):
+        return model_cache_key(model_name, quantize)
+    
+    def is_installed(self, model_name):
+        """Whether the model is in the store (so loading it will not download)"""
+        from voxtext_models import model_path
+        
+        path = model_path(model_name)
+        return path is not None and path.exists()
+    
+    def load(self, model_name, on_download=None, is_cancelled=None, quantize=False):
+        return load_whisper_model(model_name, on_download, is_cancelled, quantize)
+    
+    def prepare(self, model_name, on_download=None, is_cancelled=None, quantize=False):
+        """Fetch the checkpoint into the store so worker processes only load it"""
+        prepare_whisper_model(model_name, on_download, is_cancelled, quantize)
+    
+    def transcribe(self, model, audio, decode_options, on_progress=None, is_cancelled=None, stages=None):
+        """
+        Transcribe, calling on_progress(done_seconds, total_seconds, new_segments)
+        after every 30 s window; is_cancelled() is checked before every forward pass.
+        Seconds spent per stage (mel, encode, decode, word_alignment) are added to stages.
+        """
+        is_cancelled = is_cancelled or (lambda: False)
+        
+        def check_cancelled():
+            if is_cancelled():
+                raise TranscriptionCancelled()
+        
+        def on_decoded(frames, total_frames, segments):
+            if on_progress:
+                on_progress(frames / FRAMES_PER_SECOND, total_frames / FRAMES_PER_SECOND, segments)
+        
+        with decode_progress(on_decoded), cancellation_hooks(model, check_cancelled), \
+                _whisper_stage_timing(model, stages):
+            return model.transcribe(audio, **decode_options)
+    
+    def unload(self, model):
+        pass  # tensors are freed with the last reference; ModelCache then releases the memory
+
+
+class FasterWhisperBackend:
+    """faster-whisper on CTranslate2: the same models, several times faster on CPU"""
+    name = 'faster-whisper'
+    label = "faster-whisper (CTranslate2, fast CPU)"
+    module = 'faster_whisper'
+    
+    def is_available(self):
+        return importlib.util.find_spec(self.module) is not None
+    
+    def cache_key(self, model_name, quantize=False):
+        return f"{model_name} ({self.name}{', int8' if quantize else ''})"
+    
+    def is_installed(self, model_name):
+        from voxtext_models import models_dir
+        
+        repo = 'large-v3' if model_name == 'large' else model_name
+        return any((models_dir() / "faster-whisper").glob(f"models--*--faster-whisper-{repo}"))
+    
+    def prepare(self, model_name, on_download=None, is_cancelled=None, quantize=False):
+        pass  # faster-whisper fetches its own model files when loading
+    
+    def load(self, model_name, on_download=None, is_cancelled=None, quantize=False):
+        """
+        Load a converted model, downloaded by faster-whisper itself (from the
+        Hugging Face hub, into the model store; no byte progress) unless offline.
+        """
+        from faster_whisper import WhisperModel
+        from voxtext_models import models_dir, is_offline
+        from voxtext_weights import peak_rss_mb
+        
+        started = time.perf_counter()
+        model = WhisperModel(
+            'large-v3' if model_name == 'large' else model_name,
+            device="auto",
+            compute_type="int8" if quantize else "default",
+            download_root=str(models_dir() / "faster-whisper"),
+            local_files_only=is_offline(),
+        )
+        model.load_stats = {
+            'seconds': time.perf_counter() - started, 'peak_rss_mb': peak_rss_mb(),
+            'backend': self.name, 'quantized': quantize,
+        }
+        # CTranslate2 weights are not torch tensors; ModelCache budgets this estimate
+        model.memory_bytes = self.memory_estimate(model_name, quantize, getattr(model.model, 'device', 'cpu'))
+        return model
+    
+    def memory_estimate(self, model_name, quantize=False, device='cpu'):
+        """Bytes held by a loaded model: int8, float16 on a GPU, float32 otherwise"""
+        bytes_per_parameter = 1 if quantize else 2 if device == 'cuda' else 4
+        return int(WHISPER_PARAMETERS.get(model_name, WHISPER_PARAMETERS['large']) * bytes_per_parameter)
+    
+    def transcribe(self, model, audio, decode_options, on_progress=None, is_cancelled=None, stages=None):
+        """
+        Transcribe, calling on_progress(done_seconds, total_seconds, [segment]) per
+        segment. Encoding, decoding and word alignment interleave inside
+        CTranslate2, so stages gets 'mel' (audio loading, features and language
+        detection) and 'transcribe'.
+        """
+        is_cancelled = is_cancelled or (lambda: False)
+        started = time.perf_counter()
+        segments, info = model.transcribe(audio, **decode_options)
+        _add_stage(stages, 'mel', time.perf_counter() - started)
+        started = time.perf_counter()
+        
+        # Segments are decoded lazily as the generator is consumed
+        results = []
+        for segment in segments:
+            if is_cancelled():
+                raise TranscriptionCancelled()
+            item = {
+                'id': len(results),
+                'seek': segment.seek,
+                'start': segment.start,
+                'end': segment.end,
+                'text': segment.text,
+                'tokens': list(segment.tokens),
+                'temperature': segment.temperature,
+                'avg_logprob': segment.avg_logprob,
+                'compression_ratio': segment.compression_ratio,
+                'no_speech_prob': segment.no_speech_prob,
+            }
+            if segment.words:
+                item['words'] = [
+                    {'word': w.word, 'start': w.start, 'end': w.end, 'probability': w.probability}
+                    for w in segment.words
+                ]
+            results.append(item)
+            if on_progress:
+                on_progress(segment.end, info.duration, [item])
+        _add_stage(stages, 'transcribe', time.perf_counter() - started)
+        
+        return {
+            'text': ''.join(item['text'] for item in results),
+            'segments': results,
+            'language': info.language,
+        }
+    
+    def unload(self, model):
+        # Never unload_model() here: a job that still holds the model would
+        # lose its weights mid-decode. They are freed with the last reference.
+        pass
+
+
+BACKENDS = {backend.name: backend for backend in (WhisperBackend(), FasterWhisperBackend())}
+
+
+def get_backend(name=None):
+    """Look a backend up by name (None = the default)"""
+    try:
+        return BACKENDS[name or DEFAULT_BACKEND]
+    except KeyError:
+        raise ValueError(f"Unknown backend: {name} (choose from {', '.join(BACKENDS)})") from None
+
+
+def available_backends():
+    return [backend for backend in BACKENDS.values() if backend.is_available()]
@@ -0,0 +1,262 @@
+"""
+Voxtext benchmark suite
+
+Measures, on this machine, every installed model with every installed
+backend: model load time, transcription speed (real-time factor), peak
+memory and the time to write all output formats. Each run happens in a fresh
+worker process so the load is cold and peak memory belongs to that model
+alone. Results are appended to a JSON history in the user cache folder; the
+Processing Speed Guide and the transcription ETA use the latest run of each
+model instead of typical numbers.
+
+The reference audio is synthesized (voiced, syllable-like bursts and pauses)
+unless a clip is given. Whisper mostly takes its no-speech path on synthetic
+audio, so those runs are recorded as synthetic: their load time and memory
+are shown, but only runs on a real speech clip feed the speed guide and ETAs.
+"""
+
+import os
+import json
+import time
+import platform
+import tempfile
+import multiprocessing
+from datetime import datetime
+
+from voxtext_engine import (
+    MODEL_NAMES, OUTPUT_FORMATS, DEFAULT_OPTIONS, TranscriptionCancelled, write_outputs, format_duration
+)
+
+HISTORY_VERSION = 1
+MAX_HISTORY_RUNS = 500
+REFERENCE_SECONDS = 60
+
+
+def benchmark_history_path():
+    from voxtext_cache import user_cache_dir
+    return user_cache_dir() / "benchmarks.json"
+
+
+def load_history(path=None):
+    """Every recorded run, oldest first"""
+    try:
+        with open(path or benchmark_history_path(), 'r', encoding='utf-8') as f:
+            history = json.load(f)
+    except (OSError, ValueError):
+        return []
+    if not isinstance(history, dict) or history.get('version') != HISTORY_VERSION:
+        return []
+    return history.get('runs', [])
+
+
+def save_runs(runs, path=None):
+    """Append runs to the history (oldest runs are dropped past MAX_HISTORY_RUNS)"""
+    from voxtext_cache import atomic_write_bytes
+    
+    path = path or benchmark_history_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    history = {'version': HISTORY_VERSION, 'runs': (load_history(path) + list(runs))[-MAX_HISTORY_RUNS:]}
+    atomic_write_bytes(path, json.dumps(history, indent=1).encode('utf-8'))
+
+
+def machine_info():
+    return {
+        'system': f"{platform.system()} {platform.release()}",
+        'processor': platform.processor() or platform.machine(),
+        'cores': os.cpu_count(),
+        'python': platform.python_version(),
+    }
+
+
+def synthesize_reference(seconds=REFERENCE_SECONDS, seed=0):
+    """
+    Deterministic speech-like test signal: voiced syllables (a wandering pitch
+    with harmonics) grouped into phrases separated by pauses.
+    """
+    import numpy as np
+    from voxtext_audio import SAMPLE_RATE
+    
+    rng = np.random.default_rng(seed)
+    audio = np.zeros(int(seconds * SAMPLE_RATE), dtype=np.float32)
+    position = int(0.3 * SAMPLE_RATE)
+    while position < len(audio):
+        for _ in range(rng.integers(4, 12)):  # syllables per phrase
+            length = int(rng.uniform(0.12, 0.3) * SAMPLE_RATE)
+            if position + length > len(audio):
+                break
+            t = np.arange(length) / SAMPLE_RATE
+            pitch = rng.uniform(100, 220) * (1 + 0.1 * np.sin(2 * np.pi * rng.uniform(2, 5) * t))
+            phase = 2 * np.pi * np.cumsum(pitch) / SAMPLE_RATE
+            voiced = sum(np.sin(k * phase) / k for k in range(1, 9))
+            audio[position:position + length] = 0.1 * np.hanning(length) * voiced
+            position += length + int(rng.uniform(0.03, 0.12) * SAMPLE_RATE)
+        position += int(rng.uniform(0.4, 1.0) * SAMPLE_RATE)
+    return audio
+
+
+def benchmark_targets(backends=None, model_names=None):
+    """(model, backend name) pairs to measure: installed models of installed backends"""
+    from voxtext_backends import BACKENDS
+    
+    targets = []
+    for backend in BACKENDS.values():
+        if backends and backend.name not in backends or not backend.is_available():
+            continue
+        for model_name in model_names or MODEL_NAMES:
+            if backend.is_installed(model_name):
+                targets.append((model_name, backend.name))
+    return targets
+
+
+def _run_benchmark(model_name, backend_name, quantize, pcm_path, audio_source):
+    """One cold measurement, inside a fresh worker process"""
+    import numpy as np
+    from voxtext_backends import get_backend
+    from voxtext_weights import peak_rss_mb
+    from voxtext_audio import duration_seconds
+    
+    backend = get_backend(backend_name)
+    audio = np.load(pcm_path)
+    decode_options = {'language': DEFAULT_OPTIONS['language'], 'task': DEFAULT_OPTIONS['task']}
+    
+    started = time.perf_counter()
+    model = backend.load(model_name, quantize=quantize)
+    load_seconds = time.perf_counter() - started
+    
+    started = time.perf_counter()
+    result = backend.transcribe(model, audio, decode_options)
+    transcribe_seconds = time.perf_counter() - started
+    
+    with tempfile.TemporaryDirectory(prefix="voxtext_bench_") as output_dir:
+        started = time.perf_counter()
+        write_outputs(result, "benchmark", output_dir, OUTPUT_FORMATS)
+        write_seconds = time.perf_counter() - started
+    
+    audio_seconds = duration_seconds(audio)
+    device = 'cpu'
+    try:
+        import torch
+        if torch.cuda.is_available() and backend_name == 'whisper':
+            device = 'cuda'
+    except ImportError:
+        pass
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'model': model_name,
+        'backend': backend_name,
+        'quantize': quantize,
+        'device': device,
+        'audio': audio_source,
+        'audio_seconds': audio_seconds,
+        'load_seconds': load_seconds,
+        'transcribe_seconds': transcribe_seconds,
+        'speed': audio_seconds / max(transcribe_seconds, 1e-9),  # seconds of audio per second
+        'write_seconds': write_seconds,
+        'peak_rss_mb': peak_rss_mb(),
+        'machine': machine_info(),
+    }
+
+
+def run_benchmarks(targets, clip_path=None, quantize=False, progress=None, is_cancelled=None, save=True):
+    """
+    Measure each (model, backend) target and return the runs (also appended
+    to the history when save). progress(message) reports each step.
+    """
+    import numpy as np
+    
+    progress = progress or (lambda message: None)
+    is_cancelled = is_cancelled or (lambda: False)
+    if clip_path:
+        from voxtext_audio import load_audio
+        audio, audio_source = load_audio(clip_path), os.path.basename(clip_path)
+    else:
+        audio, audio_source = synthesize_reference(), f"synthetic {REFERENCE_SECONDS}s"
+    
+    fd, pcm_path = tempfile.mkstemp(prefix="voxtext_", suffix=".npy")
+    os.close(fd)
+    ctx = multiprocessing.get_context("spawn")
+    runs = []
+    try:
+        np.save(pcm_path, np.asarray(audio, dtype=np.float32))
+        for number, (model_name, backend_name) in enumerate(targets, 1):
+            progress(f"Benchmark {number}/{len(targets)}: {model_name} ({backend_name})...")
+            pool = ctx.Pool(1)
+            try:
+                pending = pool.apply_async(
+                    _run_benchmark, (model_name, backend_name, quantize, pcm_path, audio_source)
+                )
+                while not pending.ready():
+                    if is_cancelled():
+                        raise TranscriptionCancelled()
+                    pending.wait(0.2)
+                run = pending.get()
+                run['synthetic'] = not clip_path
+                runs.append(run)
+            finally:
+                pool.terminate()
+                pool.join()
+    finally:
+        try:
+            os.remove(pcm_path)
+        except OSError:
+            pass
+    
+    if save and runs:
+        save_runs(runs)
+    return runs
+
+
+def is_synthetic(run):
+    """Whether a run measured synthesized audio (runs saved before the flag are told by their audio)"""
+    return run.get('synthetic', str(run.get('audio', '')).startswith("synthetic"))
+
+
+def latest_runs(runs=None, include_synthetic=False):
+    """The most recent run per (model, backend, quantize); only speech-clip runs unless include_synthetic"""
+    latest = {}
+    for run in load_history() if runs is None else runs:
+        if include_synthetic or not is_synthetic(run):
+            latest[(run['model'], run['backend'], run['quantize'])] = run
+    return latest
+
+
+def expected_speed(model_name, backend='whisper', quantize=False, runs=None):
+    """Measured seconds of audio per second of compute, or None if never benchmarked"""
+    run = latest_runs(runs).get((model_name, backend, quantize))
+    return run['speed'] if run else None
+
+
+def estimate_seconds(model_name, audio_seconds, backend='whisper', quantize=False, runs=None):
+    """Expected transcription time (model load excluded), or None if never benchmarked"""
+    speed = expected_speed(model_name, backend, quantize, runs)
+    return audio_seconds / speed if speed else None
+
+
+def describe_run(run):
+    variant = run['backend'] + (", int8" if run['quantize'] else "")
+    return (
+        f"{run['model']:<7} {variant:<22} load {run['load_seconds']:5.1f}s · "
+        f"{run['speed']:5.1f}x real-time · writing {run['write_seconds'] * 1000:4.0f} ms · "
+        f"peak {run['peak_rss_mb'] or 0:,.0f} MB" + (" (synthetic audio)" if is_synthetic(run) else "")
+    )
+
+
+def speed_guide_lines(audio_minutes=10, runs=None):
+    """Measured times for audio_minutes of audio, one line per benchmarked model"""
+    def model_order(key):
+        known = key[0] in MODEL_NAMES
+        return (MODEL_NAMES.index(key[0]) if known else len(MODEL_NAMES), key)
+    
+    latest = latest_runs(runs)
+    lines = []
+    for model_name, backend, quantize in sorted(latest, key=model_order):
+        run = latest[(model_name, backend, quantize)]
+        variant = "" if backend == 'whisper' else f" ({backend})"
+        if quantize:
+            variant += " int8"
+        seconds = audio_minutes * 60 / run['speed'] + run['load_seconds']
+        lines.append(
+            f"• {model_name.capitalize()}{variant}: {format_duration(seconds)} "
+            f"({run['speed']:.1f}x real-time, measured {run['timestamp'][:10]})"
+        )
+    return lines
@@ -0,0 +1,252 @@
+"""
+Voxtext on-disk caches
+
+ResultCache stores raw Whisper result dicts, keyed by a content hash of the
+media plus the model name and every option that changes the transcript.
+Re-running a file with the same settings (for example to add a VTT after
+making a TXT) then regenerates outputs from the cache instead of
+transcribing again.
+
+PcmCache stores each media file decoded to 16 kHz mono float32 PCM, keyed by
+its content hash, so ffmpeg runs once per file: re-runs with other models or
+options memory-map the decoded samples instead of decoding again.
+
+Both caches are size-bounded; the least recently used entries are evicted first.
+"""
+
+import os
+import sys
+import json
+import uuid
+import hashlib
+import tempfile
+import threading
+from pathlib import Path
+
+DEFAULT_RESULT_CACHE_MB = 1024
+DEFAULT_PCM_CACHE_MB = 4096  # about 17 hours of audio
+CACHE_VERSION = 1  # bump when the stored result layout changes
+
+
+def user_cache_dir():
+    """Per-user Voxtext cache folder (override with VOXTEXT_CACHE_DIR)"""
+    override = os.environ.get("VOXTEXT_CACHE_DIR")
+    if override:
+        return Path(override)
+    home = Path.home()
+    if sys.platform == "darwin":
+        return home / "Library" / "Caches" / "Voxtext"
+    if sys.platform == "win32":
+        return Path(os.environ.get("LOCALAPPDATA", home / "AppData" / "Local")) / "Voxtext" / "Cache"
+    return Path(os.environ.get("XDG_CACHE_HOME", home / ".cache")) / "voxtext"
+
+
+_digest_memo = {}
+_digest_lock = threading.Lock()
+
+
+def file_digest(file_path):
+    """
+    SHA-256 of a file's contents, streamed in 1 MB blocks.
+    Memoized per process on (path, size, mtime) so a batch never hashes a file twice.
+    """
+    path = os.path.abspath(file_path)
+    stat = os.stat(path)
+    memo_key = (path, stat.st_size, stat.st_mtime_ns)
+    with _digest_lock:
+        if memo_key in _digest_memo:
+            return _digest_memo[memo_key]
+    
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    hex_digest = digest.hexdigest()
+    
+    with _digest_lock:
+        _digest_memo[memo_key] = hex_digest
+    return hex_digest
+
+
+def atomic_write_bytes(path, data, private=True):
+    """Write to a temp file in the same folder, then rename over the target"""
+    atomic_write_file(path, lambda f: f.write(data), private)
+
+
+def _create_shared(path):
+    """
+    Temp file for a user-facing output: created with the permissions open()
+    would give it (the umask applies), or those of the file it replaces
+    """
+    tmp_path = path.parent / f".{path.name}.{uuid.uuid4().hex}.tmp"
+    flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, 'O_BINARY', 0)
+    fd = os.open(tmp_path, flags, 0o666)
+    try:
+        os.chmod(tmp_path, os.stat(path).st_mode & 0o7777)
+    except FileNotFoundError:
+        pass
+    except OSError:
+        os.close(fd)
+        os.remove(tmp_path)
+        raise
+    return fd, str(tmp_path)
+
+
+def atomic_write_file(path, write, private=True):
+    """
+    Like atomic_write_bytes, with write(binary_file) producing the contents.
+    Cache files are private to the user (mkstemp); outputs the user asked for
+    (private=False) get the usual umask-based permissions.
+    """
+    path = Path(path)
+    if private:
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    else:
+        fd, tmp_path = _create_shared(path)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class _DiskCache:
+    """A folder of cache files (one per key) kept under a size budget, least recently used out first"""
+    suffix = ""
+    folder = ""
+    budget_variable = ""
+    default_mb = 0
+    
+    def __init__(self, root=None, max_mb=None):
+        self.root = Path(root) if root else user_cache_dir() / self.folder
+        if max_mb is None:
+            max_mb = int(os.environ.get(self.budget_variable, self.default_mb))
+        self.max_mb = max_mb
+    
+    def _path(self, key):
+        return self.root / f"{key}{self.suffix}"
+    
+    def _touch(self, path):
+        try:
+            os.utime(path)  # mark as recently used for eviction
+        except OSError:
+            pass
+    
+    def _entries(self):
+        if not self.root.exists():
+            return []
+        entries = []
+        for path in self.root.glob(f"*{self.suffix}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+    
+    def size_mb(self):
+        return sum(size for _, size, _ in self._entries()) / (1024 * 1024)
+    
+    def count(self):
+        return len(self._entries())
+    
+    def evict(self):
+        """Drop least recently used entries until the cache fits its size budget"""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        budget = self.max_mb * 1024 * 1024
+        for _, size, path in entries:
+            if total <= budget:
+                break
+            try:
+                path.unlink()
+                total -= size
+            except OSError:
+                pass  # e.g. still memory-mapped on Windows
+    
+    def clear(self):
+        """Delete every cached entry, returning the MB freed"""
+        freed = 0
+        for _, size, path in self._entries():
+            try:
+                path.unlink()
+                freed += size
+            except OSError:
+                pass
+        return freed / (1024 * 1024)
+
+
+class ResultCache(_DiskCache):
+    """On-disk, size-bounded cache of raw transcription results"""
+    suffix = ".json"
+    folder = "results"
+    budget_variable = "VOXTEXT_RESULT_CACHE_MB"
+    default_mb = DEFAULT_RESULT_CACHE_MB
+    
+    def key(self, file_hash, model_name, options):
+        """Cache key for one media file transcribed with one model and option set"""
+        material = json.dumps(
+            {'version': CACHE_VERSION, 'file': file_hash, 'model': model_name, 'options': options},
+            sort_keys=True
+        )
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+    
+    def get(self, key):
+        """Return the cached result dict, or None on a miss"""
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                result = json.load(f)
+        except (OSError, ValueError):
+            return None
+        self._touch(path)
+        return result
+    
+    def put(self, key, result):
+        self.root.mkdir(parents=True, exist_ok=True)
+        data = json.dumps(result, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        atomic_write_bytes(self._path(key), data)
+        self.evict()
+
+
+class PcmCache(_DiskCache):
+    """On-disk, size-bounded cache of decoded audio (16 kHz mono float32 .npy files)"""
+    suffix = ".npy"
+    folder = "pcm"
+    budget_variable = "VOXTEXT_PCM_CACHE_MB"
+    default_mb = DEFAULT_PCM_CACHE_MB
+    
+    def key(self, file_hash):
+        return file_hash
+    
+    def path(self, key):
+        """The cached .npy file for a key, or None on a miss (e.g. for worker processes to map)"""
+        path = self._path(key)
+        return path if path.exists() else None
+    
+    def get(self, key):
+        """
+        The decoded samples as a copy-on-write memory map (pages are read as
+        they are used and shared with other processes mapping the file), or None.
+        """
+        import numpy as np
+        
+        path = self._path(key)
+        try:
+            audio = np.load(path, mmap_mode='c')
+        except (OSError, ValueError):
+            return None
+        self._touch(path)
+        return audio
+    
+    def put(self, key, audio):
+        import numpy as np
+        
+        self.root.mkdir(parents=True, exist_ok=True)
+        atomic_write_file(self._path(key), lambda f: np.save(f, np.asarray(audio, dtype=np.float32)))
+        self.evict()
@@ -0,0 +1,172 @@
+"""
+Voxtext caption layout
+
+Re-flows Whisper segments into subtitle cues that meet a VTT preset's
+caption_limits: characters per line, lines per cue, characters per second
+and minimum/maximum cue duration. Segments are split into words (using the
+word timestamps when the transcript has them, otherwise spreading the
+segment's time over its words by length) and the words are packed greedily
+into cues, so long segments are split and short neighbouring ones merged.
+A cue also closes at a pause or, once reasonably full, at the end of a
+sentence.
+
+Cues too short to read (under min_duration or over max_cps) are extended
+into the silence before the next cue, never overlapping it. The layout
+streams: each word is handled once and only the current and the previous
+cue are held, so a three-hour transcript lays out in linear time.
+"""
+
+import math
+
+from voxtext_writers import Cue
+
+PAUSE_SECONDS = 1.0  # a silence this long always starts a new cue
+SENTENCE_ENDS = ('.', '?', '!', '…', '。', '？', '！')
+SENTENCE_FILL = 0.5  # close a cue at a sentence end once it is this full
+
+
+def segment_words(segment):
+    """
+    (start, end, text, timed) for each word of a segment; timed is False when
+    the times were spread over the words by their length
+    """
+    words = [word for word in segment.get('words') or [] if word['word'].strip()]
+    if words:
+        return [(word['start'], max(word['end'], word['start']), word['word'].strip(), True) for word in words]
+    texts = segment['text'].split()
+    if not texts:
+        return []
+    start, end = segment['start'], max(segment['end'], segment['start'])
+    per_char = (end - start) / sum(len(text) + 1 for text in texts)
+    units = []
+    for text in texts:
+        word_end = start + (len(text) + 1) * per_char
+        units.append((start, min(word_end, end), text, False))
+        start = word_end
+    return units
+
+
+def _greedy_lines(texts, width):
+    lines = []
+    for text in texts:
+        if lines and len(lines[-1]) + 1 + len(text) <= width:
+            lines[-1] += " " + text
+        else:
+            lines.append(text)
+    return lines
+
+
+def wrap_text(texts, max_chars, max_lines):
+    """
+    Words wrapped into as few lines as max_chars allows, with the lines
+    balanced (the narrowest width that still needs no extra line)
+    """
+    total = sum(len(text) for text in texts) + len(texts) - 1
+    if not max_chars or total <= max_chars:
+        return " ".join(texts)
+    lines = _greedy_lines(texts, max_chars)
+    if len(lines) <= (max_lines or 3):
+        for width in range(math.ceil(total / len(lines)), max_chars):
+            balanced = _greedy_lines(texts, width)
+            if len(balanced) <= len(lines):
+                return "\n".join(balanced)
+    return "\n".join(lines)
+
+
+class CaptionLayout:
+    """
+    Streaming cue layout: add(segment) and finish() return the cues that are
+    final so far, in order. With karaoke, cues made only of timed words keep
+    the word times for inline VTT tags.
+    """
+    
+    def __init__(self, limits, karaoke=False):
+        self.max_chars = limits.get('max_chars_per_line') or 0
+        self.max_lines = limits.get('max_lines') or 0
+        self.max_cps = limits.get('max_cps') or 0
+        self.min_duration = limits.get('min_duration') or 0
+        self.max_duration = limits.get('max_duration') or 0
+        self.karaoke = karaoke
+        self.words = []  # (start, end, text, timed) of the open cue
+        self.chars = 0
+        self.lines = 0  # greedy line count of the open cue
+        self.line_length = 0
+        self.pending = None  # closed cue waiting for the next cue's start
+    
+    def add(self, segment):
+        cues = []
+        for word in segment_words(segment):
+            cues.extend(self._add_word(word))
+        return cues
+    
+    def finish(self):
+        cues = self._close()
+        if self.pending:
+            cues.append(self._finalize(self.pending, None))
+            self.pending = None
+        return cues
+    
+    def _fits(self, text):
+        if not self.max_chars or self.line_length + 1 + len(text) <= self.max_chars:
+            return True
+        return not self.max_lines or self.lines < self.max_lines
+    
+    def _add_word(self, word):
+        start, end, text, timed = word
+        cues = []
+        if self.words:
+            too_long = self.max_duration and end - self.words[0][0] > self.max_duration
+            if start - self.words[-1][1] >= PAUSE_SECONDS or too_long or not self._fits(text):
+                cues.extend(self._close())
+        
+        if self.line_length and (not self.max_chars or self.line_length + 1 + len(text) <= self.max_chars):
+            self.line_length += 1 + len(text)
+        else:
+            self.lines += 1
+            self.line_length = len(text)
+        self.chars += len(text) + (1 if self.words else 0)
+        self.words.append(word)
+        
+        if text.endswith(SENTENCE_ENDS) and self._fill() >= SENTENCE_FILL:
+            cues.extend(self._close())
+        return cues
+    
+    def _fill(self):
+        """How full the open cue is, 0-1"""
+        if self.max_chars and self.max_lines:
+            return self.chars / (self.max_chars * self.max_lines)
+        if self.max_duration:
+            return (self.words[-1][1] - self.words[0][0]) / self.max_duration
+        return 1.0
+    
+    def _close(self):
+        """Close the open cue; returns the previous cue, now that its successor's start is known"""
+        if not self.words:
+            return []
+        texts = [word[2] for word in self.words]
+        closed = {
+            'start': self.words[0][0],
+            'end': self.words[-1][1],
+            'text': wrap_text(texts, self.max_chars, self.max_lines),
+            'words': [(word[0], word[2]) for word in self.words]
+            if self.karaoke and all(word[3] for word in self.words) else None,
+        }
+        self.words = []
+        self.chars = self.lines = self.line_length = 0
+        
+        cues = [self._finalize(self.pending, closed['start'])] if self.pending else []
+        self.pending = closed
+        return cues
+    
+    def _finalize(self, cue, next_start):
+        """Extend a cue to be readable (min_duration, max_cps) without reaching the next one"""
+        start, end = cue['start'], cue['end']
+        wanted = max(self.min_duration, len(cue['text']) / self.max_cps if self.max_cps else 0)
+        if self.max_duration:
+            wanted = min(wanted, self.max_duration)
+        end = max(end, start + wanted)
+        if self.max_duration:
+            end = min(end, start + self.max_duration)
+        if next_start is not None:
+            end = min(end, max(next_start, start))
+        return Cue(start, end, cue['text'], cue['words'])
@@ -0,0 +1,174 @@
+"""
+Voxtext long-file chunking
+
+Splits multi-hour recordings at quiet points into chunks that are transcribed
+independently (in parallel worker processes when asked), then stitches the
+chunk results back into one Whisper-style result with absolute timestamps.
+
+Each chunk is decoded with a little overlap on both sides for context. A
+segment belongs to the chunk whose "keep" region (between the two silence
+cuts) contains the segment's midpoint, so text near a seam is neither lost
+nor duplicated.
+"""
+
+import os
+import re
+import tempfile
+
+from voxtext_audio import SAMPLE_RATE, FRAME_SECONDS, frame_energies, smooth
+
+DEFAULT_CHUNK_MINUTES = 10
+OVERLAP_SECONDS = 2.0
+SEARCH_SECONDS = 30.0  # how far around each target boundary to look for silence
+QUIET_WINDOW_SECONDS = 0.5
+
+
+class Chunk:
+    """One slice of the recording, in samples"""
+    
+    def __init__(self, index, start, end, keep_start, keep_end):
+        self.index = index
+        self.start = start  # decoded slice, including overlap
+        self.end = end
+        self.keep_start = keep_start  # segments owned by this chunk (silence cuts)
+        self.keep_end = keep_end
+    
+    @property
+    def offset_seconds(self):
+        return self.start / SAMPLE_RATE
+
+
+def plan_chunks(audio, chunk_seconds=DEFAULT_CHUNK_MINUTES * 60, overlap_seconds=OVERLAP_SECONDS):
+    """Choose silence cut points roughly every chunk_seconds and build chunks around them"""
+    import numpy as np
+    
+    total = len(audio)
+    chunk_samples = int(chunk_seconds * SAMPLE_RATE)
+    if total <= chunk_samples * 1.5:
+        return [Chunk(0, 0, total, 0, total)]
+    
+    frame = int(SAMPLE_RATE * FRAME_SECONDS)
+    levels = smooth(frame_energies(audio), int(QUIET_WINDOW_SECONDS / FRAME_SECONDS))
+    search = int(SEARCH_SECONDS / FRAME_SECONDS)
+    
+    cuts = [0]
+    while total - cuts[-1] > chunk_samples * 1.5:
+        target = (cuts[-1] + chunk_samples) // frame
+        lo = max(target - search, cuts[-1] // frame + 1)
+        hi = min(target + search, len(levels))
+        quietest = lo + int(np.argmin(levels[lo:hi])) if hi > lo else target
+        cuts.append(quietest * frame)
+    cuts.append(total)
+    
+    overlap = int(overlap_seconds * SAMPLE_RATE)
+    return [
+        Chunk(i, max(0, keep_start - overlap), min(total, keep_end + overlap), keep_start, keep_end)
+        for i, (keep_start, keep_end) in enumerate(zip(cuts[:-1], cuts[1:]))
+    ]
+
+
+def _shift_segment(segment, offset):
+    """Copy a segment with its times moved onto the absolute timeline"""
+    shifted = dict(segment)
+    shifted['start'] = segment['start'] + offset
+    shifted['end'] = segment['end'] + offset
+    if 'seek' in segment:
+        shifted['seek'] = segment['seek'] + int(round(offset * 100))
+    if segment.get('words'):
+        shifted['words'] = [
+            dict(word, start=word['start'] + offset, end=word['end'] + offset)
+            for word in segment['words']
+        ]
+    return shifted
+
+
+def _words(text):
+    """Text compared without case or punctuation (symbols only, like "♪", compare as they are)"""
+    return re.findall(r"[\w']+", text.lower()) or [text.strip()]
+
+
+def stitch_results(chunks, results):
+    """Merge per-chunk results (in chunk order) into one result with absolute timestamps"""
+    segments = []
+    for chunk, result in zip(chunks, results):
+        keep_start = chunk.keep_start / SAMPLE_RATE
+        keep_end = chunk.keep_end / SAMPLE_RATE
+        for segment in result.get('segments', []):
+            shifted = _shift_segment(segment, chunk.offset_seconds)
+            midpoint = (shifted['start'] + shifted['end']) / 2
+            if not keep_start <= midpoint < keep_end:
+                continue
+            
+            if segments:
+                previous = segments[-1]
+                # Same words decoded on both sides of a seam (often punctuated differently)
+                if (_words(shifted['text']) == _words(previous['text'])
+                        and shifted['start'] < previous['end'] + OVERLAP_SECONDS):
+                    continue
+                shifted['start'] = max(shifted['start'], previous['end'])
+                shifted['end'] = max(shifted['end'], shifted['start'])
+            segments.append(shifted)
+    
+    for i, segment in enumerate(segments):
+        segment['id'] = i
+    
+    language = next((r.get('language') for r in results if r.get('language')), None)
+    return {
+        'text': ''.join(segment['text'] for segment in segments),
+        'segments': segments,
+        'language': language,
+    }
+
+
+def transcribe_long(transcribe_piece, audio, decode_options, chunk_seconds=DEFAULT_CHUNK_MINUTES * 60,
+                    workers=1, model_name=None, progress=None, is_cancelled=None, quantize=False,
+                    backend='whisper', pcm_path=None):
+    """
+    Transcribe a long recording chunk by chunk and stitch the results.
+    With workers > 1 chunks run in a process pool (model_name is loaded in
+    each worker by the named backend, int8 when quantize); otherwise they run
+    here through transcribe_piece(samples) on the already loaded model.
+    pcm_path, a .npy file holding audio, spares saving a copy for the workers.
+    progress(done_chunks, total_chunks) is called as chunks complete.
+    """
+    import numpy as np
+    from voxtext_engine import TranscriptionCancelled
+    
+    chunks = plan_chunks(audio, chunk_seconds)
+    progress = progress or (lambda done, total: None)
+    is_cancelled = is_cancelled or (lambda: False)
+    
+    if workers <= 1 or len(chunks) == 1:
+        results = []
+        for chunk in chunks:
+            if is_cancelled():
+                raise TranscriptionCancelled()
+            piece = np.ascontiguousarray(audio[chunk.start:chunk.end])
+            results.append(transcribe_piece(piece))
+            progress(len(results), len(chunks))
+        return stitch_results(chunks, results)
+    
+    from voxtext_parallel import transcribe_chunks
+    
+    # Workers read their slices from one memory-mapped copy instead of pickled arrays
+    temp_path = None
+    if pcm_path is None:
+        fd, temp_path = tempfile.mkstemp(prefix="voxtext_", suffix=".npy")
+        os.close(fd)
+        pcm_path = temp_path
+    try:
+        if temp_path:
+            np.save(temp_path, np.asarray(audio, dtype=np.float32))
+        spans = [(chunk.start, chunk.end) for chunk in chunks]
+        results = transcribe_chunks(
+            model_name, str(pcm_path), spans, decode_options,
+            workers=workers, progress=progress, is_cancelled=is_cancelled, quantize=quantize,
+            backend=backend
+        )
+    finally:
+        if temp_path:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+    return stitch_results(chunks, results)
@@ -0,0 +1,526 @@
+"""
+Voxtext command-line interface
+
+Headless transcription using the same engine as the desktop app, for render
+boxes without a display and scripted/cron batch runs. Does not import PyQt6.
+The packaged desktop app runs it as "Voxtext cli [options] inputs".
+
+Examples:
+  python voxtext_cli.py lecture.mp4
+  python voxtext_cli.py -m small -f txt,srt,vtt -o transcripts/ recordings/
+  python voxtext_cli.py -f vtt --lms-preset "Lower Third" clip.mov
+  python voxtext_cli.py -f srt,vtt --max-line-chars 32 --max-cps 15 lecture.mp4
+  python voxtext_cli.py -m base -j 8 --threads-per-worker 4 archive/
+  python voxtext_cli.py --from-json -f srt,vtt --lms-preset "High Contrast" transcripts/
+  python voxtext_cli.py --segments 1:20:00 1:25:00 archive/talk_transcript.vxt
+  python voxtext_cli.py --search '"learning objectives" assess*'
+  python voxtext_cli.py --index-transcripts archive/
+  python voxtext_cli.py --prune-index
+  python voxtext_cli.py --export-models models.zip
+  python voxtext_cli.py --model-mirror /mnt/share/whisper --offline -m small talks/
+  python voxtext_cli.py --backend faster-whisper --int8 -m medium lecture.mp4
+  python voxtext_cli.py --benchmark
+  python voxtext_cli.py --word-timestamps --word-cues karaoke -f vtt,vxt song.mp3
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+from voxtext_parallel import ParallelScheduler
+from voxtext_models import configure_store
+from voxtext_backends import BACKENDS, DEFAULT_BACKEND
+from voxtext_engine import (
+    MODEL_NAMES, OUTPUT_FORMATS, VTT_PRESETS, DEFAULT_OPTIONS, TranscriptionEngine,
+    TranscriptionCancelled, ensure_local_ffmpeg_on_path, collect_media_files, describe_error,
+    export_transcript, transcript_segments
+)
+from voxtext_writers import WORD_CUE_MODES
+
+
+def parse_formats(value):
+    """Parse a comma-separated list of output formats"""
+    formats = [f.strip().lower() for f in value.split(',') if f.strip()]
+    unknown = [f for f in formats if f not in OUTPUT_FORMATS]
+    if unknown or not formats:
+        raise argparse.ArgumentTypeError(
+            f"invalid format(s): {', '.join(unknown) or value!r} (choose from {', '.join(OUTPUT_FORMATS)})"
+        )
+    return formats
+
+
+def parse_time(value):
+    """argparse type for seconds, MM:SS or HH:MM:SS(.fff)"""
+    try:
+        seconds = 0.0
+        for part in value.split(':'):
+            seconds = seconds * 60 + float(part)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid time: {value!r} (use seconds or [HH:]MM:SS)") from None
+    return seconds
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="voxtext",
+        description="Voxtext - local audio/video transcription powered by OpenAI Whisper"
+    )
+    parser.add_argument("inputs", nargs="*",
+                        help="media files or folders (folders are searched recursively)")
+    parser.add_argument("-m", "--model", choices=MODEL_NAMES, default="medium",
+                        help="Whisper model (default: medium)")
+    parser.add_argument("-f", "--formats", type=parse_formats, default=["txt"],
+                        help=f"comma-separated output formats: {','.join(OUTPUT_FORMATS)} (default: txt)")
+    parser.add_argument("-o", "--output-dir",
+                        help="write outputs here instead of next to each source file")
+    parser.add_argument("-q", "--quiet", action="store_true",
+                        help="only print errors and the final summary")
+    parser.add_argument("--live", action="store_true",
+                        help="print transcript text as it is decoded")
+    parser.add_argument("--write-threads", type=int, default=DEFAULT_OPTIONS['write_threads'],
+                        help="write each file's output formats concurrently with this many threads "
+                             "(helps on network shares; default: %(default)s)")
+    parser.add_argument("--from-json", action="store_true",
+                        help="inputs are saved JSON or .vxt transcripts: write the requested formats "
+                             "from them without transcribing")
+    parser.add_argument("--segments", nargs=2, type=parse_time, metavar=("FROM", "TO"),
+                        help="print the segments between two times (seconds or [HH:]MM:SS) of saved "
+                             "JSON or .vxt transcripts, then exit")
+    
+    search = parser.add_argument_group("transcript search")
+    search.add_argument("--search", metavar="QUERY",
+                        help="search every indexed transcript for words, \"quoted phrases\" or prefix* "
+                             "and print the matching segments with their times, then exit")
+    search.add_argument("--search-limit", type=int, default=20, metavar="N",
+                        help="show at most N matches (default: %(default)s)")
+    search.add_argument("--index-transcripts", action="store_true",
+                        help="inputs are saved JSON or .vxt transcripts: add them to the search index")
+    search.add_argument("--no-index", action="store_true",
+                        help="do not add new transcripts to the search index")
+    search.add_argument("--prune-index", action="store_true",
+                        help="forget indexed transcripts whose media and output files were all deleted, then exit")
+    
+    parallel = parser.add_argument_group("parallel batch processing")
+    parallel.add_argument("-j", "--workers", type=int, default=1,
+                          help="worker processes per model, each holding its own copy (default: 1)")
+    parallel.add_argument("--threads-per-worker", type=int,
+                          help="torch threads per worker (default: CPU cores / workers)")
+    
+    parser.add_argument("--metrics", action="store_true",
+                        help="write per-stage timings and resource use of each file to NAME_metrics.json "
+                             "next to its outputs and print a summary")
+    parser.add_argument("--prometheus", metavar="FILE",
+                        help="keep running job and stage totals in FILE in Prometheus text format "
+                             "(for node_exporter's textfile collector)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="always transcribe, ignoring and not updating the transcript cache")
+    parser.add_argument("--no-audio-cache", action="store_true",
+                        help="decode media with ffmpeg every time instead of keeping the decoded audio")
+    parser.add_argument("--backend", choices=list(BACKENDS), default=DEFAULT_BACKEND,
+                        help="inference engine: whisper (openai-whisper, PyTorch) or faster-whisper "
+                             "(CTranslate2, much faster on CPU; pip install faster-whisper) "
+                             f"(default: {DEFAULT_BACKEND})")
+    parser.add_argument("--int8", action="store_true",
+                        help="fast CPU mode: int8-quantized model (quantized once, kept in the model store)")
+    parser.add_argument("--compare-int8", metavar="CLIP",
+                        help="transcribe CLIP with the fp32 and int8 model, report speed and accuracy, then exit")
+    parser.add_argument("--benchmark", nargs="?", const="", metavar="CLIP",
+                        help="measure every installed model and backend on this machine on CLIP (a speech "
+                             "recording), save the results for the speed guide and ETAs, then exit; without "
+                             "CLIP, synthesized audio measures load time and memory only")
+    parser.add_argument("--vad", action="store_true",
+                        help="detect speech first and only transcribe it (skips long silences)")
+    parser.add_argument("--word-timestamps", action="store_true",
+                        help="align every word while decoding; word times are kept in json/vxt outputs")
+    parser.add_argument("--word-cues", choices=list(WORD_CUE_MODES), default=DEFAULT_OPTIONS['word_cues'],
+                        help="subtitle cues from word timestamps: one per segment, karaoke (VTT word "
+                             "highlighting tags) or one per word (default: %(default)s)")
+    
+    long_file = parser.add_argument_group("long recordings")
+    long_file.add_argument("--chunk-workers", type=int, default=0,
+                           help="split long recordings at silences and transcribe chunks in this "
+                                "many processes (default: 0 = off)")
+    long_file.add_argument("--chunk-minutes", type=float, default=DEFAULT_OPTIONS['chunk_minutes'],
+                           help="target chunk length in minutes (default: %(default)s)")
+    long_file.add_argument("--long-file-minutes", type=float, default=DEFAULT_OPTIONS['long_file_minutes'],
+                           help="only chunk recordings longer than this (default: %(default)s)")
+    
+    store = parser.add_argument_group("model store")
+    store.add_argument("--model-dir",
+                       help="load models from (and download them into) this folder")
+    store.add_argument("--model-mirror",
+                       help="copy missing models from this folder or mounted share instead of downloading")
+    store.add_argument("--offline", action="store_true",
+                       help="never download models; fail if one is not in the store or mirror")
+    store.add_argument("--mmap-weights", action="store_true",
+                       help="load models from memory-mapped float32 copies (converted once into the "
+                            "store): lower peak RAM, shared between worker processes")
+    store.add_argument("--import-models", metavar="BUNDLE",
+                       help="add models from a .zip bundle or a folder of .pt files to the store, then exit")
+    store.add_argument("--export-models", metavar="BUNDLE",
+                       help="write every model in the store to a .zip bundle, then exit")
+    
+    lms = parser.add_argument_group(
+        "LMS VTT styling",
+        "Cue settings and the STYLE block apply to VTT files; caption limits re-flow SRT and VTT cues alike."
+    )
+    lms.add_argument("--lms-preset", choices=list(VTT_PRESETS.keys()),
+                     help="enable LMS styling using a preset")
+    lms.add_argument("--cue-settings",
+                     help="enable LMS styling with these cue settings (e.g. 'line:80%%')")
+    lms.add_argument("--css-file",
+                     help="enable LMS styling with the STYLE block read from this file")
+    lms.add_argument("--max-line-chars", type=int, metavar="N",
+                     help="enable LMS styling and re-flow SRT/VTT cues to at most N characters per line")
+    lms.add_argument("--max-lines", type=int, metavar="N",
+                     help="enable LMS styling and re-flow cues to at most N lines")
+    lms.add_argument("--max-cps", type=float, metavar="N",
+                     help="enable LMS styling and lengthen cues read faster than N characters per second")
+    lms.add_argument("--min-cue-seconds", type=float, metavar="S",
+                     help="enable LMS styling and keep every cue on screen at least S seconds")
+    lms.add_argument("--max-cue-seconds", type=float, metavar="S",
+                     help="enable LMS styling and split cues longer than S seconds")
+    lms.add_argument("--no-reflow", action="store_true",
+                     help="keep one cue per segment even when the preset has caption limits")
+    return parser
+
+
+def lms_settings_from_args(args):
+    """Build the same lms_settings dict the GUI passes to the engine"""
+    limit_args = {
+        'max_chars_per_line': args.max_line_chars,
+        'max_lines': args.max_lines,
+        'max_cps': args.max_cps,
+        'min_duration': args.min_cue_seconds,
+        'max_duration': args.max_cue_seconds,
+    }
+    limit_args = {key: value for key, value in limit_args.items() if value is not None}
+    if not (args.lms_preset or args.cue_settings is not None or args.css_file or limit_args):
+        return {'enabled': False, 'cue_settings': '', 'css': '', 'caption_limits': None}
+    
+    preset = VTT_PRESETS.get(args.lms_preset or 'LMS Standard')
+    settings = {'enabled': True, 'cue_settings': preset['cue_settings'], 'css': preset['css']}
+    if args.cue_settings is not None:
+        settings['cue_settings'] = args.cue_settings
+    if args.css_file:
+        settings['css'] = Path(args.css_file).read_text(encoding='utf-8')
+    limits = dict(preset['caption_limits'] or {}, **limit_args)
+    settings['caption_limits'] = None if args.no_reflow else limits or None
+    return settings
+
+
+def options_from_args(args):
+    """Build the engine options dict from command-line flags"""
+    return {
+        'chunk_workers': args.chunk_workers,
+        'chunk_minutes': args.chunk_minutes,
+        'long_file_minutes': args.long_file_minutes,
+        'vad': args.vad,
+        'result_cache': not args.no_cache,
+        'pcm_cache': not args.no_audio_cache,
+        'quantize': args.int8,
+        'backend': args.backend,
+        'write_threads': args.write_threads,
+        'word_timestamps': args.word_timestamps,
+        'word_cues': args.word_cues,
+        'search_index': not args.no_index,
+    }
+
+
+def collect_transcript_files(paths):
+    """
+    Expand files and folders into a sorted list of saved transcripts. In
+    folders, a .vxt transcript is preferred over the JSON of the same media.
+    """
+    files = []
+    for path in paths:
+        path = Path(path)
+        if path.is_dir():
+            found = {p.with_suffix(''): p for p in path.rglob("*_transcript.json")}
+            found.update((p.with_suffix(''), p) for p in path.rglob("*_transcript.vxt"))
+            files.extend(str(found[stem]) for stem in sorted(found))
+        elif path.is_file():
+            files.append(str(path))
+    return files
+
+
+def export_main(args, output_dir):
+    """Re-export outputs from saved JSON or .vxt transcripts (--from-json)"""
+    files = collect_transcript_files(args.inputs)
+    if not files:
+        print("No saved transcripts found.", file=sys.stderr)
+        return 1
+    
+    lms_settings = lms_settings_from_args(args)
+    created_files = []
+    failures = 0
+    for transcript_path in files:
+        try:
+            created = export_transcript(transcript_path, args.formats, output_dir, lms_settings,
+                                        threads=args.write_threads, word_cues=args.word_cues)
+        except Exception as e:
+            failures += 1
+            print(f"FAILED {transcript_path}: {e}", file=sys.stderr, flush=True)
+            continue
+        created_files.extend(created)
+        if not args.quiet:
+            for path in created:
+                print(f"Created {path}", flush=True)
+    
+    print(f"Exported {len(files) - failures} of {len(files)} transcripts, created {len(created_files)} outputs.")
+    return 1 if failures else 0
+
+
+def segments_main(args):
+    """Print the segments of saved transcripts in a time range (--segments)"""
+    from voxtext_writers import format_timestamp
+    
+    files = collect_transcript_files(args.inputs)
+    if not files:
+        print("No saved transcripts found.", file=sys.stderr)
+        return 1
+    
+    start, end = args.segments
+    failures = 0
+    for transcript_path in files:
+        try:
+            segments = transcript_segments(transcript_path, start, end)
+        except Exception as e:
+            failures += 1
+            print(f"FAILED {transcript_path}: {e}", file=sys.stderr, flush=True)
+            continue
+        if len(files) > 1:
+            print(f"== {transcript_path}")
+        for segment in segments:
+            print(
+                f"[{format_timestamp(segment['start'], use_comma=False)} --> "
+                f"{format_timestamp(segment['end'], use_comma=False)}] {segment['text'].strip()}"
+            )
+    return 1 if failures else 0
+
+
+def search_main(args):
+    """Print the best matches in the search index (--search)"""
+    from voxtext_search import SearchIndex
+    from voxtext_writers import format_timestamp
+    
+    with SearchIndex() as index:
+        hits = index.search(args.search, limit=args.search_limit)
+    if not hits:
+        print("No matches.", file=sys.stderr)
+        return 1
+    for hit in hits:
+        source = hit['media'] or hit['transcript']
+        print(f"{Path(source).name} [{format_timestamp(hit['start'], use_comma=False)}] {hit['snippet']}")
+        if not args.quiet:
+            print(f"    {source}")
+    return 0
+
+
+def prune_main(args):
+    """Drop search index entries whose files are all gone (--prune-index)"""
+    from voxtext_search import SearchIndex
+    
+    with SearchIndex() as index:
+        removed = index.prune()
+        transcripts, segments = index.counts()
+    print(f"Removed {removed} stale entries; {transcripts} transcripts ({segments} segments) remain indexed.")
+    return 0
+
+
+def index_main(args):
+    """Add saved JSON or .vxt transcripts to the search index (--index-transcripts)"""
+    from voxtext_search import SearchIndex
+    
+    files = collect_transcript_files(args.inputs)
+    if not files:
+        print("No saved transcripts found.", file=sys.stderr)
+        return 1
+    
+    failures = 0
+    with SearchIndex() as index:
+        for transcript_path in files:
+            try:
+                count = index.add_saved(transcript_path)
+            except Exception as e:
+                failures += 1
+                print(f"FAILED {transcript_path}: {e}", file=sys.stderr, flush=True)
+                continue
+            if not args.quiet:
+                print(f"Indexed {count} segments of {transcript_path}", flush=True)
+    
+    print(f"Indexed {len(files) - failures} of {len(files)} transcripts.")
+    return 1 if failures else 0
+
+
+def models_main(args):
+    """Import or export model bundles (--import-models / --export-models)"""
+    from voxtext_models import import_models, export_models, models_dir
+    
+    def on_progress(message):
+        if not args.quiet:
+            print(message, flush=True)
+    
+    try:
+        if args.import_models:
+            names = import_models(args.import_models, progress=on_progress)
+            print(f"Imported {', '.join(names) or 'no models'} into {models_dir()}.")
+        if args.export_models:
+            names = export_models(args.export_models, progress=on_progress)
+            print(f"Exported {', '.join(names) or 'no models'} to {args.export_models}.")
+    except Exception as e:
+        print(f"Error: {describe_error(e)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def compare_main(args):
+    """Report int8 vs fp32 speed and accuracy on a reference clip (--compare-int8)"""
+    from voxtext_quantize import compare_quantized, describe_comparison
+    
+    ensure_local_ffmpeg_on_path()
+    try:
+        report = compare_quantized(
+            args.model, args.compare_int8, progress=None if args.quiet else print
+        )
+    except Exception as e:
+        print(f"Error: {describe_error(e)}", file=sys.stderr)
+        return 1
+    print(describe_comparison(report))
+    return 0
+
+
+def benchmark_main(args):
+    """Benchmark installed models and backends (--benchmark)"""
+    from voxtext_bench import benchmark_targets, run_benchmarks, describe_run, speed_guide_lines, is_synthetic
+    
+    targets = benchmark_targets()
+    if not targets:
+        print("No installed models to benchmark; download one first.", file=sys.stderr)
+        return 1
+    if args.benchmark:
+        ensure_local_ffmpeg_on_path()
+    try:
+        runs = run_benchmarks(
+            targets, args.benchmark or None, quantize=args.int8, progress=None if args.quiet else print
+        )
+    except KeyboardInterrupt:
+        print("Cancelled.", file=sys.stderr)
+        return 130
+    except Exception as e:
+        print(f"Error: {describe_error(e)}", file=sys.stderr)
+        return 1
+    for run in runs:
+        print(describe_run(run))
+    if any(is_synthetic(run) for run in runs):
+        print("\nSpeeds on synthetic audio are not representative and are not used for ETAs; "
+              "run --benchmark CLIP with a speech recording for those.")
+    guide = speed_guide_lines()
+    if guide:
+        print("\nExpected time for 10 min of audio:")
+        print("\n".join(guide))
+    return 0
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    
+    configure_store(args.model_dir, args.model_mirror, args.offline or None, args.mmap_weights or None)
+    if args.import_models or args.export_models:
+        return models_main(args)
+    if args.compare_int8:
+        return compare_main(args)
+    if args.benchmark is not None:
+        return benchmark_main(args)
+    if args.search is not None:
+        return search_main(args)
+    if args.prune_index:
+        return prune_main(args)
+    if not args.inputs:
+        parser.error("no media files or folders given")
+    if args.segments:
+        return segments_main(args)
+    if args.index_transcripts:
+        return index_main(args)
+    
+    output_dir = None
+    if args.output_dir:
+        output_dir = Path(args.output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+    
+    if args.from_json:
+        return export_main(args, output_dir)
+    
+    backend = BACKENDS[args.backend]
+    if not backend.is_available():
+        parser.error(f"the {backend.name} backend is not installed (pip install {backend.module.replace('_', '-')})")
+    
+    ensure_local_ffmpeg_on_path()
+    
+    files = collect_media_files(args.inputs)
+    if not files:
+        print("No audio or video files found.", file=sys.stderr)
+        return 1
+    
+    def on_progress(message, percentage):
+        if not args.quiet:
+            print(f"[{percentage:3d}%] {message}", flush=True)
+    
+    def on_text(text):
+        print(text.strip(), flush=True)
+    
+    failures = []
+    
+    def on_failed(index, message):
+        failures.append(files[index])
+        print(f"FAILED {files[index]}:\n{message}", file=sys.stderr, flush=True)
+    
+    if args.workers > 1 and len(files) > 1:
+        engine = ParallelScheduler(
+            args.model,
+            args.formats,
+            output_dir,
+            lms_settings_from_args(args),
+            workers=args.workers,
+            threads_per_worker=args.threads_per_worker,
+            progress=on_progress,
+            options=options_from_args(args)
+        )
+    else:
+        engine = TranscriptionEngine(
+            args.model,
+            args.formats,
+            output_dir,
+            lms_settings_from_args(args),
+            progress=on_progress,
+            options=options_from_args(args),
+            partial_text=on_text if args.live else None
+        )
+    
+    on_metrics = None
+    if args.metrics or args.prometheus:
+        from voxtext_metrics import MetricsRecorder, describe_metrics
+        
+        recorder = MetricsRecorder(json_files=args.metrics, prometheus_path=args.prometheus)
+        
+        def on_metrics(index, metrics):
+            recorder(index, metrics)
+            if args.metrics and not args.quiet:
+                print(describe_metrics(metrics), flush=True)
+    
+    try:
+        created_files = engine.transcribe_files(files, on_failed=on_failed, on_metrics=on_metrics)
+    except (KeyboardInterrupt, TranscriptionCancelled):
+        print("Cancelled.", file=sys.stderr)
+        return 130
+    except Exception as e:
+        print(f"Error: {describe_error(e)}", file=sys.stderr)
+        return 1
+    
+    print(f"Transcribed {len(files) - len(failures)} of {len(files)} files, created {len(created_files)} outputs.")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
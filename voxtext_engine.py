@@ -0,0 +1,940 @@
+"""
+Voxtext transcription engine
+
+Qt-free core shared by the desktop app (voxtext_pyqt.py) and the
+command-line interface (voxtext_cli.py). Everything here reports through
+plain callbacks so it can run headless on machines without a display.
+"""
+
+import sys
+import os
+import threading
+import time
+from pathlib import Path
+import json
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from voxtext_writers import WRITERS, render_outputs, save_outputs, write_outputs
+
+
+# File extensions
+AUDIO_EXTENSIONS = {'.mp3', '.wav', '.m4a', '.flac', '.ogg', '.aac'}
+VIDEO_EXTENSIONS = {'.mp4', '.mov', '.avi', '.mkv', '.webm'}
+MEDIA_EXTENSIONS = AUDIO_EXTENSIONS | VIDEO_EXTENSIONS
+
+MODEL_NAMES = ['tiny', 'base', 'small', 'medium', 'large']
+OUTPUT_FORMATS = list(WRITERS)
+
+# Transcription options (override any subset per engine)
+DEFAULT_OPTIONS = {
+    'language': 'en',
+    'task': 'transcribe',
+    'chunk_workers': 0,  # long-file mode: 0 = off, 1 = chunks in sequence, N = parallel processes
+    'chunk_minutes': 10,  # target chunk length; cuts are moved to the nearest silence
+    'long_file_minutes': 30,  # only recordings longer than this are chunked
+    'vad': False,  # decode only detected speech, timestamps mapped back to the original
+    'result_cache': True,  # reuse results for the same media content, model and options
+    'pcm_cache': True,  # keep decoded audio so a file is decoded by ffmpeg only once
+    'quantize': False,  # int8 dynamic quantization of the linear layers (CPU)
+    'backend': 'whisper',  # inference runtime, see voxtext_backends
+    'write_threads': 1,  # output files written concurrently; more helps on network shares
+    'word_timestamps': False,  # align every word while decoding (stored in json/vxt, used by word_cues)
+    'word_cues': 'segments',  # subtitle cues: segments, karaoke (VTT word tags) or words, see WORD_CUE_MODES
+    'search_index': True,  # record each transcript in the local full-text search index, see voxtext_search
+}
+
+# LMS VTT Styling Presets; caption_limits re-flow SRT/VTT cues (see voxtext_captions), None keeps the segments
+VTT_PRESETS = {
+    'Custom': {
+        'cue_settings': '',
+        'css': '',
+        'caption_limits': None
+    },
+    'LMS Standard': {
+        'cue_settings': 'line:80%',
+        'css': '::cue {\n  background-color: rgb(0, 0, 0, 60%);\n  line-height: 1.5em;\n}',
+        'caption_limits': {
+            'max_chars_per_line': 42, 'max_lines': 2, 'max_cps': 20, 'min_duration': 1.0, 'max_duration': 7.0
+        }
+    },
+    'Lower Third': {
+        'cue_settings': 'line:90% align:start',
+        'css': '::cue {\n  background-color: rgba(0, 0, 0, 0.8);\n  color: #ffffff;\n  font-size: 1.1em;\n}',
+        'caption_limits': {
+            'max_chars_per_line': 32, 'max_lines': 2, 'max_cps': 17, 'min_duration': 1.0, 'max_duration': 6.0
+        }
+    },
+    'High Contrast': {
+        'cue_settings': 'line:85%',
+        'css': '::cue {\n  background-color: #000000;\n  color: #ffff00;\n  font-weight: bold;\n}',
+        'caption_limits': {
+            'max_chars_per_line': 37, 'max_lines': 2, 'max_cps': 17, 'min_duration': 1.5, 'max_duration': 7.0
+        }
+    }
+}
+
+
+def ensure_local_ffmpeg_on_path():
+    """
+    Add bundled ffmpeg to PATH early in application startup.
+    Works for both .py scripts and compiled executables.
+    """
+    try:
+        if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
+            exe_dir = sys._MEIPASS
+        else:
+            exe_dir = os.path.dirname(os.path.abspath(__file__))
+        
+        local_ffmpeg_dir = os.path.join(exe_dir, "ffmpeg")
+        
+        if os.path.isdir(local_ffmpeg_dir):
+            os.environ["PATH"] = local_ffmpeg_dir + os.pathsep + os.environ.get("PATH", "")
+    except Exception:
+        pass
+
+
+class TranscriptionCancelled(Exception):
+    """Raised inside the engine when the caller asked to stop"""
+
+
+def describe_error(error):
+    """Turn an exception into a user-facing message"""
+    if isinstance(error, FileNotFoundError) and 'ffmpeg' in str(error).lower():
+        return (
+            "FFmpeg not found!\n\n"
+            "Whisper requires FFmpeg to process audio/video files.\n\n"
+            "To install on Mac:\n"
+            "  brew install ffmpeg\n\n"
+            "To install on Windows:\n"
+            "  Download from ffmpeg.org\n\n"
+            "To install on Linux:\n"
+            "  sudo apt install ffmpeg"
+        )
+    return str(error)
+
+
+# === Media discovery ===
+def find_media_files(folder):
+    """Recursively find audio/video files in a folder, sorted by path"""
+    return sorted(
+        str(p) for p in Path(folder).rglob('*')
+        if p.is_file() and p.suffix.lower() in MEDIA_EXTENSIONS
+    )
+
+
+def collect_media_files(paths):
+    """Expand files and folders into a de-duplicated list of media files"""
+    seen = set()
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            candidates = find_media_files(path)
+        elif os.path.isfile(path):
+            candidates = [str(path)]
+        else:
+            continue
+        for file_path in candidates:
+            if file_path not in seen:
+                seen.add(file_path)
+                files.append(file_path)
+    return files
+
+
+# === Model cache ===
+DEFAULT_MODEL_BUDGET_MB = 4096
+
+
+def _model_size_bytes(model):
+    """Estimate the memory held by a loaded model's parameters and buffers"""
+    estimate = getattr(model, 'memory_bytes', None)  # set by backends without torch tensors
+    if estimate is not None:
+        return estimate
+    try:
+        tensors = list(model.parameters()) + list(model.buffers())
+        return sum(t.numel() * t.element_size() for t in tensors)
+    except Exception:
+        return 0
+
+
+class ModelCache:
+    """
+    Process-wide LRU cache that keeps loaded Whisper models resident.
+    Successive transcriptions reuse an already loaded model instead of calling
+    whisper.load_model() again. When the models held exceed the RAM budget the
+    least recently used ones are dropped (the most recent one is always kept).
+    """
+    
+    def __init__(self, budget_mb=DEFAULT_MODEL_BUDGET_MB):
+        self.budget_mb = budget_mb
+        self._models = OrderedDict()  # model name -> (model, size in bytes, unload callable or None)
+        self._lock = threading.RLock()
+        self._loading = {}  # model name -> lock held while that model loads
+    
+    def get(self, model_name, loader, unload=None):
+        """
+        Return the cached model, calling loader(model_name) on a miss;
+        unload(model) is called when the model is evicted or cleared.
+        Loads of one model are shared (a second caller waits for the first,
+        e.g. a transcription for a background pre-load); different models and
+        the other cache methods are not blocked while a model loads.
+        """
+        with self._lock:
+            if model_name in self._models:
+                self._models.move_to_end(model_name)
+                return self._models[model_name][0]
+            load_lock = self._loading.setdefault(model_name, threading.Lock())
+        
+        with load_lock:
+            with self._lock:
+                if model_name in self._models:
+                    self._models.move_to_end(model_name)
+                    return self._models[model_name][0]
+            try:
+                model = loader(model_name)
+            except BaseException:
+                with self._lock:
+                    self._loading.pop(model_name, None)
+                raise
+            with self._lock:
+                self._models[model_name] = (model, _model_size_bytes(model), unload)
+                self._loading.pop(model_name, None)
+                self._evict()
+            return model
+    
+    def contains(self, model_name):
+        with self._lock:
+            return model_name in self._models
+    
+    def set_budget(self, budget_mb):
+        with self._lock:
+            self.budget_mb = budget_mb
+            self._evict()
+    
+    def used_mb(self):
+        with self._lock:
+            return sum(size for _, size, _ in self._models.values()) / (1024 * 1024)
+    
+    def resident(self):
+        """List (name, size_mb) for resident models, most recently used last"""
+        with self._lock:
+            return [(name, size / (1024 * 1024)) for name, (_, size, _) in self._models.items()]
+    
+    def clear(self):
+        with self._lock:
+            entries = list(self._models.values())
+            self._models.clear()
+        while entries:
+            self._unload(entries.pop())
+        self.release_memory()  # no reference to the models is left here
+    
+    def _evict(self):
+        evicted = False
+        while len(self._models) > 1 and self.used_mb() > self.budget_mb:
+            self._unload(self._models.popitem(last=False)[1])
+            evicted = True
+        if evicted:
+            self.release_memory()
+    
+    def _unload(self, entry):
+        model, _, unload = entry
+        if unload:
+            try:
+                unload(model)
+            except Exception:
+                pass  # the reference is dropped either way
+    
+    def release_memory(self):
+        """Return freed tensors to the OS/GPU (e.g. after an evicted model or a cancelled job)"""
+        import gc
+        gc.collect()
+        try:
+            import torch
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+        except ImportError:
+            pass
+
+
+MODEL_CACHE = ModelCache()
+
+
+def whisper_available():
+    """Whether openai-whisper is installed, without importing it (and torch)"""
+    import importlib.util
+    
+    return importlib.util.find_spec("whisper") is not None
+
+
+def warm_up_whisper():
+    """
+    Import whisper (and with it torch, numpy and tiktoken) ahead of the first
+    transcription. Returns the seconds the import took; near zero once done.
+    """
+    started = time.perf_counter()
+    import whisper  # noqa: F401
+    import whisper.transcribe  # noqa: F401
+    return time.perf_counter() - started
+
+
+def model_cache_key(model_name, quantize=False):
+    """ModelCache key: the int8 and float32 variants of a model are kept apart"""
+    return f"{model_name} (int8)" if quantize else model_name
+
+
+def load_whisper_model(model_name, on_download=None, is_cancelled=None, quantize=False, device=None):
+    """
+    Load a Whisper model, downloading it first if needed (resumable and
+    checksummed, see voxtext_models). on_download(done_bytes, total_bytes)
+    reports download progress. quantize loads the int8 CPU variant (see
+    voxtext_quantize). The load time and peak memory are left on the model
+    as model.load_stats.
+    """
+    import whisper
+    from voxtext_models import download_model, model_url
+    
+    if model_url(model_name) is None:
+        return whisper.load_model(model_name, device=device)  # a checkpoint path
+    checkpoint_path = download_model(model_name, progress=on_download, is_cancelled=is_cancelled)
+    
+    if quantize:
+        from voxtext_quantize import load_quantized_model
+        from voxtext_weights import peak_rss_mb
+        
+        started = time.perf_counter()
+        model, converted = load_quantized_model(
+            model_name, checkpoint_path, lambda: _load_float_model(model_name, checkpoint_path, "cpu")
+        )
+        model.load_stats = {
+            'seconds': time.perf_counter() - started, 'peak_rss_mb': peak_rss_mb(),
+            'quantized': True, 'converted': converted,
+        }
+        return model
+    return _load_float_model(model_name, checkpoint_path, device)
+
+
+def prepare_whisper_model(model_name, on_download=None, is_cancelled=None, quantize=False):
+    """
+    Get a model's files ready in the store without loading it: done once in
+    the parent so pool workers do not download or convert the same file side
+    by side. The int8 weights (quantize) or the memory-mapped weights file
+    are converted here when the workers will use them.
+    """
+    from voxtext_models import download_model, model_url, use_mapped_weights
+    from voxtext_quantize import quantized_path, load_quantized_model
+    from voxtext_weights import ensure_mapped_weights
+    
+    if model_url(model_name) is None:
+        return
+    checkpoint_path = download_model(model_name, progress=on_download, is_cancelled=is_cancelled)
+    if quantize:
+        if not quantized_path(checkpoint_path).exists():
+            load_quantized_model(
+                model_name, checkpoint_path, lambda: _load_float_model(model_name, checkpoint_path, "cpu")
+            )
+    elif use_mapped_weights():
+        try:
+            ensure_mapped_weights(checkpoint_path)
+        except Exception as e:
+            # Loading falls back to the checkpoint; see _load_float_model
+            print(f"Note: converting {model_name} for memory-mapped loading failed ({e})")
+
+
+def _load_float_model(model_name, checkpoint_path, device=None):
+    """Load the float32 model, memory-mapped when the store is set up for it"""
+    import whisper
+    from voxtext_models import use_mapped_weights
+    from voxtext_weights import load_mapped_model, peak_rss_mb
+    
+    if use_mapped_weights():
+        try:
+            model, stats = load_mapped_model(model_name, checkpoint_path, device)
+        except Exception as e:
+            print(f"Note: memory-mapped loading failed ({e}); loading the checkpoint normally")
+        else:
+            model.load_stats = dict(stats, mapped=True)
+            return model
+    
+    # Loaded by path: the file was verified when it entered the store, so this
+    # skips whisper's re-hash of the whole checkpoint (and its own download)
+    started = time.perf_counter()
+    model = whisper.load_model(str(checkpoint_path), device=device)
+    if model_name in whisper._ALIGNMENT_HEADS:
+        model.set_alignment_heads(whisper._ALIGNMENT_HEADS[model_name])
+    model.load_stats = {'seconds': time.perf_counter() - started, 'peak_rss_mb': peak_rss_mb(), 'mapped': False}
+    return model
+
+
+def describe_load(stats):
+    """'Model loaded in 2.1s (memory-mapped, peak memory 912 MB).' from model.load_stats"""
+    if stats.get('quantized'):
+        details = ["int8 quantized"]
+    else:
+        details = ["memory-mapped" if stats.get('mapped') else "standard loader"]
+    if stats.get('backend'):
+        details.insert(0, stats['backend'])
+    if stats.get('converted'):
+        details.append("converted once and saved to the model store")
+    if stats.get('peak_rss_mb'):
+        details.append(f"peak memory {stats['peak_rss_mb']:,.0f} MB")
+    return f"Model loaded in {stats['seconds']:.1f}s ({', '.join(details)})."
+
+
+# === Live decode progress ===
+FRAMES_PER_SECOND = 100  # Whisper mel frames per second of audio (16 kHz / hop of 160)
+
+_decode_hook = threading.local()
+# whisper.transcribe() collects the result's segments in this local (openai-whisper
+# 20231117-20250625). _install_decode_hook() checks it is there; without it live
+# text is off and only the progress is reported.
+SEGMENTS_LOCAL = 'all_segments'
+_transcribe_code = None  # whisper.transcribe()'s code object when it keeps SEGMENTS_LOCAL
+
+
+class _DecodeProgress:
+    """
+    Stand-in for the tqdm bar that whisper.transcribe() drives while decoding.
+    It is updated after every 30 s window with the mel frames consumed and
+    forwards that, plus the segments decoded since the last update, to the
+    callback registered for the current thread.
+    """
+    
+    def __init__(self, total=None, unit=None, disable=False, **kwargs):
+        self.total = total or 0
+        self.n = 0
+        self.emitted = 0  # segments already passed to the callback
+        self.callback = getattr(_decode_hook, 'callback', None)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+    
+    def update(self, n=1):
+        self.n += n
+        if self.callback is None:
+            return
+        segments = []
+        caller = sys._getframe(1)
+        if _transcribe_code is not None and caller.f_code is _transcribe_code:
+            decoded = caller.f_locals.get(SEGMENTS_LOCAL)
+            if isinstance(decoded, list):
+                segments = decoded[self.emitted:]
+                self.emitted = len(decoded)
+        self.callback(self.n, self.total, segments)
+
+
+def _install_decode_hook():
+    """Point whisper.transcribe's progress bar at _DecodeProgress (once per process)"""
+    global _transcribe_code
+    import importlib
+    import types
+    
+    # importlib, because the whisper package shadows the submodule with the function
+    module = importlib.import_module('whisper.transcribe')
+    if not isinstance(getattr(module, 'tqdm', None), types.SimpleNamespace):
+        module.tqdm = types.SimpleNamespace(tqdm=_DecodeProgress)
+        code = module.transcribe.__code__
+        if SEGMENTS_LOCAL in code.co_varnames:
+            _transcribe_code = code
+        else:
+            print(f"Note: this Whisper version has no '{SEGMENTS_LOCAL}' in transcribe(); "
+                  f"progress is shown without live transcript text")
+
+
+@contextmanager
+def decode_progress(callback):
+    """Call callback(frames_done, total_frames, new_segments) while Whisper decodes on this thread"""
+    _install_decode_hook()
+    _decode_hook.callback = callback
+    try:
+        yield
+    finally:
+        _decode_hook.callback = None
+
+
+@contextmanager
+def cancellation_hooks(model, check_cancelled):
+    """
+    Run check_cancelled() before every encoder/decoder forward pass, so a
+    cancel request stops decoding within one token instead of one file.
+    """
+    handles = []
+    for module in (getattr(model, 'encoder', None), getattr(model, 'decoder', None)):
+        if hasattr(module, 'register_forward_pre_hook'):
+            handles.append(module.register_forward_pre_hook(lambda mod, inputs: check_cancelled()))
+    try:
+        yield
+    finally:
+        for handle in handles:
+            handle.remove()
+
+
+def format_duration(seconds):
+    """Format seconds as '1h 02m', '3m 12s' or '45s'"""
+    seconds = int(max(seconds, 0))
+    if seconds >= 3600:
+        return f"{seconds // 3600}h {(seconds % 3600) // 60:02d}m"
+    if seconds >= 60:
+        return f"{seconds // 60}m {seconds % 60:02d}s"
+    return f"{seconds}s"
+
+
+def describe_bytes(done, total):
+    """'512 of 1,457 MB (35%)' for download progress"""
+    mb = 1024 * 1024
+    if not total:
+        return f"{done / mb:,.0f} MB"
+    return f"{done / mb:,.0f} of {total / mb:,.0f} MB ({done * 100 // total}%)"
+
+
+def describe_rate(done_seconds, total_seconds, elapsed, expected_speed=None):
+    """
+    Progress message with real-time factor and ETA from media time decoded so far.
+    Before anything is decoded the ETA comes from expected_speed (a benchmark), if known.
+    """
+    if done_seconds <= 0 or elapsed <= 0:
+        if expected_speed:
+            return (
+                f"Transcribing {format_duration(total_seconds)} of audio "
+                f"· about {format_duration(total_seconds / expected_speed)} on this computer..."
+            )
+        return f"Transcribing {format_duration(total_seconds)} of audio..."
+    speed = done_seconds / elapsed  # seconds of audio per second of compute
+    eta = (total_seconds - done_seconds) / speed
+    return (
+        f"Transcribing {format_duration(done_seconds)} of {format_duration(total_seconds)} "
+        f"· {speed:.1f}x real-time · ETA {format_duration(eta)}"
+    )
+
+
+# === Saved transcripts ===
+def load_transcript(path):
+    """Load a Whisper result saved by the json or vxt output format"""
+    from voxtext_vxt import is_vxt, load_vxt
+    
+    if is_vxt(path):
+        return load_vxt(path)
+    with open(path, 'r', encoding='utf-8') as f:
+        try:
+            result = json.load(f)
+        except ValueError:
+            result = None
+    if not isinstance(result, dict) or not isinstance(result.get('segments'), list):
+        raise ValueError(f"{Path(path).name} is not a Voxtext/Whisper JSON transcript")
+    return result
+
+
+def transcript_segments(path, start=None, end=None):
+    """
+    Segments of a saved transcript overlapping [start, end) seconds. A .vxt
+    transcript is range-read through its time index; JSON is parsed whole.
+    """
+    from voxtext_vxt import is_vxt, VxtFile
+    
+    if is_vxt(path):
+        with VxtFile(path) as transcript:
+            return transcript.segments(start, end)
+    return [
+        segment for segment in load_transcript(path)['segments']
+        if (end is None or segment['start'] < end) and (start is None or segment['end'] > start)
+    ]
+
+
+def export_transcript(path, output_formats, output_dir=None, lms_settings=None, on_written=None, threads=1,
+                      word_cues='segments'):
+    """
+    Write outputs from a saved JSON or .vxt transcript instead of transcribing
+    again. Files are named after the original media (the "_transcript" suffix
+    is stripped) and the source transcript itself is never overwritten.
+    """
+    path = Path(path)
+    result = load_transcript(path)
+    base_name = path.stem
+    if base_name.endswith("_transcript"):
+        base_name = base_name[:-len("_transcript")]
+    output_dir = Path(output_dir) if output_dir else path.parent
+    
+    formats = [
+        fmt for fmt in output_formats
+        if (output_dir / f"{base_name}_transcript.{WRITERS[fmt].extension}").resolve() != path.resolve()
+    ]
+    return write_outputs(
+        result, base_name, output_dir, formats, lms_settings, on_written, threads=threads, word_cues=word_cues
+    )
+
+
+# === Engine ===
+class TranscriptionEngine:
+    """
+    Transcribes files with one loaded model and writes the requested outputs.
+    progress(message, percentage) reports overall progress (with live ETA and
+    real-time factor while decoding); partial_text(text) receives transcript
+    text as Whisper produces it; is_cancelled() is polled between steps and
+    raises TranscriptionCancelled when true.
+    """
+    
+    def __init__(self, model_name, output_formats, output_dir=None, lms_settings=None,
+                 model_cache=None, progress=None, is_cancelled=None, options=None, partial_text=None):
+        self.model_name = model_name
+        self.output_formats = output_formats
+        self.output_dir = output_dir  # None = next to each source file
+        self.lms_settings = lms_settings or {}
+        self.options = dict(DEFAULT_OPTIONS, **(options or {}))
+        self.model_cache = model_cache or MODEL_CACHE
+        self.progress = progress or (lambda message, percentage: None)
+        self.is_cancelled = is_cancelled or (lambda: False)
+        self.partial_text = partial_text or (lambda text: None)
+        from voxtext_backends import get_backend
+        self.backend = get_backend(self.options['backend'])
+        self.result_cache = None
+        if self.options['result_cache']:
+            from voxtext_cache import ResultCache
+            self.result_cache = ResultCache()
+        self.pcm_cache = None
+        if self.options['pcm_cache']:
+            from voxtext_cache import PcmCache
+            self.pcm_cache = PcmCache()
+        self.model = None
+        self.model_load_failed = False
+        self.metrics = None  # JobMetrics of the file being transcribed
+        self._item_index = 0
+        self._item_count = 1
+    
+    def check_cancelled(self):
+        if self.is_cancelled():
+            raise TranscriptionCancelled()
+    
+    def load_model(self):
+        """Load the model once (reused from the cache when already resident)"""
+        self.check_cancelled()
+        quantize = self.options['quantize']
+        cache_key = self.backend.cache_key(self.model_name, quantize)
+        self._model_was_resident = self.model_cache.contains(cache_key)
+        if self._model_was_resident:
+            self._emit_progress(f"Using loaded {cache_key} model...", 10)
+        elif quantize:
+            self._emit_progress(f"Loading {cache_key} model (the first time also quantizes it)...", 10)
+        else:
+            self._emit_progress(f"Loading {self.model_name} model...", 10)
+        
+        def loader(key):
+            return self.backend.load(self.model_name, self._on_download, self.is_cancelled, quantize)
+        
+        try:
+            self.model = self.model_cache.get(cache_key, loader, self.backend.unload)
+        except TranscriptionCancelled:
+            raise
+        except Exception:
+            self.model_load_failed = True
+            raise
+        self.check_cancelled()
+        stats = getattr(self.model, 'load_stats', None)
+        if stats and not self._model_was_resident:
+            self._emit_progress(describe_load(stats), 19)
+        else:
+            self._emit_progress("Model loaded successfully.", 19)
+        return self.model
+    
+    def prepare_model(self):
+        """
+        Fetch (and convert) the model files without loading the model, for
+        worker processes that each load their own copy
+        """
+        self.check_cancelled()
+        self._emit_progress(f"Preparing {self.model_name} model for the chunk workers...", 10)
+        try:
+            self.backend.prepare(self.model_name, self._on_download, self.is_cancelled, self.options['quantize'])
+        except TranscriptionCancelled:
+            raise
+        except Exception:
+            self.model_load_failed = True
+            raise
+        self.check_cancelled()
+    
+    def _on_download(self, done, total):
+        message = f"Downloading {self.model_name} model: {describe_bytes(done, total)}"
+        fraction = done / total if total else 0
+        self._emit_progress(message, 10 + int(8 * fraction))
+    
+    def _ensure_model(self):
+        """Load the model on first use in this job"""
+        if self.model is None:
+            with self.metrics.stage('model_load'):
+                self.load_model()
+    
+    def release_model(self):
+        # The cache owns the model; drop our reference so eviction can free it
+        self.model = None
+    
+    def transcribe(self, file_path):
+        """
+        Transcribe one file (or fetch the cached result) and return its raw
+        result dict. Stage timings are recorded in self.metrics.
+        """
+        from voxtext_metrics import JobMetrics
+        
+        self.check_cancelled()
+        self.metrics = JobMetrics(file_path, self.model_name, self.backend.name, self.options['quantize'])
+        cache_key = None
+        if self.result_cache is not None:
+            from voxtext_cache import file_digest
+            
+            self._emit_progress("Checking transcript cache...", 2)
+            with self.metrics.stage('cache_lookup'):
+                cache_key = self.result_cache.key(file_digest(file_path), self.model_name, self.result_options())
+                cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                self.metrics.cached = True
+                self._emit_progress("Using cached transcript (same file, model and options).", 80)
+                return cached
+        
+        # The model is loaded once the audio is known to need it here: long
+        # files handed to chunk workers never load it in this process
+        decode_options = {
+            'language': self.options['language'],
+            'task': self.options['task'],
+        }
+        if self.options['word_timestamps']:
+            decode_options['word_timestamps'] = True
+        
+        result = self._transcribe_pcm(file_path, decode_options)
+        self.check_cancelled()
+        
+        # An empty transcript from a voice-detection run is never cached: it
+        # more likely means speech was missed than that the file is silent
+        if cache_key is not None and (result['segments'] or not self.options['vad']):
+            try:
+                self.result_cache.put(cache_key, result)
+            except OSError:
+                pass  # a full or read-only cache never fails the job
+        return result
+    
+    def result_options(self):
+        """The options that change the transcript itself (and so the cache key)"""
+        options = {key: self.options[key] for key in ('language', 'task', 'vad')}
+        if self.options['quantize']:
+            options['quantize'] = True
+        if self.options['word_timestamps']:
+            options['word_timestamps'] = True
+        if self.options['backend'] != DEFAULT_OPTIONS['backend']:
+            options['backend'] = self.options['backend']
+        if self.options['chunk_workers']:
+            options['chunk_minutes'] = self.options['chunk_minutes']
+            options['long_file_minutes'] = self.options['long_file_minutes']
+        return options
+    
+    def _transcribe_pcm(self, file_path, decode_options):
+        """
+        Decode the media once (or map it from the PCM cache) and run voice
+        detection, long-file chunking and the model on the samples.
+        """
+        from voxtext_audio import load_audio, duration_seconds
+        
+        self._emit_progress("Decoding audio...", 5)
+        with self.metrics.stage('audio_decode'):
+            audio = load_audio(file_path, self.pcm_cache)
+        self.metrics.audio_seconds = duration_seconds(audio)
+        self.check_cancelled()
+        
+        speech_map = None
+        if self.options['vad']:
+            from voxtext_vad import detect_speech
+            
+            with self.metrics.stage('voice_detection'):
+                speech_map = detect_speech(audio)
+            if speech_map.is_reliable:
+                skipped = speech_map.skipped_seconds
+                share = 100 * skipped / max(duration_seconds(audio), 1e-9)
+                self._emit_progress(f"Voice detection: skipping {format_duration(skipped)} of silence ({share:.0f}%)", 8)
+                audio = speech_map.collapse(audio)
+            else:
+                # Noise or music under the voice hides it from the energy
+                # threshold; decoding everything beats an empty transcript
+                found = format_duration(speech_map.speech_seconds)
+                self._emit_progress(f"Voice detection found only {found} of speech; transcribing the full audio", 8)
+                speech_map = None
+        
+        if self.options['chunk_workers'] and duration_seconds(audio) > self.options['long_file_minutes'] * 60:
+            # Chunk workers map the cached file itself when the samples are unchanged
+            pcm_path = None
+            if self.pcm_cache is not None and speech_map is None:
+                from voxtext_cache import file_digest
+                pcm_path = self.pcm_cache.path(self.pcm_cache.key(file_digest(file_path)))
+            result = self._transcribe_long(audio, decode_options, pcm_path)
+        else:
+            result = self._run_model(audio, decode_options)
+        
+        if speech_map:
+            speech_map.remap_result(result)
+        return result
+    
+    def _run_model(self, audio, decode_options):
+        """Run the backend with progress derived from decoded media time"""
+        from voxtext_audio import duration_seconds
+        from voxtext_bench import expected_speed
+        
+        self._ensure_model()
+        speed = expected_speed(self.model_name, self.backend.name, self.options['quantize'])
+        self._emit_progress(describe_rate(0, duration_seconds(audio), 0, speed), 20)
+        started = time.time()
+        
+        def on_decoded(done_seconds, total_seconds, segments):
+            self.check_cancelled()
+            if total_seconds:
+                message = describe_rate(done_seconds, total_seconds, time.time() - started)
+                self._emit_progress(message, 20 + 60 * min(done_seconds / total_seconds, 1))
+            text = ''.join(segment['text'] for segment in segments)
+            if text:
+                self.partial_text(text)
+        
+        return self.backend.transcribe(
+            self.model, audio, decode_options, on_decoded, self.is_cancelled, self.metrics.stages
+        )
+    
+    def _transcribe_long(self, audio, decode_options, pcm_path=None):
+        """
+        Long-file mode: split at silences, transcribe chunks, stitch the results.
+        pcm_path is a saved .npy copy of audio that chunk workers can map directly.
+        """
+        from voxtext_audio import duration_seconds
+        from voxtext_chunking import transcribe_long
+        
+        total_seconds = duration_seconds(audio)
+        if self.options['chunk_workers'] > 1:
+            with self.metrics.stage('model_load'):
+                self.prepare_model()
+        else:
+            self._ensure_model()
+        self._emit_progress(f"Splitting {total_seconds / 60:.0f} min recording into chunks...", 20)
+        started = time.time()
+        
+        def on_chunk(done, total):
+            rate = describe_rate(total_seconds * done / total, total_seconds, time.time() - started)
+            self._emit_progress(f"Chunk {done}/{total} done · {rate}", 20 + 60 * done / total)
+        
+        def transcribe_piece(piece):
+            self._ensure_model()  # a recording that fits in one chunk runs here after all
+            return self.backend.transcribe(self.model, piece, decode_options, is_cancelled=self.is_cancelled)
+        
+        with self.metrics.stage('chunked_transcribe'):
+            return transcribe_long(
+                transcribe_piece, audio, decode_options,
+                chunk_seconds=self.options['chunk_minutes'] * 60,
+                workers=self.options['chunk_workers'],
+                model_name=self.model_name,
+                quantize=self.options['quantize'],
+                backend=self.backend.name,
+                pcm_path=pcm_path,
+                progress=on_chunk,
+                is_cancelled=self.is_cancelled
+            )
+    
+    def write_outputs(self, result, file_path):
+        """Write the requested formats for a transcribed file"""
+        self._emit_progress("Transcription complete. Writing output files...", 80)
+        output_dir = Path(self.output_dir) if self.output_dir else Path(file_path).parent
+        step = 15 / max(len(self.output_formats), 1)
+        done = []
+        if self.metrics:
+            self.metrics.output_dir = str(output_dir)
+        
+        def on_written(path):
+            nonlocal last_written
+            now = time.perf_counter()
+            if self.metrics:
+                self.metrics.add(f"write_{path.suffix.lstrip('.')}", now - last_written)
+            last_written = now
+            done.append(path)
+            self._emit_progress(f"Created {path.name}", 80 + step * len(done))
+        
+        started = time.perf_counter()
+        rendered = render_outputs(result, self.output_formats, self.lms_settings, self.options['word_cues'])
+        last_written = time.perf_counter()
+        if self.metrics:
+            self.metrics.add('render_outputs', last_written - started)
+        return save_outputs(
+            rendered, Path(file_path).stem, output_dir, on_written, self.is_cancelled,
+            self.options['write_threads']
+        )
+    
+    def index_transcript(self, file_path, result, created_files):
+        """
+        Add a finished transcript to the search index. Indexing is a
+        convenience: a locked or unwritable index never fails the job.
+        """
+        import sqlite3
+        from voxtext_search import SearchIndex
+        
+        started = time.perf_counter()
+        try:
+            with SearchIndex() as index:
+                index.add(file_path, result, created_files, self.model_name)
+        except (sqlite3.Error, OSError):
+            pass
+        if self.metrics:
+            self.metrics.add('search_index', time.perf_counter() - started)
+    
+    def transcribe_file(self, file_path):
+        """Transcribe one file and write its outputs, returning the created paths"""
+        result = self.transcribe(file_path)
+        created_files = self.write_outputs(result, file_path)
+        if self.options['search_index']:
+            self.index_transcript(file_path, result, created_files)
+        return created_files
+    
+    def transcribe_files(self, file_paths, on_started=None, on_finished=None, on_failed=None, on_metrics=None):
+        """
+        Transcribe a queue of files with one model load (skipped entirely when
+        every file is already in the result cache). A failing file is reported
+        through on_failed(index, message) and the queue moves on; a model that
+        cannot load or a cancellation stops the whole queue. on_metrics(index,
+        metrics) receives each finished file's JobMetrics record.
+        """
+        file_paths = list(file_paths)
+        self._item_count = max(len(file_paths), 1)
+        self._item_index = 0
+        all_created = []
+        cancelled = False
+        try:
+            for index, file_path in enumerate(file_paths):
+                self.check_cancelled()
+                self._item_index = index
+                if on_started:
+                    on_started(index)
+                try:
+                    created_files = self.transcribe_file(file_path)
+                except TranscriptionCancelled:
+                    raise
+                except Exception as e:
+                    if self.is_cancelled():
+                        raise TranscriptionCancelled()
+                    if self.model_load_failed:
+                        raise
+                    if on_failed:
+                        on_failed(index, describe_error(e))
+                    continue
+                all_created.extend(created_files)
+                if on_metrics:
+                    on_metrics(index, self.metrics.finish())
+                if on_finished:
+                    on_finished(index, created_files)
+        except TranscriptionCancelled:
+            cancelled = True
+        finally:
+            self.release_model()
+        
+        if cancelled:
+            # Outside the except block, so the traceback no longer pins the half-finished
+            # decode's activations and KV caches and they can be freed right away
+            self.model_cache.release_memory()
+            raise TranscriptionCancelled()
+        return all_created
+    
+    def _emit_progress(self, message, item_percentage):
+        """Emit progress for the current item scaled to the whole queue"""
+        if self._item_count > 1:
+            message = f"[{self._item_index + 1}/{self._item_count}] {message}"
+        overall = (self._item_index * 100 + item_percentage) / self._item_count
+        self.progress(message, int(overall))
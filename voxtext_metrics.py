@@ -0,0 +1,213 @@
+"""
+Voxtext job metrics
+
+Every transcription job records how long each stage took (cache lookup,
+audio decode, voice detection, model load, log-mel, encoder, decoder, word
+alignment, rendering the outputs and writing each file), its CPU time and
+utilization, the process's peak memory and the audio duration. The engine
+hands the finished record to an on_metrics callback; MetricsRecorder saves
+it as <name>_metrics.json next to the transcripts and/or keeps running
+totals in a Prometheus text-format file (for node_exporter's textfile
+collector on batch nodes).
+"""
+
+import os
+import sys
+import json
+import time
+from pathlib import Path
+from datetime import datetime
+from contextlib import contextmanager
+
+STAGE_LABELS = {
+    'cache_lookup': "Cache lookup",
+    'audio_decode': "Audio decode (or cache)",
+    'voice_detection': "Voice detection",
+    'model_load': "Model load",
+    'mel': "Log-mel spectrogram",
+    'encode': "Encoder",
+    'decode': "Decoder",
+    'word_alignment': "Word alignment",
+    'transcribe': "Transcription",
+    'chunked_transcribe': "Chunked transcription",
+    'render_outputs': "Render outputs",
+    'search_index': "Search indexing",
+}
+
+
+def stage_label(name):
+    if name.startswith('write_'):
+        return f"Write {name[len('write_'):].upper()}"
+    return STAGE_LABELS.get(name, name)
+
+
+class JobMetrics:
+    """Stage timings and resource use of one transcription job"""
+    
+    def __init__(self, file_path, model_name, backend, quantize=False):
+        self.file_path = str(file_path)
+        self.model_name = model_name
+        self.backend = backend
+        self.quantize = quantize
+        self.stages = {}  # stage name -> seconds; backends may add their own
+        self.audio_seconds = None
+        self.cached = False
+        self.output_dir = None
+        self.started_at = datetime.now().isoformat(timespec='seconds')
+        self._wall_started = time.perf_counter()
+        self._cpu_started = time.process_time()
+    
+    def add(self, name, seconds):
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+    
+    @contextmanager
+    def stage(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - started)
+    
+    def finish(self):
+        """The finished record as a JSON-ready dict"""
+        from voxtext_weights import peak_rss_mb
+        
+        wall = time.perf_counter() - self._wall_started
+        cpu = time.process_time() - self._cpu_started
+        return {
+            'file': self.file_path,
+            'model': self.model_name,
+            'backend': self.backend,
+            'quantize': self.quantize,
+            'started': self.started_at,
+            'cached': self.cached,
+            'output_dir': self.output_dir,
+            'audio_seconds': self.audio_seconds,
+            'wall_seconds': wall,
+            'cpu_seconds': cpu,
+            # Busy cores on average; e.g. 3.5 = three and a half cores fully used
+            'cpu_utilization': cpu / wall if wall > 0 else 0.0,
+            'cores': os.cpu_count(),
+            'realtime_factor': self.audio_seconds / wall if self.audio_seconds and wall > 0 else None,
+            'peak_rss_mb': peak_rss_mb(),  # of the process so far, not this job alone
+            'stages': dict(self.stages),
+        }
+
+
+def describe_metrics(metrics):
+    """Multi-line summary for the details panel and the CLI"""
+    from voxtext_engine import format_duration
+    
+    lines = [f"{Path(metrics['file']).name} · {metrics['model']} ({metrics['backend']})"]
+    if metrics['cached']:
+        lines.append("Result reused from the transcript cache")
+    total = metrics['wall_seconds']
+    for name, seconds in sorted(metrics['stages'].items(), key=lambda item: -item[1]):
+        share = 100 * seconds / total if total else 0
+        lines.append(f"  {stage_label(name):<24} {seconds:8.2f}s  {share:5.1f}%")
+    lines.append(f"  {'Total':<24} {total:8.2f}s")
+    summary = f"CPU {metrics['cpu_seconds']:.1f}s ({metrics['cpu_utilization']:.1f} of {metrics['cores']} cores)"
+    if metrics['audio_seconds']:
+        summary = f"Audio {format_duration(metrics['audio_seconds'])} · " + summary
+    if metrics['realtime_factor']:
+        summary += f" · {metrics['realtime_factor']:.1f}x real-time"
+    if metrics['peak_rss_mb']:
+        summary += f" · peak memory {metrics['peak_rss_mb']:,.0f} MB"
+    lines.append(summary)
+    return "\n".join(lines)
+
+
+def _escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def prometheus_text(totals):
+    """Render MetricsRecorder totals in the Prometheus text exposition format"""
+    def labels(**values):
+        return "{" + ",".join(f'{key}="{_escape_label(value)}"' for key, value in values.items()) + "}"
+    
+    families = [
+        ('voxtext_jobs_total', 'counter', "Transcription jobs finished"),
+        ('voxtext_cached_jobs_total', 'counter', "Jobs answered from the transcript cache"),
+        ('voxtext_audio_seconds_total', 'counter', "Seconds of audio transcribed"),
+        ('voxtext_job_seconds_total', 'counter', "Wall-clock seconds spent in jobs"),
+        ('voxtext_cpu_seconds_total', 'counter', "Process CPU seconds spent in jobs"),
+        ('voxtext_stage_seconds_total', 'counter', "Wall-clock seconds per pipeline stage"),
+        ('voxtext_peak_rss_bytes', 'gauge', "Peak resident memory of the process running the last job"),
+        ('voxtext_last_job_realtime_factor', 'gauge', "Seconds of audio per second of the last job"),
+        ('voxtext_last_job_timestamp_seconds', 'gauge', "Unix time the last job finished"),
+    ]
+    lines = []
+    for name, kind, help_text in families:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for (model, backend), series in sorted(totals.items()):
+            base = dict(model=model, backend=backend)
+            if name == 'voxtext_stage_seconds_total':
+                for stage, seconds in sorted(series['stages'].items()):
+                    lines.append(f"{name}{labels(**base, stage=stage)} {float(seconds)!r}")
+            elif series.get(name) is not None:
+                lines.append(f"{name}{labels(**base)} {float(series[name])!r}")
+    return "\n".join(lines) + "\n"
+
+
+class MetricsRecorder:
+    """
+    on_metrics callback that saves each job's record as JSON next to its
+    transcripts (json_files) and/or keeps running totals in a Prometheus
+    textfile (prometheus_path), rewritten atomically after every job.
+    """
+    
+    def __init__(self, json_files=True, prometheus_path=None):
+        self.json_files = json_files
+        self.prometheus_path = Path(prometheus_path) if prometheus_path else None
+        self.totals = {}  # (model, backend) -> series
+        self.records = []
+    
+    def __call__(self, index, metrics):
+        # A metrics file that cannot be written is reported; the batch goes on
+        self.records.append(metrics)
+        if self.json_files:
+            try:
+                self.write_json(metrics)
+            except OSError as e:
+                print(f"Note: could not write the metrics for {metrics['file']}: {e}", file=sys.stderr)
+        if self.prometheus_path:
+            self._accumulate(metrics)
+            try:
+                self.write_prometheus()
+            except OSError as e:
+                print(f"Note: could not write {self.prometheus_path}: {e}", file=sys.stderr)
+    
+    def write_json(self, metrics):
+        from voxtext_cache import atomic_write_bytes
+        
+        source = Path(metrics['file'])
+        output_dir = Path(metrics['output_dir'] or source.parent)
+        path = output_dir / f"{source.stem}_metrics.json"
+        atomic_write_bytes(path, json.dumps(metrics, indent=2).encode('utf-8'), private=False)
+        return path
+    
+    def _accumulate(self, metrics):
+        series = self.totals.setdefault((metrics['model'], metrics['backend']), {
+            'voxtext_jobs_total': 0, 'voxtext_cached_jobs_total': 0, 'voxtext_audio_seconds_total': 0.0,
+            'voxtext_job_seconds_total': 0.0, 'voxtext_cpu_seconds_total': 0.0, 'stages': {},
+        })
+        series['voxtext_jobs_total'] += 1
+        series['voxtext_cached_jobs_total'] += int(metrics['cached'])
+        series['voxtext_audio_seconds_total'] += metrics['audio_seconds'] or 0.0
+        series['voxtext_job_seconds_total'] += metrics['wall_seconds']
+        series['voxtext_cpu_seconds_total'] += metrics['cpu_seconds']
+        for stage, seconds in metrics['stages'].items():
+            series['stages'][stage] = series['stages'].get(stage, 0.0) + seconds
+        if metrics['peak_rss_mb']:
+            series['voxtext_peak_rss_bytes'] = metrics['peak_rss_mb'] * 1024 * 1024
+        series['voxtext_last_job_realtime_factor'] = metrics['realtime_factor']
+        series['voxtext_last_job_timestamp_seconds'] = time.time()
+    
+    def write_prometheus(self):
+        from voxtext_cache import atomic_write_bytes
+        
+        # Readable by node_exporter, which usually runs as another user
+        self.prometheus_path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_bytes(self.prometheus_path, prometheus_text(self.totals).encode('utf-8'), private=False)
@@ -0,0 +1,399 @@
+"""
+Voxtext model files
+
+The model store is the one folder Voxtext loads Whisper checkpoints from
+(by default Whisper's own cache folder). Missing models are copied from a
+mirror folder (e.g. a mounted share for machines without internet access)
+or downloaded with byte-level progress. Partial downloads are kept as .part
+files and resumed with an HTTP Range request (also after a dropped
+connection in the same run), every new file is SHA-256 verified before it
+is used, and several models can be fetched at once. Models can also be
+moved between machines as .zip bundles.
+
+The store, mirror, offline switch and weight format are read from
+environment variables so spawned worker processes follow the same
+configuration.
+"""
+
+import os
+import ssl
+import time
+import hashlib
+import threading
+import urllib.error
+import urllib.request
+import json
+import zipfile
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+BLOCK_SIZE = 1024 * 1024
+RETRIES = 5  # resumed attempts after a dropped connection
+RETRY_DELAY_SECONDS = 2
+PROGRESS_INTERVAL_SECONDS = 0.25
+
+
+class ModelDownloadError(Exception):
+    """A model could not be downloaded or failed verification"""
+
+
+BUNDLE_MANIFEST = "voxtext-models.json"
+
+
+def whisper_cache_dir():
+    """Folder whisper.load_model() downloads to by default (on every OS)"""
+    return Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "whisper"
+
+
+def models_dir():
+    """The model store: VOXTEXT_MODEL_DIR, else Whisper's own cache folder"""
+    override = os.environ.get("VOXTEXT_MODEL_DIR")
+    return Path(override) if override else whisper_cache_dir()
+
+
+def mirror_dir():
+    """Folder (or mounted share) holding model files to copy instead of downloading, or None"""
+    mirror = os.environ.get("VOXTEXT_MODEL_MIRROR")
+    return Path(mirror) if mirror else None
+
+
+def is_offline():
+    return os.environ.get("VOXTEXT_OFFLINE", "") not in ("", "0")
+
+
+def use_mapped_weights():
+    """Whether models load from memory-mapped safetensors copies (see voxtext_weights)"""
+    return os.environ.get("VOXTEXT_MMAP_WEIGHTS", "") not in ("", "0")
+
+
+def configure_store(model_dir=None, mirror=None, offline=None, mmap_weights=None):
+    """
+    Point this process (and worker processes it starts) at a model store,
+    mirror, offline mode and weight format. Empty values restore the
+    defaults; None leaves a setting unchanged.
+    """
+    for var, value in (("VOXTEXT_MODEL_DIR", model_dir), ("VOXTEXT_MODEL_MIRROR", mirror)):
+        if value is None:
+            continue
+        if value:
+            os.environ[var] = str(value)
+        else:
+            os.environ.pop(var, None)
+    if offline is not None:
+        os.environ["VOXTEXT_OFFLINE"] = "1" if offline else "0"
+    if mmap_weights is not None:
+        os.environ["VOXTEXT_MMAP_WEIGHTS"] = "1" if mmap_weights else "0"
+
+
+def model_url(model_name):
+    """Download URL of an official Whisper model, or None for unknown names"""
+    from whisper import _MODELS
+    return _MODELS.get(model_name)
+
+
+def _names_by_file():
+    """Checkpoint file name -> model names using it (e.g. large-v3.pt -> large, large-v3)"""
+    from whisper import _MODELS
+    names = {}
+    for name, url in _MODELS.items():
+        names.setdefault(os.path.basename(url), []).append(name)
+    return names
+
+
+def expected_sha256(url):
+    # Whisper model URLs carry the checkpoint's SHA-256 as their second-to-last part
+    return url.split("/")[-2]
+
+
+def model_path(model_name, root=None):
+    """Where the model's checkpoint lives once downloaded"""
+    url = model_url(model_name)
+    if url is None:
+        return None
+    return Path(root or models_dir()) / os.path.basename(url)
+
+
+def _is_legacy_quantized(path):
+    """An int8 model pickled by an earlier Voxtext (now saved as .int8; see voxtext_quantize)"""
+    return ".int8-torch" in path.name
+
+
+def installed_models(root=None):
+    """
+    List (file name, model names, size_mb) for every checkpoint in the store.
+    Files Whisper does not know (e.g. fine-tunes) are listed with no names.
+    """
+    root = Path(root or models_dir())
+    if not root.exists():
+        return []
+    names = _names_by_file()
+    return [
+        (path.name, names.get(path.name, []), path.stat().st_size / (1024 * 1024))
+        for path in sorted(root.glob("*.pt")) if not _is_legacy_quantized(path)
+    ]
+
+
+def sha256_file(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _open(url, offset, insecure=False):
+    request = urllib.request.Request(url, headers={"User-Agent": "Voxtext"})
+    if offset:
+        request.add_header("Range", f"bytes={offset}-")
+    context = ssl._create_unverified_context() if insecure else None
+    return urllib.request.urlopen(request, timeout=30, context=context)
+
+
+def _fetch(url, part_path, progress, is_cancelled, insecure):
+    """Append the rest of the file to part_path; returns the bytes now on disk"""
+    offset = part_path.stat().st_size if part_path.exists() else 0
+    with _open(url, offset, insecure) as response:
+        if offset and response.status != 206:
+            # Server ignored the range: start over
+            offset = 0
+        length = int(response.headers.get("Content-Length", 0))
+        total = offset + length if length else None
+        
+        with open(part_path, 'ab' if offset else 'wb') as f:
+            done = offset
+            progress(done, total)
+            reported = time.monotonic()
+            while True:
+                if is_cancelled():
+                    from voxtext_engine import TranscriptionCancelled
+                    raise TranscriptionCancelled()
+                block = response.read(BLOCK_SIZE)
+                if not block:
+                    break
+                f.write(block)
+                done += len(block)
+                if time.monotonic() - reported >= PROGRESS_INTERVAL_SECONDS:
+                    reported = time.monotonic()
+                    progress(done, total)
+            progress(done, total)
+    if total and done < total:
+        raise ConnectionError(f"connection closed after {done} of {total} bytes")
+    return done
+
+
+def _copy(source, part_path, progress, is_cancelled):
+    """Copy a mirrored model file with the same progress reports as a download"""
+    total = source.stat().st_size
+    with open(source, 'rb') as src, open(part_path, 'wb') as dst:
+        done = 0
+        reported = time.monotonic()
+        for block in iter(lambda: src.read(BLOCK_SIZE * 8), b''):
+            if is_cancelled():
+                from voxtext_engine import TranscriptionCancelled
+                raise TranscriptionCancelled()
+            dst.write(block)
+            done += len(block)
+            if time.monotonic() - reported >= PROGRESS_INTERVAL_SECONDS:
+                reported = time.monotonic()
+                progress(done, total)
+    progress(done, total)
+
+
+def _download(model_name, url, part_path, progress, is_cancelled):
+    """Download into part_path, resuming after dropped connections"""
+    insecure = False
+    for attempt in range(RETRIES + 1):
+        try:
+            _fetch(url, part_path, progress, is_cancelled, insecure)
+            break
+        except urllib.error.HTTPError as e:
+            if e.code == 416:  # range not satisfiable: the part is already complete
+                break
+            raise ModelDownloadError(f"Downloading {model_name} failed: HTTP {e.code}") from e
+        except (urllib.error.URLError, OSError) as e:
+            if "CERTIFICATE_VERIFY_FAILED" in str(e) and not insecure:
+                # Broken corporate SSL setups; download_model()'s SHA-256 check still guards the file
+                insecure = True
+                continue
+            if attempt == RETRIES:
+                raise ModelDownloadError(
+                    f"Downloading {model_name} failed after {RETRIES + 1} attempts: {e}"
+                ) from e
+            time.sleep(RETRY_DELAY_SECONDS)
+
+
+_download_locks = {}
+_download_locks_guard = threading.Lock()
+
+
+def download_model(model_name, root=None, progress=None, is_cancelled=None):
+    """
+    Fetch one model into the store (if not already there) and return its
+    path: copied from the mirror when it has the file, otherwise downloaded
+    (unless offline). New files are SHA-256 verified before they enter the
+    store; files already there are trusted.
+    progress(done_bytes, total_bytes) is called a few times a second; total
+    may be None when the server does not say. Concurrent calls for the same
+    model share one download.
+    """
+    url = model_url(model_name)
+    if url is None:
+        raise ModelDownloadError(f"Unknown model: {model_name}")
+    progress = progress or (lambda done, total: None)
+    is_cancelled = is_cancelled or (lambda: False)
+    
+    path = model_path(model_name, root)
+    with _download_locks_guard:
+        lock = _download_locks.setdefault(str(path), threading.Lock())
+    
+    with lock:
+        if path.exists():
+            return path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        part_path = path.with_name(path.name + ".part")  # kept between runs to resume
+        
+        mirror = mirror_dir()
+        if mirror is not None and (mirror / path.name).is_file():
+            _copy(mirror / path.name, part_path, progress, is_cancelled)
+        elif is_offline():
+            where = f" or in the mirror folder {mirror}" if mirror else ""
+            raise ModelDownloadError(
+                f"The {model_name} model is not in the model store ({path.parent}){where}, "
+                f"and downloads are turned off (offline mode)."
+            )
+        else:
+            _download(model_name, url, part_path, progress, is_cancelled)
+        
+        if sha256_file(part_path) != expected_sha256(url):
+            part_path.unlink()
+            raise ModelDownloadError(
+                f"The new {model_name} model file failed its SHA-256 check and was deleted. Please try again."
+            )
+        os.replace(part_path, path)
+        return path
+
+
+def download_models(model_names, root=None, workers=3, progress=None, is_cancelled=None, on_done=None):
+    """
+    Download several models at once. progress(model_name, done, total) is
+    called from the download threads. Returns {model_name: path}. With
+    on_done(model_name, error) each finished download (error is None on
+    success) is reported there instead of the first failure being raised.
+    """
+    progress = progress or (lambda name, done, total: None)
+    
+    def fetch(name):
+        try:
+            path = download_model(
+                name, root, lambda done, total: progress(name, done, total), is_cancelled
+            )
+        except BaseException as e:
+            if on_done is None:
+                raise
+            on_done(name, e)
+            return None
+        if on_done is not None:
+            on_done(name, None)
+        return path
+    
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {name: pool.submit(fetch, name) for name in dict.fromkeys(model_names)}
+    paths = {name: future.result() for name, future in futures.items()}
+    return {name: path for name, path in paths.items() if path is not None}
+
+
+def export_models(bundle_path, model_names=None, root=None, progress=None, is_cancelled=None):
+    """
+    Write models from the store into a .zip bundle for another machine
+    (all installed official models when model_names is None). Checkpoints
+    are stored uncompressed; they do not compress. Returns the names exported.
+    is_cancelled() is polled between blocks.
+    """
+    from whisper import _MODELS
+    from voxtext_engine import TranscriptionCancelled
+    
+    root = Path(root or models_dir())
+    progress = progress or (lambda message: None)
+    is_cancelled = is_cancelled or (lambda: False)
+    if model_names is None:
+        model_names = [name for name in _MODELS if model_path(name, root).exists()]
+    
+    manifest = {}
+    files = {}
+    for name in model_names:
+        path = model_path(name, root)
+        if path is None or not path.exists():
+            raise ModelDownloadError(f"The {name} model is not in the model store ({root})")
+        manifest[name] = {'file': path.name, 'sha256': expected_sha256(model_url(name))}
+        files[path.name] = path
+    
+    bundle_path = Path(bundle_path)
+    tmp_path = bundle_path.with_name(bundle_path.name + ".part")
+    try:
+        with zipfile.ZipFile(tmp_path, 'w', zipfile.ZIP_STORED, allowZip64=True) as bundle:
+            bundle.writestr(BUNDLE_MANIFEST, json.dumps(manifest, indent=2))
+            for file_name, path in files.items():
+                progress(f"Exporting {file_name}...")
+                with open(path, 'rb') as src, bundle.open(file_name, 'w', force_zip64=True) as dst:
+                    for block in iter(lambda: src.read(BLOCK_SIZE * 8), b''):
+                        if is_cancelled():
+                            raise TranscriptionCancelled()
+                        dst.write(block)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    os.replace(tmp_path, bundle_path)
+    return list(manifest)
+
+
+def import_models(source, root=None, progress=None, is_cancelled=None):
+    """
+    Add models to the store from a bundle made by export_models() or from a
+    folder of checkpoint files. Every file is SHA-256 checked before it is
+    added. Returns the names imported. is_cancelled() is polled between blocks.
+    """
+    from voxtext_engine import TranscriptionCancelled
+    
+    root = Path(root or models_dir())
+    root.mkdir(parents=True, exist_ok=True)
+    progress = progress or (lambda message: None)
+    is_cancelled = is_cancelled or (lambda: False)
+    names_by_file = _names_by_file()
+    source = Path(source)
+    imported = []
+    
+    def add(file_name, open_source):
+        names = names_by_file.get(file_name)
+        if not names:
+            return
+        target = root / file_name
+        if target.exists():
+            imported.extend(names)
+            return
+        progress(f"Importing {file_name}...")
+        part_path = target.with_name(target.name + ".import")
+        try:
+            with open_source() as src, open(part_path, 'wb') as dst:
+                for block in iter(lambda: src.read(BLOCK_SIZE * 8), b''):
+                    if is_cancelled():
+                        raise TranscriptionCancelled()
+                    dst.write(block)
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
+        if sha256_file(part_path) != expected_sha256(model_url(names[0])):
+            part_path.unlink()
+            raise ModelDownloadError(f"{file_name} in {source.name} failed its SHA-256 check")
+        os.replace(part_path, target)
+        imported.extend(names)
+    
+    if source.is_dir():
+        for path in sorted(source.glob("*.pt")):
+            if _is_legacy_quantized(path):
+                continue
+            add(path.name, lambda path=path: open(path, 'rb'))
+    else:
+        with zipfile.ZipFile(source) as bundle:
+            for file_name in bundle.namelist():
+                add(file_name, lambda file_name=file_name: bundle.open(file_name))
+    return imported
@@ -0,0 +1,277 @@
+"""
+Voxtext parallel batch scheduler
+
+Runs several transcriptions at once in a pool of worker processes so batch
+throughput scales with CPU cores instead of being capped by one
+model.transcribe() call. Each worker process loads its own copy of the model
+once and keeps it for every file it is handed; torch's intra-op thread count
+is split between workers so they do not oversubscribe the CPU.
+"""
+
+import os
+import queue
+import multiprocessing
+
+from voxtext_engine import (
+    TranscriptionEngine, TranscriptionCancelled, ensure_local_ffmpeg_on_path, describe_error,
+    describe_bytes
+)
+
+DEFAULT_THREADS_PER_WORKER = 4
+
+
+def cpu_cores():
+    return os.cpu_count() or 1
+
+
+def worker_split(workers=None, threads_per_worker=None, cores=None):
+    """
+    Resolve how many worker processes to run and how many torch threads each
+    one gets. Whatever is not given is derived from the number of CPU cores.
+    """
+    cores = cores or cpu_cores()
+    if workers is None and threads_per_worker is None:
+        threads_per_worker = min(DEFAULT_THREADS_PER_WORKER, cores)
+    if workers is None:
+        workers = max(1, cores // threads_per_worker)
+    if threads_per_worker is None:
+        threads_per_worker = max(1, cores // workers)
+    return max(1, workers), max(1, threads_per_worker)
+
+
+# === Worker process side ===
+_worker_engine = None
+_worker_events = None
+
+
+def _init_worker(model_name, output_formats, output_dir, lms_settings, options, threads, events):
+    """Pool initializer: pin thread counts and build this process's engine"""
+    global _worker_engine, _worker_events
+    
+    # Must be set before torch spins up its thread pools
+    for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS"):
+        os.environ[var] = str(threads)
+    try:
+        import torch
+        torch.set_num_threads(threads)
+        torch.set_num_interop_threads(1)
+    except (ImportError, RuntimeError):
+        pass
+    
+    ensure_local_ffmpeg_on_path()
+    _worker_events = events
+    _worker_engine = TranscriptionEngine(
+        model_name, output_formats, output_dir, lms_settings, options=options
+    )
+
+
+def _transcribe_job(job):
+    """Transcribe one queued file inside a worker process"""
+    index, file_path = job
+    _worker_events.put(('started', index))
+    
+    def on_progress(message, percentage):
+        _worker_events.put(('progress', index, message, percentage))
+    
+    _worker_engine.progress = on_progress
+    try:
+        created_files = _worker_engine.transcribe_file(file_path)
+    except Exception as e:
+        _worker_events.put(('failed', index, describe_error(e)))
+    else:
+        _worker_events.put(('metrics', index, _worker_engine.metrics.finish()))
+        _worker_events.put(('finished', index, created_files))
+
+
+# === Parent process side ===
+class ParallelScheduler:
+    """
+    Process-pool counterpart of TranscriptionEngine.transcribe_files().
+    Takes the same callbacks; cancelling terminates the worker processes, so
+    in-flight transcriptions stop immediately.
+    """
+    
+    def __init__(self, model_name, output_formats, output_dir=None, lms_settings=None,
+                 workers=None, threads_per_worker=None, progress=None, is_cancelled=None, options=None):
+        self.model_name = model_name
+        self.output_formats = output_formats
+        self.output_dir = output_dir
+        self.lms_settings = lms_settings or {}
+        # Pool workers are daemonic and cannot start chunk pools of their own
+        self.options = dict(options or {})
+        self.options['chunk_workers'] = min(self.options.get('chunk_workers', 0), 1)
+        self.workers, self.threads_per_worker = worker_split(workers, threads_per_worker)
+        self.progress = progress or (lambda message, percentage: None)
+        self.is_cancelled = is_cancelled or (lambda: False)
+    
+    def transcribe_files(self, file_paths, on_started=None, on_finished=None, on_failed=None, on_metrics=None):
+        """Transcribe a queue of files across the pool, returning all created paths"""
+        file_paths = list(file_paths)
+        if not file_paths:
+            return []
+        
+        self._prepare_model()
+        
+        # Spawn (not fork) so workers start clean on every OS and never inherit Qt state
+        ctx = multiprocessing.get_context("spawn")
+        events = ctx.Queue()
+        workers = min(self.workers, len(file_paths))
+        self.progress(
+            f"Starting {workers} parallel workers ({self.threads_per_worker} threads each)...", 0
+        )
+        pool = ctx.Pool(
+            workers,
+            initializer=_init_worker,
+            initargs=(self.model_name, self.output_formats, self.output_dir,
+                      self.lms_settings, self.options, self.threads_per_worker, events)
+        )
+        
+        item_progress = [0] * len(file_paths)
+        all_created = []
+        remaining = len(file_paths)
+        cancelled = False
+        settled = False
+        try:
+            jobs = pool.map_async(_transcribe_job, list(enumerate(file_paths)), chunksize=1)
+            while remaining:
+                if self.is_cancelled():
+                    raise TranscriptionCancelled()
+                try:
+                    event = events.get(timeout=0.2)
+                except queue.Empty:
+                    # All jobs have returned; allow one more poll for events still
+                    # in flight from the worker queues before giving up on them.
+                    if jobs.ready():
+                        jobs.get()  # re-raises a pool-level failure
+                        if settled:
+                            break
+                        settled = True
+                    continue
+                
+                kind, index = event[0], event[1]
+                if kind == 'started':
+                    if on_started:
+                        on_started(index)
+                elif kind == 'progress':
+                    item_progress[index] = event[3]
+                    overall = sum(item_progress) / len(file_paths)
+                    self.progress(f"{os.path.basename(file_paths[index])}: {event[2]}", int(overall))
+                elif kind == 'metrics':
+                    if on_metrics:
+                        on_metrics(index, event[2])
+                elif kind == 'finished':
+                    item_progress[index] = 100
+                    remaining -= 1
+                    all_created.extend(event[2])
+                    if on_finished:
+                        on_finished(index, event[2])
+                elif kind == 'failed':
+                    item_progress[index] = 100
+                    remaining -= 1
+                    if on_failed:
+                        on_failed(index, event[2])
+        except BaseException:
+            cancelled = True
+            raise
+        finally:
+            if cancelled:
+                pool.terminate()
+            else:
+                pool.close()
+            pool.join()
+        return all_created
+    
+    def _prepare_model(self):
+        """Fetch and convert the model here once; workers doing it side by side would collide"""
+        from voxtext_backends import get_backend
+        
+        def on_download(done, total):
+            self.progress(f"Downloading {self.model_name} model: {describe_bytes(done, total)}", 0)
+        
+        get_backend(self.options.get('backend')).prepare(
+            self.model_name, on_download, self.is_cancelled, self.options.get('quantize', False)
+        )
+
+
+# === Long-file chunk workers ===
+_chunk_model_name = None
+_chunk_quantize = False
+_chunk_backend = None
+
+
+def _init_chunk_worker(model_name, threads, quantize=False, backend='whisper'):
+    """Pool initializer for chunk workers: pin thread counts, remember the model"""
+    global _chunk_model_name, _chunk_quantize, _chunk_backend
+    from voxtext_backends import get_backend
+    
+    for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS"):
+        os.environ[var] = str(threads)
+    try:
+        import torch
+        torch.set_num_threads(threads)
+        torch.set_num_interop_threads(1)
+    except (ImportError, RuntimeError):
+        pass
+    _chunk_model_name = model_name
+    _chunk_quantize = quantize
+    _chunk_backend = get_backend(backend)
+
+
+def _transcribe_chunk(job):
+    """Transcribe one slice of a memory-mapped PCM file inside a worker process"""
+    import numpy as np
+    from voxtext_engine import MODEL_CACHE
+    
+    index, pcm_path, start, end, decode_options = job
+    audio = np.ascontiguousarray(np.load(pcm_path, mmap_mode='c')[start:end])
+    model = MODEL_CACHE.get(
+        _chunk_backend.cache_key(_chunk_model_name, _chunk_quantize),
+        lambda key: _chunk_backend.load(_chunk_model_name, quantize=_chunk_quantize),
+        _chunk_backend.unload
+    )
+    return index, _chunk_backend.transcribe(model, audio, decode_options)
+
+
+def transcribe_chunks(model_name, pcm_path, spans, decode_options, workers=None,
+                      threads_per_worker=None, progress=None, is_cancelled=None, quantize=False,
+                      backend='whisper'):
+    """
+    Transcribe sample spans of a saved .npy PCM buffer across a process pool.
+    Returns the results in span order; progress(done, total) is called
+    as each chunk completes.
+    """
+    progress = progress or (lambda done, total: None)
+    is_cancelled = is_cancelled or (lambda: False)
+    workers, threads = worker_split(workers, threads_per_worker)
+    workers = min(workers, len(spans))
+    
+    ctx = multiprocessing.get_context("spawn")
+    pool = ctx.Pool(
+        workers, initializer=_init_chunk_worker, initargs=(model_name, threads, quantize, backend)
+    )
+    results = [None] * len(spans)
+    cancelled = False
+    try:
+        jobs = [(i, pcm_path, start, end, decode_options) for i, (start, end) in enumerate(spans)]
+        pending = pool.imap_unordered(_transcribe_chunk, jobs)
+        done = 0
+        while done < len(spans):
+            if is_cancelled():
+                raise TranscriptionCancelled()
+            try:
+                index, result = pending.next(timeout=0.2)
+            except multiprocessing.TimeoutError:
+                continue
+            results[index] = result
+            done += 1
+            progress(done, len(spans))
+    except BaseException:
+        cancelled = True
+        raise
+    finally:
+        if cancelled:
+            pool.terminate()
+        else:
+            pool.close()
+        pool.join()
+    return results
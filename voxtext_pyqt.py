@@ -18,37 +18,28 @@ import os
 import threading
 import multiprocessing
 from pathlib import Path
-import json
 import time
 import webbrowser
 
-# Ensure bundled FFmpeg is on PATH before any Whisper usage
-def _ensure_local_ffmpeg_on_path():
-    """
-    Add bundled ffmpeg to PATH early in application startup.
-    Works for both .py scripts and compiled executables.
-    """
-    try:
-        if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
-            exe_dir = sys._MEIPASS
-        else:
-            exe_dir = os.path.dirname(os.path.abspath(__file__))
-        
-        local_ffmpeg_dir = os.path.join(exe_dir, "ffmpeg")
-        
-        if os.path.isdir(local_ffmpeg_dir):
-            os.environ["PATH"] = local_ffmpeg_dir + os.pathsep + os.environ.get("PATH", "")
-    except Exception:
-        pass
+STARTUP_BEGAN = time.perf_counter()  # cold-start timing, reported in Help > About
 
-_ensure_local_ffmpeg_on_path()
+from voxtext_engine import (
+    AUDIO_EXTENSIONS, VIDEO_EXTENSIONS, VTT_PRESETS, DEFAULT_MODEL_BUDGET_MB, MODEL_CACHE,
+    TranscriptionEngine, TranscriptionCancelled, ensure_local_ffmpeg_on_path, describe_error,
+    find_media_files, export_transcript, whisper_available, warm_up_whisper,
+    describe_bytes, MODEL_NAMES
+)
+from voxtext_writers import WORD_CUE_MODES
+from voxtext_backends import BACKENDS, DEFAULT_BACKEND, get_backend
+from voxtext_parallel import ParallelScheduler, cpu_cores, worker_split
+from voxtext_models import configure_store, models_dir, mirror_dir, installed_models
+
+# Ensure bundled FFmpeg is on PATH before any Whisper usage
+ensure_local_ffmpeg_on_path()
 
-# Try to import Whisper
-try:
-    import whisper
-    WHISPER_AVAILABLE = True
-except ImportError:
-    WHISPER_AVAILABLE = False
+# Only look Whisper up here; importing it (and torch) happens after the window is shown
+WHISPER_AVAILABLE = whisper_available()
+if not WHISPER_AVAILABLE:
     print("Note: openai-whisper not installed. Use 'Install Whisper' button or run: pip install openai-whisper")
 
 # PyQt6 imports
@@ -57,10 +48,10 @@ from PyQt6.QtWidgets import (
     QLabel, QPushButton, QRadioButton, QCheckBox, QProgressBar,
     QFileDialog, QMessageBox, QButtonGroup, QFrame, QComboBox,
     QLineEdit, QTextEdit, QScrollArea, QDialog, QMenuBar, QMenu,
-    QGroupBox, QSizePolicy
+    QGroupBox, QSizePolicy, QInputDialog, QListWidget, QListWidgetItem, QSpinBox, QDoubleSpinBox
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QUrl, QMimeData
-from PyQt6.QtGui import QFont, QAction, QDragEnterEvent, QDropEvent, QDesktopServices
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal, QUrl, QMimeData, QSettings
+from PyQt6.QtGui import QFont, QFontDatabase, QAction, QActionGroup, QDragEnterEvent, QDropEvent, QDesktopServices, QTextCursor
 
 
 # === TPC-STYLE COLOR PALETTE ===
@@ -83,223 +74,238 @@ COLORS = {
 }
 
 
-class TranscriptionWorker(QThread):
-    """Worker thread for transcription to keep UI responsive"""
-    progress = pyqtSignal(str, int)  # message, percentage
-    finished = pyqtSignal(list)  # list of created files
-    error = pyqtSignal(str)  # error message
+class WarmUpWorker(QThread):
+    """Imports Whisper and torch in the background once the window is up"""
+    ready = pyqtSignal(float)  # seconds the import took
+    failed = pyqtSignal(str)
     
-    def __init__(self, file_path, model_name, output_formats, output_dir, lms_settings=None):
+    def run(self):
+        try:
+            self.ready.emit(warm_up_whisper())
+        except Exception as e:
+            self.failed.emit(describe_error(e))
+
+
+class ModelPreloader(QThread):
+    """Loads (downloading if needed) a model into the shared cache ahead of a transcription"""
+    ready = pyqtSignal(str, float)  # model name, seconds taken
+    failed = pyqtSignal(str, str)  # model name, error message
+    downloading = pyqtSignal(str)  # download progress text
+    
+    def __init__(self, model_name, model_cache, quantize=False, backend=DEFAULT_BACKEND):
         super().__init__()
-        self.file_path = file_path
         self.model_name = model_name
-        self.output_formats = output_formats
-        self.output_dir = output_dir
-        self.lms_settings = lms_settings or {}
+        self.model_cache = model_cache
+        self.quantize = quantize
+        self.backend = get_backend(backend)
         self.cancelled = False
-        self.model = None
     
     def run(self):
+        started = time.perf_counter()
+        
+        def on_download(done, total):
+            self.downloading.emit(f"Downloading {self.model_name} model: {describe_bytes(done, total)}")
+        
+        def loader(key):
+            return self.backend.load(self.model_name, on_download, lambda: self.cancelled, self.quantize)
+        
         try:
-            import whisper
-            import ssl
-            import urllib.request
-            
-            if self.cancelled:
-                return
-            
-            # Load model
-            self.progress.emit(f"Loading {self.model_name} model (first time downloads)...", 5)
-            
-            try:
-                self.model = whisper.load_model(self.model_name)
-            except urllib.error.URLError as ssl_error:
-                if "CERTIFICATE_VERIFY_FAILED" in str(ssl_error):
-                    ssl._create_default_https_context = ssl._create_unverified_context
-                    self.model = whisper.load_model(self.model_name)
-                else:
-                    raise
-            
-            if self.cancelled:
-                return
-            
-            self.progress.emit("Model loaded successfully.", 10)
-            
-            # Transcribe
-            self.progress.emit("Transcribing audio... This may take several minutes.", 20)
-            result = self.model.transcribe(
-                self.file_path,
-                language="en",
-                task="transcribe"
-            )
-            
-            if self.cancelled:
-                return
-            
-            self.progress.emit("Transcription complete. Writing output files...", 80)
-            
-            # Write output files
-            base_path = Path(self.file_path).stem
-            created_files = []
-            num_formats = len(self.output_formats)
-            progress_per_format = 15 / num_formats if num_formats > 0 else 15
-            current_progress = 80
-            
-            if 'txt' in self.output_formats:
-                if self.cancelled:
-                    return
-                txt_path = self.output_dir / f"{base_path}_transcript.txt"
-                with open(txt_path, 'w', encoding='utf-8') as f:
-                    f.write(result['text'])
-                created_files.append(str(txt_path))
-                current_progress += progress_per_format
-                self.progress.emit(f"Created {txt_path.name}", int(current_progress))
-            
-            if 'srt' in self.output_formats:
-                if self.cancelled:
-                    return
-                srt_path = self.output_dir / f"{base_path}_transcript.srt"
-                self._write_srt(result, srt_path)
-                created_files.append(str(srt_path))
-                current_progress += progress_per_format
-                self.progress.emit(f"Created {srt_path.name}", int(current_progress))
-            
-            if 'vtt' in self.output_formats:
-                if self.cancelled:
-                    return
-                vtt_path = self.output_dir / f"{base_path}_transcript.vtt"
-                self._write_vtt(result, vtt_path)
-                created_files.append(str(vtt_path))
-                current_progress += progress_per_format
-                self.progress.emit(f"Created {vtt_path.name}", int(current_progress))
-            
-            if 'html' in self.output_formats:
-                if self.cancelled:
-                    return
-                html_path = self.output_dir / f"{base_path}_transcript.html"
-                self._write_html(result, html_path)
-                created_files.append(str(html_path))
-                current_progress += progress_per_format
-                self.progress.emit(f"Created {html_path.name}", int(current_progress))
-            
-            if 'md' in self.output_formats:
-                if self.cancelled:
-                    return
-                md_path = self.output_dir / f"{base_path}_transcript.md"
-                self._write_markdown(result, md_path)
-                created_files.append(str(md_path))
-                current_progress += progress_per_format
-                self.progress.emit(f"Created {md_path.name}", int(current_progress))
-            
-            if 'json' in self.output_formats:
-                if self.cancelled:
-                    return
-                json_path = self.output_dir / f"{base_path}_transcript.json"
-                with open(json_path, 'w', encoding='utf-8') as f:
-                    json.dump(result, f, indent=2, ensure_ascii=False)
-                created_files.append(str(json_path))
-                current_progress += progress_per_format
-                self.progress.emit(f"Created {json_path.name}", int(current_progress))
-            
-            if not self.cancelled:
-                self.finished.emit(created_files)
-                
-        except FileNotFoundError as e:
-            if not self.cancelled:
-                if 'ffmpeg' in str(e).lower():
-                    error_msg = (
-                        "FFmpeg not found!\n\n"
-                        "Whisper requires FFmpeg to process audio/video files.\n\n"
-                        "To install on Mac:\n"
-                        "  brew install ffmpeg\n\n"
-                        "To install on Windows:\n"
-                        "  Download from ffmpeg.org\n\n"
-                        "To install on Linux:\n"
-                        "  sudo apt install ffmpeg"
-                    )
-                else:
-                    error_msg = str(e)
-                self.error.emit(error_msg)
+            self.model_cache.get(self.backend.cache_key(self.model_name, self.quantize), loader, self.backend.unload)
+        except TranscriptionCancelled:
+            pass  # the partial download is kept and resumes next time
         except Exception as e:
-            if not self.cancelled:
-                self.error.emit(str(e))
-    
-    def _write_srt(self, result, output_path):
-        """Write SRT subtitle format"""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            for i, segment in enumerate(result['segments'], start=1):
-                start = self._format_timestamp(segment['start'], use_comma=True)
-                end = self._format_timestamp(segment['end'], use_comma=True)
-                text = segment['text'].strip()
-                f.write(f"{i}\n")
-                f.write(f"{start} --> {end}\n")
-                f.write(f"{text}\n\n")
-    
-    def _write_vtt(self, result, output_path):
-        """Write WebVTT subtitle format with optional LMS styling"""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write("WEBVTT\n")
-            
-            # Add STYLE block if LMS styling is enabled
-            if self.lms_settings.get('enabled'):
-                css_content = self.lms_settings.get('css', '').strip()
-                if css_content:
-                    f.write("\nSTYLE\n")
-                    f.write(css_content)
-                    f.write("\n")
-            
-            f.write("\n")
-            
-            # Get cue settings if LMS styling is enabled
-            cue_settings = ""
-            if self.lms_settings.get('enabled'):
-                cue_settings = self.lms_settings.get('cue_settings', '').strip()
-                if cue_settings:
-                    cue_settings = " " + cue_settings
-            
-            for segment in result['segments']:
-                start = self._format_timestamp(segment['start'], use_comma=False)
-                end = self._format_timestamp(segment['end'], use_comma=False)
-                text = segment['text'].strip()
-                f.write(f"{start} --> {end}{cue_settings}\n")
-                f.write(f"{text}\n\n")
-    
-    def _write_html(self, result, output_path):
-        """Write HTML format with collapsible details tag"""
-        html_content = f"""<h3>Full Transcript</h3>
-<details>
-<summary>Click to expand transcript</summary>
+            self.failed.emit(self.model_name, describe_error(e))
+        else:
+            self.ready.emit(self.model_name, time.perf_counter() - started)
+    
+    def cancel(self):
+        """Stop a download between blocks (reading a downloaded model finishes first)"""
+        self.cancelled = True
 
-{result['text']}
 
-</details>
+class ModelDownloadWorker(QThread):
+    """Downloads several models at once (resumable, checksummed)"""
+    progress = pyqtSignal(str, float, float)  # model name, MB done, MB total (0 = unknown)
+    model_done = pyqtSignal(str, str)  # model name, error message ('' = success)
+    
+    def __init__(self, model_names):
+        super().__init__()
+        self.model_names = model_names
+        self.cancelled = False
+    
+    def run(self):
+        from voxtext_models import download_models
+        
+        mb = 1024 * 1024
+        
+        def on_done(name, error):
+            if error is None:
+                self.model_done.emit(name, "")
+            elif isinstance(error, TranscriptionCancelled):
+                self.model_done.emit(name, "Cancelled (resumes next time)")
+            else:
+                self.model_done.emit(name, describe_error(error))
+        
+        download_models(
+            self.model_names,
+            progress=lambda name, done, total: self.progress.emit(name, done / mb, (total or 0) / mb),
+            is_cancelled=lambda: self.cancelled,
+            on_done=on_done
+        )
+    
+    def cancel(self):
+        self.cancelled = True
+
 
-<p><em>Transcribed with Voxtext using OpenAI Whisper</em></p>"""
+class ModelBundleWorker(QThread):
+    """Imports or exports a model bundle (multi-GB copies) off the UI thread"""
+    progress = pyqtSignal(str)
+    done = pyqtSignal(str, list)  # "import"/"export", model names
+    failed = pyqtSignal(str)
+    
+    def __init__(self, kind, bundle_path):
+        super().__init__()
+        self.kind = kind
+        self.bundle_path = bundle_path
+        self.cancelled = False
+    
+    def run(self):
+        from voxtext_models import import_models, export_models
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        copy = import_models if self.kind == "import" else export_models
+        try:
+            names = copy(self.bundle_path, progress=self.progress.emit, is_cancelled=lambda: self.cancelled)
+        except TranscriptionCancelled:
+            pass  # the partial file is removed
+        except Exception as e:
+            self.failed.emit(describe_error(e))
+        else:
+            self.done.emit(self.kind, names)
     
-    def _write_markdown(self, result, output_path):
-        """Write Markdown format"""
-        md_content = f"""# Transcript
+    def cancel(self):
+        self.cancelled = True
 
-{result['text']}
 
----
+class QuantizationCompareWorker(QThread):
+    """Runs the fp32 vs int8 comparison on a reference clip off the UI thread"""
+    progress = pyqtSignal(str)
+    done = pyqtSignal(str)  # summary text
+    failed = pyqtSignal(str)
+    
+    def __init__(self, model_name, clip_path):
+        super().__init__()
+        self.model_name = model_name
+        self.clip_path = clip_path
+        self.cancelled = False
+    
+    def run(self):
+        from voxtext_quantize import compare_quantized, describe_comparison
+        
+        try:
+            report = compare_quantized(
+                self.model_name, self.clip_path, progress=self.progress.emit, is_cancelled=lambda: self.cancelled
+            )
+        except TranscriptionCancelled:
+            pass
+        except Exception as e:
+            self.failed.emit(describe_error(e))
+        else:
+            self.done.emit(describe_comparison(report))
+    
+    def cancel(self):
+        self.cancelled = True
 
-*Transcribed with Voxtext using OpenAI Whisper*
-"""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(md_content)
-    
-    def _format_timestamp(self, seconds, use_comma=True):
-        """Format seconds as SRT/VTT timestamp"""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millisecs = int((seconds % 1) * 1000)
-        separator = ',' if use_comma else '.'
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}{separator}{millisecs:03d}"
+
+class BenchmarkWorker(QThread):
+    """Benchmarks the installed models and backends off the UI thread"""
+    progress = pyqtSignal(str)
+    done = pyqtSignal(list)  # benchmark runs
+    failed = pyqtSignal(str)
+    
+    def __init__(self, targets, quantize=False, clip_path=None):
+        super().__init__()
+        self.targets = targets
+        self.quantize = quantize
+        self.clip_path = clip_path
+        self.cancelled = False
+    
+    def run(self):
+        from voxtext_bench import run_benchmarks
+        
+        try:
+            runs = run_benchmarks(
+                self.targets, self.clip_path, quantize=self.quantize, progress=self.progress.emit,
+                is_cancelled=lambda: self.cancelled
+            )
+        except TranscriptionCancelled:
+            self.done.emit([])
+        except Exception as e:
+            self.failed.emit(describe_error(e))
+        else:
+            self.done.emit(runs)
+
+
+class TranscriptionWorker(QThread):
+    """Worker thread that transcribes a queue of files with one loaded model"""
+    progress = pyqtSignal(str, int)  # message, overall percentage
+    item_started = pyqtSignal(int)  # queue index
+    item_finished = pyqtSignal(int, list)  # queue index, files created for it
+    item_failed = pyqtSignal(int, str)  # queue index, error message
+    item_metrics = pyqtSignal(int, dict)  # queue index, stage timings and resource use
+    partial_text = pyqtSignal(str)  # transcript text as Whisper decodes it
+    finished = pyqtSignal(list)  # list of all created files
+    error = pyqtSignal(str)  # fatal error message (e.g. model failed to load)
+    stopped = pyqtSignal()  # run() returned after a cancel request
+    
+    def __init__(self, file_paths, model_name, output_formats, output_dir=None, lms_settings=None,
+                 model_cache=None, parallel_jobs=1, options=None):
+        super().__init__()
+        self.file_paths = list(file_paths)
+        self.cancelled = False
+        if parallel_jobs > 1 and len(self.file_paths) > 1:
+            # Separate worker processes, each with its own model copy
+            self.engine = ParallelScheduler(
+                model_name,
+                output_formats,
+                output_dir,
+                lms_settings,
+                workers=parallel_jobs,
+                progress=self.progress.emit,
+                is_cancelled=lambda: self.cancelled,
+                options=options
+            )
+        else:
+            self.engine = TranscriptionEngine(
+                model_name,
+                output_formats,
+                output_dir,
+                lms_settings,
+                model_cache or MODEL_CACHE,
+                progress=self.progress.emit,
+                is_cancelled=lambda: self.cancelled,
+                options=options,
+                partial_text=self.partial_text.emit
+            )
+    
+    def run(self):
+        try:
+            created_files = self.engine.transcribe_files(
+                self.file_paths,
+                on_started=self.item_started.emit,
+                on_finished=self.item_finished.emit,
+                on_failed=self.item_failed.emit,
+                on_metrics=self.item_metrics.emit
+            )
+            if not self.cancelled:
+                self.finished.emit(created_files)
+        except TranscriptionCancelled:
+            pass
+        except Exception as e:
+            if not self.cancelled:
+                self.error.emit(describe_error(e))
+        finally:
+            if self.cancelled:
+                self.stopped.emit()
     
     def cancel(self):
         self.cancelled = True
@@ -307,37 +313,44 @@ class TranscriptionWorker(QThread):
 
 class VoxtextWindow(QMainWindow):
     """Main application window"""
+    whisper_installed = pyqtSignal(bool, str)  # success, error message; emitted by the install thread
     
     def __init__(self):
         super().__init__()
-        self.selected_file = None
+        self.queue = []  # [{'path': str, 'state': str, 'detail': str}]
+        self.running_indices = []  # queue index for each file handed to the worker
         self.worker = None
         self.start_time = None
         self.timer_id = None
+        self.warm_up_worker = None
+        self.startup_seconds = None  # process start -> window on screen
+        self.warm_up_seconds = None  # background Whisper/torch import
+        self.preload_worker = None
+        self.preload_pending = False  # selection changed while another model was pre-loading
+        self.benchmark_worker = None
+        self.whisper_installed.connect(self.on_whisper_installed)
+        
+        # Loaded models stay resident between jobs, bounded by a RAM budget
+        self.settings = QSettings()
+        configure_store(
+            self.settings.value("model_dir", ""),
+            self.settings.value("model_mirror", ""),
+            self.settings.value("offline", False, type=bool),
+            self.settings.value("mmap_weights", False, type=bool)
+        )
+        self.bundle_worker = None
+        self.compare_worker = None
+        self.model_cache = MODEL_CACHE
+        self.model_cache.set_budget(
+            self.settings.value("model_budget_mb", DEFAULT_MODEL_BUDGET_MB, type=int)
+        )
         
         # LMS VTT Styling Presets
-        self.vtt_presets = {
-            'Custom': {
-                'cue_settings': '',
-                'css': ''
-            },
-            'LMS Standard': {
-                'cue_settings': 'line:80%',
-                'css': '::cue {\n  background-color: rgb(0, 0, 0, 60%);\n  line-height: 1.5em;\n}'
-            },
-            'Lower Third': {
-                'cue_settings': 'line:90% align:start',
-                'css': '::cue {\n  background-color: rgba(0, 0, 0, 0.8);\n  color: #ffffff;\n  font-size: 1.1em;\n}'
-            },
-            'High Contrast': {
-                'cue_settings': 'line:85%',
-                'css': '::cue {\n  background-color: #000000;\n  color: #ffff00;\n  font-weight: bold;\n}'
-            }
-        }
+        self.vtt_presets = {name: dict(preset) for name, preset in VTT_PRESETS.items()}
         
         # File extensions
-        self.audio_extensions = {'.mp3', '.wav', '.m4a', '.flac', '.ogg', '.aac'}
-        self.video_extensions = {'.mp4', '.mov', '.avi', '.mkv', '.webm'}
+        self.audio_extensions = set(AUDIO_EXTENSIONS)
+        self.video_extensions = set(VIDEO_EXTENSIONS)
         
         self.init_ui()
         self.setAcceptDrops(True)
@@ -396,7 +409,7 @@ class VoxtextWindow(QMainWindow):
         self.drop_zone.mousePressEvent = lambda e: self.browse_file()
         
         drop_layout = QVBoxLayout(self.drop_zone)
-        self.drop_label = QLabel("Drag and drop file here (or click to browse)")
+        self.drop_label = QLabel("Drag and drop files or folders here (or click to browse)")
         self.drop_label.setFont(self.std_font)
         self.drop_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.drop_label.setStyleSheet(f"border: none; color: {COLORS['text_light']};")
@@ -419,6 +432,22 @@ class VoxtextWindow(QMainWindow):
         self.file_label.setStyleSheet(f"color: {COLORS['text_secondary']};")
         layout.addWidget(self.file_label)
         
+        # Batch queue (shown once more than one file is queued)
+        self.queue_list = QListWidget()
+        self.queue_list.setFont(self.std_font)
+        self.queue_list.setMaximumHeight(140)
+        self.queue_list.setStyleSheet(f"""
+            QListWidget {{
+                color: {COLORS['text']};
+                background-color: {COLORS['surface']};
+                border: 1px solid {COLORS['border']};
+                border-radius: 4px;
+                padding: 4px;
+            }}
+        """)
+        self.queue_list.setVisible(False)
+        layout.addWidget(self.queue_list)
+        
         # === TWO COLUMN LAYOUT: Model (left) | Output (right) ===
         columns_layout = QHBoxLayout()
         columns_layout.setSpacing(20)
@@ -451,6 +480,9 @@ class VoxtextWindow(QMainWindow):
             ('medium', '1.5GB', 'Professional', 'Slower'),
             ('large', '3GB', 'Maximum', 'Slowest')
         ]
+        last_model = self.settings.value("last_model", "medium")
+        if last_model not in [m[0] for m in models]:
+            last_model = 'medium'
         
         for name, size, quality, speed in models:
             rb = QRadioButton(f"{name.capitalize()} ({size})")
@@ -475,8 +507,9 @@ class VoxtextWindow(QMainWindow):
             rb.setProperty("model_name", name)
             self.model_group.addButton(rb)
             model_layout.addWidget(rb)
-            if name == 'medium':
+            if name == last_model:
                 rb.setChecked(True)
+        self.model_group.buttonToggled.connect(self.on_model_toggled)
         
         model_layout.addStretch()
         columns_layout.addWidget(model_frame)
@@ -501,7 +534,8 @@ class VoxtextWindow(QMainWindow):
             ('vtt', 'WebVTT (.vtt)', False),
             ('html', 'HTML (.html)', False),
             ('md', 'Markdown (.md)', False),
-            ('json', 'JSON', False)
+            ('json', 'JSON', False),
+            ('vxt', 'Binary (.vxt)', False)
         ]
         
         for key, label, default in formats:
@@ -629,6 +663,49 @@ class VoxtextWindow(QMainWindow):
         cue_row.addWidget(self.cue_settings)
         options_layout.addLayout(cue_row)
         
+        # Caption limits row: re-flow SRT/VTT cues to the LMS's line, speed and duration limits.
+        # Unlike the rest of this panel they change the SRT file too, and say so.
+        limits_row = QHBoxLayout()
+        self.limits_enabled = QCheckBox("Re-flow SRT + VTT cues:")
+        self.limits_enabled.setFont(self.std_font)
+        self.limits_enabled.setStyleSheet(f"color: {COLORS['text_light']}; background-color: transparent;")
+        self.limits_enabled.setToolTip(
+            "Split and merge segments into cues that meet these limits.\n"
+            "Applies to both the SRT and the VTT output."
+        )
+        limits_row.addWidget(self.limits_enabled)
+        self.limit_boxes = {}
+        limit_fields = [
+            ('max_chars_per_line', " chars/line", 10, 80, None),
+            ('max_lines', " lines", 1, 4, None),
+            ('max_cps', " chars/s", 5, 40, None),
+            ('min_duration', " s min", 0.5, 5.0, 0.1),
+            ('max_duration', " s max", 1.0, 15.0, 0.5),
+        ]
+        standard_limits = VTT_PRESETS['LMS Standard']['caption_limits']
+        for key, suffix, minimum, maximum, step in limit_fields:
+            box = QDoubleSpinBox() if step else QSpinBox()
+            if step:
+                box.setDecimals(1)
+                box.setSingleStep(step)
+            box.setRange(minimum, maximum)
+            box.setSuffix(suffix)
+            box.setValue(standard_limits[key])
+            box.setFont(self.std_font)
+            box.setStyleSheet(f"""
+                color: {COLORS['text']};
+                background-color: {COLORS['surface']};
+                border: 1px solid {COLORS['border']};
+                border-radius: 4px;
+                padding: 2px 4px;
+            """)
+            self.limits_enabled.toggled.connect(box.setEnabled)
+            self.limit_boxes[key] = box
+            limits_row.addWidget(box)
+        self.limits_enabled.setChecked(True)
+        limits_row.addStretch()
+        options_layout.addLayout(limits_row)
+        
         # CSS block
         css_label = QLabel("STYLE block:")
         css_label.setFont(self.std_font)
@@ -703,6 +780,43 @@ class VoxtextWindow(QMainWindow):
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.status_label)
         
+        # Live transcript preview (filled as Whisper decodes each window)
+        self.live_text = QTextEdit()
+        self.live_text.setReadOnly(True)
+        self.live_text.setFont(self.std_font)
+        self.live_text.setMaximumHeight(110)
+        self.live_text.setPlaceholderText("Transcript preview appears here as audio is decoded...")
+        self.live_text.setStyleSheet(f"""
+            QTextEdit {{
+                color: {COLORS['text_secondary']};
+                background-color: {COLORS['surface']};
+                border: 1px solid {COLORS['border_light']};
+                border-radius: 4px;
+                padding: 4px;
+            }}
+        """)
+        self.live_text.setVisible(False)
+        layout.addWidget(self.live_text)
+        
+        # Job details: stage timings and resource use of the selected (or last) file
+        self.details_text = QTextEdit()
+        self.details_text.setReadOnly(True)
+        self.details_text.setFont(QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont))
+        self.details_text.setMaximumHeight(170)
+        self.details_text.setPlaceholderText("Stage timings appear here when a file finishes...")
+        self.details_text.setStyleSheet(f"""
+            QTextEdit {{
+                color: {COLORS['text_secondary']};
+                background-color: {COLORS['surface']};
+                border: 1px solid {COLORS['border_light']};
+                border-radius: 4px;
+                padding: 4px;
+            }}
+        """)
+        self.details_text.setVisible(self.settings.value("show_job_details", False, type=bool))
+        layout.addWidget(self.details_text)
+        self.queue_list.currentRowChanged.connect(self.show_job_details)
+        
         # Buttons
         button_layout = QHBoxLayout()
         button_layout.addStretch()
@@ -780,11 +894,26 @@ class VoxtextWindow(QMainWindow):
         # File menu
         file_menu = menubar.addMenu("File")
         
-        open_action = QAction("Open File...", self)
+        open_action = QAction("Open Files...", self)
         open_action.setShortcut("Ctrl+O")
         open_action.triggered.connect(self.browse_file)
         file_menu.addAction(open_action)
         
+        open_folder_action = QAction("Add Folder...", self)
+        open_folder_action.setShortcut("Ctrl+Shift+O")
+        open_folder_action.triggered.connect(self.browse_folder)
+        file_menu.addAction(open_folder_action)
+        
+        export_action = QAction("Re-export From Saved Transcript...", self)
+        export_action.setShortcut("Ctrl+E")
+        export_action.triggered.connect(self.export_from_json)
+        file_menu.addAction(export_action)
+        
+        search_action = QAction("Search Transcripts...", self)
+        search_action.setShortcut("Ctrl+F")
+        search_action.triggered.connect(self.search_transcripts)
+        file_menu.addAction(search_action)
+        
         clear_action = QAction("Clear Selection", self)
         clear_action.setShortcut("Ctrl+K")
         clear_action.triggered.connect(self.clear_or_cancel)
@@ -807,16 +936,155 @@ class VoxtextWindow(QMainWindow):
         clear_cache_action.triggered.connect(self.clear_cache)
         tools_menu.addAction(clear_cache_action)
         
+        clear_results_action = QAction("Clear Transcript Cache...", self)
+        clear_results_action.triggered.connect(self.clear_result_cache)
+        tools_menu.addAction(clear_results_action)
+        
         manage_models_action = QAction("Manage Models...", self)
         manage_models_action.triggered.connect(self.manage_models)
         tools_menu.addAction(manage_models_action)
         
+        download_models_action = QAction("Download Models...", self)
+        download_models_action.triggered.connect(self.download_models)
+        tools_menu.addAction(download_models_action)
+        
+        import_models_action = QAction("Import Models...", self)
+        import_models_action.triggered.connect(self.import_models)
+        tools_menu.addAction(import_models_action)
+        
+        export_models_action = QAction("Export Models...", self)
+        export_models_action.triggered.connect(self.export_models)
+        tools_menu.addAction(export_models_action)
+        
+        store_action = QAction("Model Store Folder...", self)
+        store_action.triggered.connect(self.choose_model_store)
+        tools_menu.addAction(store_action)
+        
+        mirror_action = QAction("Model Mirror Folder...", self)
+        mirror_action.triggered.connect(self.choose_model_mirror)
+        tools_menu.addAction(mirror_action)
+        
+        self.offline_action = QAction("Work Offline (Never Download Models)", self)
+        self.offline_action.setCheckable(True)
+        self.offline_action.setChecked(self.settings.value("offline", False, type=bool))
+        self.offline_action.toggled.connect(self.set_offline)
+        tools_menu.addAction(self.offline_action)
+        
+        self.mmap_action = QAction("Memory-Map Model Weights (Lower Peak RAM)", self)
+        self.mmap_action.setCheckable(True)
+        self.mmap_action.setChecked(self.settings.value("mmap_weights", False, type=bool))
+        self.mmap_action.toggled.connect(self.set_mmap_weights)
+        tools_menu.addAction(self.mmap_action)
+        
+        tools_menu.addSeparator()
+        
+        self.quantize_action = QAction("Fast CPU Mode (int8 Quantized Models)", self)
+        self.quantize_action.setCheckable(True)
+        self.quantize_action.setChecked(self.settings.value("quantize", False, type=bool))
+        self.quantize_action.toggled.connect(self.set_quantize)
+        tools_menu.addAction(self.quantize_action)
+        
+        compare_action = QAction("Compare int8 Speed and Accuracy...", self)
+        compare_action.triggered.connect(self.compare_quantized)
+        tools_menu.addAction(compare_action)
+        
+        backend_menu = tools_menu.addMenu("Transcription Engine")
+        self.backend_group = QActionGroup(self)
+        self.backend_group.setExclusive(True)
+        saved_backend = self.settings.value("backend", DEFAULT_BACKEND)
+        for backend in BACKENDS.values():
+            action = QAction(backend.label, self)
+            action.setCheckable(True)
+            action.setData(backend.name)
+            if not backend.is_available():
+                action.setText(f"{backend.label} - not installed (pip install {backend.module.replace('_', '-')})")
+                action.setEnabled(False)
+            action.setChecked(backend.name == saved_backend and backend.is_available())
+            self.backend_group.addAction(action)
+            backend_menu.addAction(action)
+        if self.backend_group.checkedAction() is None:
+            self.backend_group.actions()[0].setChecked(True)
+        self.backend_group.triggered.connect(self.set_backend)
+        
         tools_menu.addSeparator()
         
         open_folder_action = QAction("Open Model Folder", self)
         open_folder_action.triggered.connect(self.open_model_folder)
         tools_menu.addAction(open_folder_action)
         
+        tools_menu.addSeparator()
+        
+        budget_action = QAction("Model Memory Budget...", self)
+        budget_action.triggered.connect(self.set_model_budget)
+        tools_menu.addAction(budget_action)
+        
+        unload_action = QAction("Unload Models From Memory", self)
+        unload_action.triggered.connect(self.unload_models)
+        tools_menu.addAction(unload_action)
+        
+        self.preload_action = QAction("Pre-load Selected Model", self)
+        self.preload_action.setCheckable(True)
+        self.preload_action.setChecked(self.settings.value("preload_models", True, type=bool))
+        self.preload_action.toggled.connect(self.set_preload)
+        tools_menu.addAction(self.preload_action)
+        
+        parallel_action = QAction("Parallel Batch Jobs...", self)
+        parallel_action.triggered.connect(self.set_parallel_jobs)
+        tools_menu.addAction(parallel_action)
+        
+        self.long_file_action = QAction("Split Long Recordings Across CPU Cores", self)
+        self.long_file_action.setCheckable(True)
+        self.long_file_action.setChecked(self.settings.value("long_file_mode", False, type=bool))
+        self.long_file_action.toggled.connect(lambda on: self.settings.setValue("long_file_mode", on))
+        tools_menu.addAction(self.long_file_action)
+        
+        self.vad_action = QAction("Skip Silence (Voice Detection)", self)
+        self.vad_action.setCheckable(True)
+        self.vad_action.setChecked(self.settings.value("vad", False, type=bool))
+        self.vad_action.toggled.connect(lambda on: self.settings.setValue("vad", on))
+        tools_menu.addAction(self.vad_action)
+        
+        self.word_timestamps_action = QAction("Word-Level Timestamps", self)
+        self.word_timestamps_action.setCheckable(True)
+        self.word_timestamps_action.setChecked(self.settings.value("word_timestamps", False, type=bool))
+        self.word_timestamps_action.toggled.connect(lambda on: self.settings.setValue("word_timestamps", on))
+        tools_menu.addAction(self.word_timestamps_action)
+        
+        word_cues_menu = tools_menu.addMenu("Subtitle Cues (With Word Timestamps)")
+        self.word_cues_group = QActionGroup(self)
+        self.word_cues_group.setExclusive(True)
+        saved_word_cues = self.settings.value("word_cues", 'segments')
+        for mode, label in WORD_CUE_MODES.items():
+            action = QAction(label, self)
+            action.setCheckable(True)
+            action.setData(mode)
+            action.setChecked(mode == saved_word_cues)
+            self.word_cues_group.addAction(action)
+            word_cues_menu.addAction(action)
+        if self.word_cues_group.checkedAction() is None:
+            self.word_cues_group.actions()[0].setChecked(True)
+        self.word_cues_group.triggered.connect(lambda action: self.settings.setValue("word_cues", action.data()))
+        
+        self.search_index_action = QAction("Add Transcripts to Search Index", self)
+        self.search_index_action.setCheckable(True)
+        self.search_index_action.setChecked(self.settings.value("search_index", True, type=bool))
+        self.search_index_action.toggled.connect(lambda on: self.settings.setValue("search_index", on))
+        tools_menu.addAction(self.search_index_action)
+        
+        tools_menu.addSeparator()
+        
+        self.details_action = QAction("Show Job Details (Stage Timings)", self)
+        self.details_action.setCheckable(True)
+        self.details_action.setChecked(self.settings.value("show_job_details", False, type=bool))
+        self.details_action.toggled.connect(self.set_show_job_details)
+        tools_menu.addAction(self.details_action)
+        
+        self.save_metrics_action = QAction("Save Job Metrics Next to Transcripts", self)
+        self.save_metrics_action.setCheckable(True)
+        self.save_metrics_action.setChecked(self.settings.value("save_metrics", False, type=bool))
+        self.save_metrics_action.toggled.connect(lambda on: self.settings.setValue("save_metrics", on))
+        tools_menu.addAction(self.save_metrics_action)
+        
         # Help menu
         help_menu = menubar.addMenu("Help")
         
@@ -828,6 +1096,10 @@ class VoxtextWindow(QMainWindow):
         speed_guide_action.triggered.connect(self.show_speed_guide)
         help_menu.addAction(speed_guide_action)
         
+        benchmark_action = QAction("Benchmark This Computer...", self)
+        benchmark_action.triggered.connect(self.run_benchmark)
+        help_menu.addAction(benchmark_action)
+        
         help_menu.addSeparator()
         
         about_action = QAction("About Voxtext", self)
@@ -846,30 +1118,264 @@ class VoxtextWindow(QMainWindow):
             event.acceptProposedAction()
     
     def dropEvent(self, event: QDropEvent):
-        urls = event.mimeData().urls()
-        if urls:
-            file_path = urls[0].toLocalFile()
-            if os.path.isfile(file_path):
-                self.selected_file = file_path
-                self.update_file_display(file_path)
-                self.status_label.setText("File loaded. Ready to transcribe.")
+        if self.worker and self.worker.isRunning():
+            return
+        
+        paths = [url.toLocalFile() for url in event.mimeData().urls() if url.isLocalFile()]
+        self.add_to_queue(paths)
     
     # === File Selection ===
     def browse_file(self):
         if self.worker and self.worker.isRunning():
             return
         
-        file_path, _ = QFileDialog.getOpenFileName(
+        file_paths, _ = QFileDialog.getOpenFileNames(
             self,
-            "Select Audio or Video File",
+            "Select Audio or Video Files",
             "",
             "Media Files (*.mp3 *.mp4 *.wav *.m4a *.flac *.ogg *.mov *.avi *.mkv *.webm);;Audio Files (*.mp3 *.wav *.m4a *.flac *.ogg *.aac);;Video Files (*.mp4 *.mov *.avi *.mkv *.webm);;All Files (*.*)"
         )
         
-        if file_path:
-            self.selected_file = file_path
-            self.update_file_display(file_path)
+        if file_paths:
+            self.add_to_queue(file_paths)
+    
+    def browse_folder(self):
+        if self.worker and self.worker.isRunning():
+            return
+        
+        folder = QFileDialog.getExistingDirectory(self, "Select Folder of Recordings")
+        if folder:
+            self.add_to_queue([folder])
+    
+    def export_from_json(self):
+        """Write the checked formats from saved JSON or .vxt transcripts, with the current LMS settings"""
+        if self.worker and self.worker.isRunning():
+            return
+        
+        output_formats = [k for k, cb in self.format_checks.items() if cb.isChecked() and k != 'json']
+        if not output_formats:
+            QMessageBox.warning(self, "No Format", "Please select at least one output format other than JSON.")
+            return
+        
+        json_paths, _ = QFileDialog.getOpenFileNames(
+            self,
+            "Select Saved Transcripts",
+            "",
+            "Transcripts (*.json *.vxt);;All Files (*.*)"
+        )
+        if not json_paths:
+            return
+        
+        created_files = []
+        failed = []
+        for json_path in json_paths:
+            try:
+                created_files.extend(export_transcript(
+                    json_path, output_formats, None, self.get_lms_settings(),
+                    word_cues=self.word_cues_group.checkedAction().data()
+                ))
+            except Exception as e:
+                failed.append(f"• {os.path.basename(json_path)}: {e}")
+        
+        self.status_label.setText(f"Re-exported {len(json_paths) - len(failed)} of {len(json_paths)} transcripts.")
+        files_list = "\n".join(f"• {Path(f).name}" for f in created_files[:15])
+        if len(created_files) > 15:
+            files_list += f"\n• ... and {len(created_files) - 15} more"
+        if failed:
+            QMessageBox.warning(
+                self, "Re-export Finished With Errors",
+                f"Created files:\n{files_list or '(none)'}\n\nFailed:\n" + "\n".join(failed[:10])
+            )
+        else:
+            QMessageBox.information(
+                self, "Success!",
+                f"Re-export complete!\n\nCreated files:\n{files_list}\n\nSaved to:\n{Path(json_paths[0]).parent}"
+            )
+    
+    def search_transcripts(self):
+        """Full-text search over every indexed transcript, jumping to the matching file"""
+        import sqlite3
+        from voxtext_search import SearchIndex
+        from voxtext_writers import format_timestamp
+        
+        try:
+            index = SearchIndex()
+        except (sqlite3.Error, OSError) as e:
+            QMessageBox.critical(self, "Error", f"Failed to open the search index:\n\n{str(e)}")
+            return
+        
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Search Transcripts")
+        dialog.setMinimumSize(640, 420)
+        layout = QVBoxLayout(dialog)
+        query_edit = QLineEdit()
+        query_edit.setPlaceholderText('Words, "exact phrase" or prefix*')
+        layout.addWidget(query_edit)
+        results = QListWidget()
+        layout.addWidget(results, 1)
+        status = QLabel("")
+        layout.addWidget(status)
+        
+        buttons = QHBoxLayout()
+        add_btn = QPushButton("Add Saved Transcripts...")
+        prune_btn = QPushButton("Remove Deleted")
+        prune_btn.setToolTip("Forget transcripts whose media and output files have all been deleted")
+        open_media_btn = QPushButton("Open Media")
+        open_transcript_btn = QPushButton("Open Transcript")
+        close_btn = QPushButton("Close")
+        buttons.addWidget(add_btn)
+        buttons.addWidget(prune_btn)
+        buttons.addStretch()
+        buttons.addWidget(open_media_btn)
+        buttons.addWidget(open_transcript_btn)
+        buttons.addWidget(close_btn)
+        layout.addLayout(buttons)
+        
+        def show_totals():
+            transcripts, segments = index.counts()
+            status.setText(f"{transcripts:,} transcripts, {segments:,} segments indexed")
+        
+        def run_search():
+            results.clear()
+            query = query_edit.text().strip()
+            if not query:
+                show_totals()
+                return
+            started = time.perf_counter()
+            try:
+                hits = index.search(query, limit=200, mark=("«", "»"))
+            except sqlite3.Error as e:
+                status.setText(f"Search failed: {e}")
+                return
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            for hit in hits:
+                source = Path(hit['media'] or hit['transcript'])
+                item = QListWidgetItem(
+                    f"{source.name}  [{format_timestamp(hit['start'], use_comma=False)[:8]}]  {hit['snippet']}"
+                )
+                item.setToolTip(f"{hit['text']}\n\n{source}")
+                item.setData(Qt.ItemDataRole.UserRole, hit)
+                results.addItem(item)
+            more = " (showing the best 200)" if len(hits) == 200 else ""
+            status.setText(f"{len(hits)} matches in {elapsed_ms:.0f} ms{more}")
+            if hits:
+                results.setCurrentRow(0)
+        
+        def open_hit(key):
+            item = results.currentItem()
+            if item is None:
+                return
+            path = item.data(Qt.ItemDataRole.UserRole)[key]
+            if not path or not os.path.exists(path):
+                status.setText("That file has been moved or deleted.")
+                return
+            QDesktopServices.openUrl(QUrl.fromLocalFile(path))
+        
+        def update_buttons():
+            hit = results.currentItem().data(Qt.ItemDataRole.UserRole) if results.currentItem() else None
+            open_media_btn.setEnabled(bool(hit and hit['media']))
+            open_transcript_btn.setEnabled(bool(hit and hit['transcript']))
+        
+        def add_saved():
+            paths, _ = QFileDialog.getOpenFileNames(
+                dialog, "Select Saved Transcripts", "", "Transcripts (*.json *.vxt);;All Files (*.*)"
+            )
+            failed = []
+            for path in paths:
+                try:
+                    index.add_saved(path)
+                except Exception as e:
+                    failed.append(f"• {os.path.basename(path)}: {e}")
+            if failed:
+                QMessageBox.warning(dialog, "Some Transcripts Were Not Added", "\n".join(failed[:10]))
+            run_search()
+        
+        def prune():
+            try:
+                removed = index.prune()
+            except sqlite3.Error as e:
+                status.setText(f"Could not update the index: {e}")
+                return
+            run_search()
+            QMessageBox.information(dialog, "Search Index", f"Removed {removed} entries whose files were deleted.")
+        
+        # Search as the user types, once they pause
+        debounce = QTimer(dialog)
+        debounce.setSingleShot(True)
+        debounce.setInterval(200)
+        debounce.timeout.connect(run_search)
+        query_edit.textChanged.connect(lambda: debounce.start())
+        query_edit.returnPressed.connect(run_search)
+        results.currentItemChanged.connect(lambda *args: update_buttons())
+        # Double-click opens the media, or the transcript when only that is known
+        results.itemDoubleClicked.connect(lambda item: open_hit('media' if open_media_btn.isEnabled() else 'transcript'))
+        open_media_btn.clicked.connect(lambda: open_hit('media'))
+        open_transcript_btn.clicked.connect(lambda: open_hit('transcript'))
+        add_btn.clicked.connect(add_saved)
+        prune_btn.clicked.connect(prune)
+        close_btn.clicked.connect(dialog.reject)
+        dialog.finished.connect(lambda result: index.close())
+        
+        update_buttons()
+        show_totals()
+        dialog.exec()
+    
+    def add_to_queue(self, paths):
+        """Queue files; folders are searched recursively for media files"""
+        queued = {item['path'] for item in self.queue}
+        added = 0
+        for path in paths:
+            if os.path.isdir(path):
+                candidates = find_media_files(path)
+            elif os.path.isfile(path):
+                candidates = [path]
+            else:
+                continue
+            for file_path in candidates:
+                if file_path not in queued:
+                    queued.add(file_path)
+                    self.queue.append({'path': file_path, 'state': 'Queued', 'detail': ''})
+                    added += 1
+        
+        if not added:
+            if paths:
+                self.status_label.setText("No new audio or video files found.")
+            return
+        
+        self.refresh_queue()
+        if len(self.queue) == 1:
             self.status_label.setText("File loaded. Ready to transcribe.")
+        else:
+            self.status_label.setText(f"{len(self.queue)} files queued. Ready to transcribe.")
+    
+    def refresh_queue(self):
+        """Redraw the file label and queue panel from self.queue"""
+        if not self.queue:
+            self.file_label.setText("No file selected")
+            self.file_label.setStyleSheet(f"color: {COLORS['text_secondary']};")
+            self.queue_list.clear()
+            self.queue_list.setVisible(False)
+            return
+        
+        if len(self.queue) == 1:
+            self.update_file_display(self.queue[0]['path'])
+        else:
+            done = sum(1 for item in self.queue if item['state'] == 'Done')
+            self.file_label.setText(f"🗂️ {len(self.queue)} files queued ({done} done)")
+            self.file_label.setStyleSheet(f"color: {COLORS['text']};")
+        
+        self.queue_list.clear()
+        for item in self.queue:
+            list_item = QListWidgetItem(f"{item['state']:<14} {os.path.basename(item['path'])}")
+            list_item.setToolTip(item['detail'] or item['path'])
+            self.queue_list.addItem(list_item)
+        self.queue_list.setVisible(len(self.queue) > 1)
+    
+    def set_queue_state(self, index, state, detail=''):
+        self.queue[index]['state'] = state
+        self.queue[index]['detail'] = detail
+        self.refresh_queue()
+        self.queue_list.scrollToItem(self.queue_list.item(index))
     
     def update_file_display(self, filepath):
         """Update file label with emoji and filename"""
@@ -908,18 +1414,38 @@ class VoxtextWindow(QMainWindow):
             preset = self.vtt_presets[preset_name]
             self.cue_settings.setText(preset['cue_settings'])
             self.css_text.setPlainText(preset['css'])
+            limits = preset.get('caption_limits')
+            self.limits_enabled.setChecked(bool(limits))
+            for key, value in (limits or {}).items():
+                self.limit_boxes[key].setValue(value)
+    
+    def get_transcription_options(self):
+        """Get engine options from the Tools menu settings"""
+        options = {}
+        if self.long_file_action.isChecked():
+            # Long recordings are split at silences and chunks spread over the CPU cores
+            options['chunk_workers'] = max(2, worker_split()[0])
+        options['vad'] = self.vad_action.isChecked()
+        options['quantize'] = self.quantize_action.isChecked()
+        options['backend'] = self.selected_backend()
+        options['word_timestamps'] = self.word_timestamps_action.isChecked()
+        options['word_cues'] = self.word_cues_group.checkedAction().data()
+        options['search_index'] = self.search_index_action.isChecked()
+        return options
     
     def get_lms_settings(self):
         """Get current LMS settings"""
         return {
             'enabled': self.lms_enabled.isChecked(),
             'cue_settings': self.cue_settings.text(),
-            'css': self.css_text.toPlainText()
+            'css': self.css_text.toPlainText(),
+            'caption_limits': {key: box.value() for key, box in self.limit_boxes.items()}
+            if self.limits_enabled.isChecked() else None
         }
     
     # === Transcription ===
     def start_transcription(self):
-        if not self.selected_file:
+        if not self.queue:
             QMessageBox.warning(self, "No File", "Please select an audio or video file first.")
             return
         
@@ -933,11 +1459,17 @@ class VoxtextWindow(QMainWindow):
             return
         
         # Get selected model
-        selected_btn = self.model_group.checkedButton()
-        model_name = selected_btn.property("model_name") if selected_btn else "medium"
-        
-        # Get output directory
-        output_dir = Path(self.selected_file).parent
+        model_name = self.selected_model_name()
+        
+        # Run everything not yet done (or the whole queue again if it all finished)
+        self.running_indices = [i for i, item in enumerate(self.queue) if item['state'] != 'Done']
+        if not self.running_indices:
+            self.running_indices = list(range(len(self.queue)))
+        for index in self.running_indices:
+            self.queue[index]['state'] = 'Queued'
+            self.queue[index]['detail'] = ''
+        self.refresh_queue()
+        file_paths = [self.queue[i]['path'] for i in self.running_indices]
         
         # Get LMS settings
         lms_settings = self.get_lms_settings()
@@ -960,17 +1492,28 @@ class VoxtextWindow(QMainWindow):
         self.progress_bar.setValue(0)
         self.progress_label.setText("0%")
         self.start_time = time.time()
+        self.live_text.clear()
+        self.live_text.setVisible(False)
         self.update_elapsed_time()
         
-        # Create and start worker
+        # Create and start worker (outputs are saved next to each source file)
         self.worker = TranscriptionWorker(
-            self.selected_file,
+            file_paths,
             model_name,
             output_formats,
-            output_dir,
-            lms_settings
+            None,
+            lms_settings,
+            self.model_cache,
+            self.settings.value("parallel_jobs", 1, type=int),
+            self.get_transcription_options()
         )
         self.worker.progress.connect(self.on_progress)
+        self.worker.item_started.connect(self.on_item_started)
+        self.worker.item_finished.connect(self.on_item_finished)
+        self.worker.item_failed.connect(self.on_item_failed)
+        self.worker.item_metrics.connect(self.on_item_metrics)
+        self.worker.partial_text.connect(self.on_partial_text)
+        self.worker.stopped.connect(self.on_stopped)
         self.worker.finished.connect(self.on_finished)
         self.worker.error.connect(self.on_error)
         self.worker.start()
@@ -980,11 +1523,54 @@ class VoxtextWindow(QMainWindow):
         self.progress_bar.setValue(percentage)
         self.progress_label.setText(f"{percentage}%")
     
+    def on_item_started(self, index):
+        self.set_queue_state(self.running_indices[index], 'Transcribing')
+        self.live_text.clear()
+    
+    def on_partial_text(self, text):
+        self.live_text.setVisible(True)
+        self.live_text.moveCursor(QTextCursor.MoveOperation.End)
+        self.live_text.insertPlainText(text)
+        self.live_text.ensureCursorVisible()
+    
+    def on_item_finished(self, index, created_files):
+        self.set_queue_state(self.running_indices[index], 'Done', "\n".join(created_files))
+    
+    def on_item_failed(self, index, error_msg):
+        self.set_queue_state(self.running_indices[index], 'Failed', error_msg)
+    
+    def on_item_metrics(self, index, metrics):
+        queue_index = self.running_indices[index]
+        self.queue[queue_index]['metrics'] = metrics
+        if self.save_metrics_action.isChecked():
+            from voxtext_metrics import MetricsRecorder
+            
+            try:
+                MetricsRecorder(json_files=True).write_json(metrics)
+            except OSError as e:
+                self.status_label.setText(f"Could not save job metrics: {e}")
+        self.show_job_details(queue_index)
+    
+    def show_job_details(self, queue_index):
+        """Show the stage timings of a queued file in the details panel"""
+        from voxtext_metrics import describe_metrics
+        
+        if not 0 <= queue_index < len(self.queue):
+            return
+        metrics = self.queue[queue_index].get('metrics')
+        if metrics:
+            self.details_text.setPlainText(describe_metrics(metrics))
+    
+    def set_show_job_details(self, checked):
+        self.settings.setValue("show_job_details", checked)
+        self.details_text.setVisible(checked)
+    
     def on_finished(self, created_files):
         self.progress_bar.setValue(100)
         self.progress_label.setText("100%")
         self.status_label.setText("Transcription complete!")
         self.reset_buttons()
+        self.resume_preload()
         
         if self.start_time:
             elapsed = int(time.time() - self.start_time)
@@ -992,12 +1578,31 @@ class VoxtextWindow(QMainWindow):
             seconds = elapsed % 60
             self.elapsed_label.setText(f"Completed in {minutes}m {seconds}s")
         
-        # Show success message
-        files_list = "\n".join([f"• {Path(f).name}" for f in created_files])
-        QMessageBox.information(
-            self, "Success!",
-            f"Transcription complete!\n\nCreated files:\n{files_list}\n\nSaved to:\n{Path(self.selected_file).parent}"
-        )
+        failed = [self.queue[i] for i in self.running_indices if self.queue[i]['state'] == 'Failed']
+        
+        if len(self.running_indices) == 1 and not failed:
+            # Show success message
+            files_list = "\n".join([f"• {Path(f).name}" for f in created_files])
+            source = self.queue[self.running_indices[0]]['path']
+            QMessageBox.information(
+                self, "Success!",
+                f"Transcription complete!\n\nCreated files:\n{files_list}\n\nSaved to:\n{Path(source).parent}"
+            )
+        elif failed:
+            failed_list = "\n".join(f"• {os.path.basename(item['path'])}" for item in failed[:10])
+            if len(failed) > 10:
+                failed_list += f"\n• ... and {len(failed) - 10} more"
+            QMessageBox.warning(
+                self, "Batch Finished With Errors",
+                f"Transcribed {len(self.running_indices) - len(failed)} of {len(self.running_indices)} files.\n\n"
+                f"Failed:\n{failed_list}\n\nHover over a queue item to see its error."
+            )
+        else:
+            QMessageBox.information(
+                self, "Success!",
+                f"Transcribed {len(self.running_indices)} files.\n\n"
+                f"Created {len(created_files)} files, saved next to each source file."
+            )
     
     def on_error(self, error_msg):
         self.progress_bar.setValue(0)
@@ -1005,6 +1610,7 @@ class VoxtextWindow(QMainWindow):
         self.status_label.setText("Error occurred. Please try again.")
         self.elapsed_label.setText("")
         self.reset_buttons()
+        self.resume_preload()
         
         QMessageBox.critical(
             self, "Transcription Error",
@@ -1031,23 +1637,60 @@ class VoxtextWindow(QMainWindow):
     def clear_or_cancel(self):
         """Clear file selection or cancel running transcription"""
         if self.worker and self.worker.isRunning():
+            if self.worker.cancelled:
+                return
+            # Never wait on the thread here: the engine notices the request before the
+            # next encoder/decoder pass (or kills its worker processes) and the worker
+            # reports back through its stopped signal
             self.worker.cancel()
-            self.worker.quit()
-            self.worker.wait()
-            self.status_label.setText("Transcription cancelled")
-            self.progress_bar.setValue(0)
-            self.progress_label.setText("0%")
-            self.elapsed_label.setText("")
-            self.reset_buttons()
+            self.worker.progress.disconnect(self.on_progress)
+            self.worker.partial_text.disconnect(self.on_partial_text)
+            self.clear_btn.setText("Cancelling...")
+            self.clear_btn.setEnabled(False)
+            self.status_label.setText("Cancelling transcription...")
         else:
-            self.selected_file = None
-            self.file_label.setText("No file selected")
-            self.file_label.setStyleSheet(f"color: {COLORS['text_secondary']};")
+            self.queue = []
+            self.running_indices = []
+            self.refresh_queue()
             self.status_label.setText("Ready to transcribe")
             self.progress_bar.setValue(0)
             self.progress_label.setText("0%")
             self.elapsed_label.setText("")
     
+    def on_stopped(self):
+        """Worker finished winding down after a cancel request"""
+        for index in self.running_indices:
+            if self.queue[index]['state'] in ('Queued', 'Transcribing'):
+                self.queue[index]['state'] = 'Cancelled'
+        self.refresh_queue()
+        self.status_label.setText("Transcription cancelled")
+        self.progress_bar.setValue(0)
+        self.progress_label.setText("0%")
+        self.elapsed_label.setText("")
+        self.clear_btn.setEnabled(True)
+        self.reset_buttons()
+        self.resume_preload()
+    
+    def closeEvent(self, event):
+        """Stop a running transcription before the window (and its thread) goes away"""
+        if self.worker and self.worker.isRunning():
+            self.worker.cancel()
+            self.worker.wait(10000)
+        if self.preload_worker and self.preload_worker.isRunning():
+            self.preload_pending = False
+            self.preload_worker.cancel()
+            self.preload_worker.wait(10000)
+        if self.warm_up_worker:
+            self.warm_up_worker.wait()  # an import cannot be interrupted; it finishes quickly
+        if self.benchmark_worker and self.benchmark_worker.isRunning():
+            self.benchmark_worker.cancelled = True
+            self.benchmark_worker.wait()
+        for worker in (self.compare_worker, self.bundle_worker):
+            if worker and worker.isRunning():
+                worker.cancel()
+                worker.wait()
+        event.accept()
+    
     def update_elapsed_time(self):
         """Update elapsed time display"""
         if self.worker and self.worker.isRunning() and self.start_time:
@@ -1070,6 +1713,99 @@ class VoxtextWindow(QMainWindow):
                 self.killTimer(self.timer_id)
                 self.timer_id = None
     
+    # === Startup ===
+    def on_first_show(self):
+        """Runs on the first event-loop pass after show(): record cold start, then warm up"""
+        self.startup_seconds = time.perf_counter() - STARTUP_BEGAN
+        self.start_warm_up()
+    
+    def start_warm_up(self):
+        if not WHISPER_AVAILABLE or self.warm_up_worker is not None:
+            return
+        self.warm_up_worker = WarmUpWorker()
+        self.warm_up_worker.ready.connect(self.on_warm_up_ready)
+        self.warm_up_worker.failed.connect(self.on_warm_up_failed)
+        self.warm_up_worker.start()
+    
+    def on_warm_up_ready(self, seconds):
+        self.warm_up_seconds = seconds
+        self.preload_selected_model()
+    
+    def on_warm_up_failed(self, error_msg):
+        # Transcription will import Whisper again and report the error properly
+        print(f"Note: Whisper warm-up failed: {error_msg}")
+    
+    # === Model Pre-loading ===
+    def selected_model_name(self):
+        selected_btn = self.model_group.checkedButton()
+        return selected_btn.property("model_name") if selected_btn else "medium"
+    
+    def on_model_toggled(self, button, checked):
+        if not checked:
+            return
+        self.settings.setValue("last_model", button.property("model_name"))
+        self.preload_selected_model()
+    
+    def preload_selected_model(self):
+        """Start loading the selected model in the background so Transcribe starts at once"""
+        if not WHISPER_AVAILABLE or not self.preload_action.isChecked():
+            return
+        model_name = self.selected_model_name()
+        quantize = self.quantize_action.isChecked()
+        backend = self.selected_backend()
+        if self.model_cache.contains(get_backend(backend).cache_key(model_name, quantize)):
+            return
+        if self.is_busy():
+            # A second model loading beside the job doubles RAM and competes for
+            # the CPU; it is loaded once the job ends
+            self.preload_pending = True
+            return
+        if self.preload_worker and self.preload_worker.isRunning():
+            self.preload_pending = True  # loaded once the current one finishes
+            return
+        
+        self.preload_pending = False
+        self.preload_worker = ModelPreloader(model_name, self.model_cache, quantize, backend)
+        self.preload_worker.downloading.connect(self.on_model_downloading)
+        self.preload_worker.ready.connect(self.on_model_preloaded)
+        self.preload_worker.failed.connect(self.on_model_preload_failed)
+        self.preload_worker.finished.connect(self.on_preload_finished)
+        if not self.is_busy():
+            self.status_label.setText(f"Loading {model_name} model in the background...")
+        self.preload_worker.start()
+    
+    def on_model_downloading(self, message):
+        if not self.is_busy():
+            self.status_label.setText(message)
+    
+    def on_model_preloaded(self, model_name, seconds):
+        if not self.is_busy() and model_name == self.selected_model_name():
+            self.status_label.setText(f"{model_name.capitalize()} model ready ({seconds:.1f}s).")
+    
+    def on_model_preload_failed(self, model_name, error_msg):
+        # Not fatal: the transcription loads the model again and reports the error
+        if not self.is_busy():
+            self.status_label.setText(f"Could not pre-load the {model_name} model.")
+        print(f"Note: pre-loading {model_name} failed: {error_msg}")
+    
+    def on_preload_finished(self):
+        if self.preload_pending:
+            self.preload_selected_model()
+    
+    def resume_preload(self):
+        """Start the pre-load held back while the transcription ran"""
+        if self.preload_pending:
+            self.worker.wait()  # the job signalled its end; run() is returning
+            self.preload_selected_model()
+    
+    def is_busy(self):
+        return bool(self.worker and self.worker.isRunning())
+    
+    def set_preload(self, checked):
+        self.settings.setValue("preload_models", checked)
+        if checked:
+            self.preload_selected_model()
+    
     # === Whisper Installation ===
     def install_whisper(self):
         self.status_label.setText("Installing Whisper... This may take a minute.")
@@ -1083,53 +1819,48 @@ class VoxtextWindow(QMainWindow):
                     text=True
                 )
                 if result.returncode == 0:
-                    return True, None
+                    return True, ""
                 else:
                     return False, result.stderr
             except Exception as e:
                 return False, str(e)
         
-        def on_complete(success, error):
-            if success:
-                global WHISPER_AVAILABLE
-                WHISPER_AVAILABLE = True
-                self.status_label.setText("Whisper installed successfully!")
-                self.transcribe_btn.setEnabled(True)
-                QMessageBox.information(
-                    self, "Success",
-                    "Whisper installed successfully!\n\nYou can now transcribe audio and video files."
-                )
-            else:
-                self.status_label.setText("Installation failed. See error message.")
-                QMessageBox.critical(
-                    self, "Installation Error",
-                    f"Failed to install Whisper:\n\n{error}\n\nTry running: pip install openai-whisper"
-                )
-        
-        # Run in thread
-        thread = threading.Thread(target=lambda: on_complete(*install()))
+        # Run in thread; the result is signalled back to the GUI thread
+        thread = threading.Thread(target=lambda: self.whisper_installed.emit(*install()))
         thread.daemon = True
         thread.start()
     
+    def on_whisper_installed(self, success, error):
+        """Runs on the GUI thread: widgets and QThreads are only touched there"""
+        if success:
+            global WHISPER_AVAILABLE
+            WHISPER_AVAILABLE = True
+            self.status_label.setText("Whisper installed successfully!")
+            self.transcribe_btn.setEnabled(True)
+            self.start_warm_up()
+            QMessageBox.information(
+                self, "Success",
+                "Whisper installed successfully!\n\nYou can now transcribe audio and video files."
+            )
+        else:
+            self.status_label.setText("Installation failed. See error message.")
+            QMessageBox.critical(
+                self, "Installation Error",
+                f"Failed to install Whisper:\n\n{error}\n\nTry running: pip install openai-whisper"
+            )
+    
     # === Menu Actions ===
     def clear_cache(self):
-        import platform
-        import shutil
-        
-        home = Path.home()
-        if platform.system() == "Darwin":
-            cache_dir = home / ".cache" / "whisper"
-        elif platform.system() == "Windows":
-            cache_dir = home / "AppData" / "Local" / "whisper"
-        else:
-            cache_dir = home / ".cache" / "whisper"
-        
-        if not cache_dir.exists():
+        cache_dir = models_dir()
+        model_files = []
+        if cache_dir.exists():
+            for pattern in ("*.pt", "*.safetensors", "*.int8", "*.part"):
+                model_files.extend(cache_dir.glob(pattern))
+        if not model_files:
             QMessageBox.information(self, "Cache Empty", "No model cache found. Models will be downloaded on first use.")
             return
         
-        total_size = sum(f.stat().st_size for f in cache_dir.rglob('*') if f.is_file())
-        size_mb = total_size / (1024 * 1024)
+        size_mb = sum(f.stat().st_size for f in model_files) / (1024 * 1024)
         
         result = QMessageBox.question(
             self, "Clear Cache",
@@ -1139,53 +1870,191 @@ class VoxtextWindow(QMainWindow):
         
         if result == QMessageBox.StandardButton.Yes:
             try:
-                shutil.rmtree(cache_dir)
+                # Only model files: the store may be a folder shared with other things
+                for f in model_files:
+                    f.unlink()
                 QMessageBox.information(self, "Success", f"Cleared {size_mb:.1f} MB from cache.")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to clear cache:\n\n{str(e)}")
     
-    def manage_models(self):
-        import platform
+    def clear_result_cache(self):
+        """Delete cached transcripts and decoded audio (both are recreated on demand)"""
+        from voxtext_cache import ResultCache, PcmCache
+        
+        cache, pcm_cache = ResultCache(), PcmCache()
+        count, audio_count = cache.count(), pcm_cache.count()
+        if not count and not audio_count:
+            QMessageBox.information(self, "Cache Empty", "No cached transcripts or decoded audio found.")
+            return
         
-        home = Path.home()
-        if platform.system() == "Darwin":
-            cache_dir = home / ".cache" / "whisper"
-        elif platform.system() == "Windows":
-            cache_dir = home / "AppData" / "Local" / "whisper"
-        else:
-            cache_dir = home / ".cache" / "whisper"
+        result = QMessageBox.question(
+            self, "Clear Transcript Cache",
+            f"{count} cached transcripts are using {cache.size_mb():.1f} MB "
+            f"(limit {cache.max_mb} MB), and {audio_count} decoded audio files are using "
+            f"{pcm_cache.size_mb():.1f} MB (limit {pcm_cache.max_mb} MB).\n\n"
+            f"They let Voxtext create new output formats for a file it has already "
+            f"transcribed without running the model again, and transcribe a file again "
+            f"without decoding it again.\n\nContinue?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
         
-        if not cache_dir.exists():
-            QMessageBox.information(self, "No Models", "No models have been downloaded yet.")
-            return
+        if result == QMessageBox.StandardButton.Yes:
+            freed_mb = cache.clear() + pcm_cache.clear()
+            QMessageBox.information(
+                self, "Success", f"Cleared {freed_mb:.1f} MB of cached transcripts and decoded audio."
+            )
+    
+    def manage_models(self):
+        cache_dir = models_dir()
+        mirror = mirror_dir()
+        location = f"Location: {cache_dir}"
+        if mirror:
+            location += f"\nMirror: {mirror}"
         
-        models = list(cache_dir.glob("*.pt"))
+        if not WHISPER_AVAILABLE:
+            QMessageBox.information(self, "No Models", "Install Whisper to manage models.")
+            return
+        models = installed_models()
         if not models:
-            QMessageBox.information(self, "No Models", "No models found in cache.")
+            QMessageBox.information(self, "No Models", f"No models found in cache.\n\n{location}")
             return
         
         model_info = []
-        for m in sorted(models):
-            size_mb = m.stat().st_size / (1024 * 1024)
-            model_info.append(f"• {m.stem} ({size_mb:.0f} MB)")
+        for file_name, names, size_mb in models:
+            label = ", ".join(names) if names else f"{Path(file_name).stem} (not a standard model)"
+            model_info.append(f"• {label} ({size_mb:.0f} MB)")
         
         QMessageBox.information(
             self, "Downloaded Models",
-            f"Downloaded models:\n\n" + "\n".join(model_info) + f"\n\nLocation: {cache_dir}"
+            f"Downloaded models:\n\n" + "\n".join(model_info) + f"\n\n{location}"
+        )
+    
+    def download_models(self):
+        """Fetch models ahead of time, several at once; interrupted downloads resume"""
+        if not WHISPER_AVAILABLE:
+            QMessageBox.warning(self, "Whisper Not Installed", "Please install Whisper first.")
+            return
+        from voxtext_models import model_path
+        
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Download Models")
+        dialog.setMinimumWidth(420)
+        layout = QVBoxLayout(dialog)
+        layout.addWidget(QLabel("Models are checked (SHA-256) after downloading.\nInterrupted downloads resume where they stopped."))
+        
+        rows = {}
+        for name in MODEL_NAMES:
+            downloaded = model_path(name).exists()
+            check = QCheckBox(f"{name.capitalize()}" + (" (downloaded)" if downloaded else ""))
+            check.setEnabled(not downloaded)
+            bar = QProgressBar()
+            bar.setValue(100 if downloaded else 0)
+            bar.setFormat("%p%")
+            row = QHBoxLayout()
+            row.addWidget(check, 1)
+            row.addWidget(bar, 2)
+            layout.addLayout(row)
+            rows[name] = (check, bar)
+        
+        status = QLabel("")
+        layout.addWidget(status)
+        buttons = QHBoxLayout()
+        buttons.addStretch()
+        download_btn = QPushButton("Download")
+        close_btn = QPushButton("Close")
+        buttons.addWidget(download_btn)
+        buttons.addWidget(close_btn)
+        layout.addLayout(buttons)
+        
+        worker_ref = []
+        
+        def on_progress(name, done_mb, total_mb):
+            bar = rows[name][1]
+            if total_mb:
+                bar.setValue(int(done_mb * 100 / total_mb))
+            bar.setFormat(f"%p%  {done_mb:,.0f} / {total_mb:,.0f} MB" if total_mb else f"{done_mb:,.0f} MB")
+        
+        def on_model_done(name, error):
+            check, bar = rows[name]
+            if error:
+                bar.setFormat("Failed")
+                bar.setToolTip(error)
+                status.setText(f"{name}: {error.splitlines()[0]}")
+            else:
+                bar.setValue(100)
+                bar.setFormat("Done")
+                check.setText(f"{name.capitalize()} (downloaded)")
+                check.setChecked(False)
+                check.setEnabled(False)
+        
+        def start():
+            names = [name for name, (check, _) in rows.items() if check.isChecked()]
+            if not names:
+                return
+            download_btn.setEnabled(False)
+            status.setText(f"Downloading {', '.join(names)}...")
+            worker = ModelDownloadWorker(names)
+            worker.progress.connect(on_progress)
+            worker.model_done.connect(on_model_done)
+            worker.finished.connect(lambda: download_btn.setEnabled(True))
+            worker_ref[:] = [worker]
+            worker.start()
+        
+        def on_close():
+            # Partial files are kept, so a cancelled download picks up where it stopped
+            if worker_ref and worker_ref[0].isRunning():
+                worker_ref[0].cancel()
+                worker_ref[0].wait()
+        
+        download_btn.clicked.connect(start)
+        close_btn.clicked.connect(dialog.reject)
+        dialog.finished.connect(on_close)
+        dialog.exec()
+    
+    def set_model_budget(self):
+        """Set how much RAM loaded models may keep resident between jobs"""
+        resident = self.model_cache.resident()
+        if resident:
+            loaded = ", ".join(f"{name} ({size_mb:.0f} MB)" for name, size_mb in resident)
+        else:
+            loaded = "none"
+        
+        budget_mb, ok = QInputDialog.getInt(
+            self, "Model Memory Budget",
+            f"Keep loaded models in memory up to (MB):\n\nCurrently loaded: {loaded}",
+            self.model_cache.budget_mb, 0, 1024 * 1024, 256
         )
+        if ok:
+            self.model_cache.set_budget(budget_mb)
+            self.settings.setValue("model_budget_mb", budget_mb)
+    
+    def set_parallel_jobs(self):
+        """Set how many queued files are transcribed at once in separate processes"""
+        cores = cpu_cores()
+        jobs, ok = QInputDialog.getInt(
+            self, "Parallel Batch Jobs",
+            f"Files to transcribe at once when a batch is queued:\n\n"
+            f"Each job loads its own copy of the model and gets an equal share of "
+            f"this computer's {cores} CPU cores. Use 1 to process files one at a time.",
+            self.settings.value("parallel_jobs", 1, type=int), 1, cores, 1
+        )
+        if ok:
+            self.settings.setValue("parallel_jobs", jobs)
+    
+    def unload_models(self):
+        if self.worker and self.worker.isRunning():
+            QMessageBox.warning(self, "Busy", "Please wait for the current transcription to finish.")
+            return
+        
+        used_mb = self.model_cache.used_mb()
+        self.model_cache.clear()
+        self.status_label.setText(f"Unloaded models ({used_mb:.0f} MB freed)")
     
     def open_model_folder(self):
         import platform
         import subprocess
         
-        home = Path.home()
-        if platform.system() == "Darwin":
-            cache_dir = home / ".cache" / "whisper"
-        elif platform.system() == "Windows":
-            cache_dir = home / "AppData" / "Local" / "whisper"
-        else:
-            cache_dir = home / ".cache" / "whisper"
-        
+        cache_dir = models_dir()
         cache_dir.mkdir(parents=True, exist_ok=True)
         
         try:
@@ -1198,6 +2067,134 @@ class VoxtextWindow(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to open folder:\n\n{str(e)}")
     
+    def choose_model_store(self):
+        """Pick the folder models are loaded from and downloaded into"""
+        folder = QFileDialog.getExistingDirectory(self, "Select Model Store Folder", str(models_dir()))
+        if not folder:
+            return
+        self.settings.setValue("model_dir", folder)
+        configure_store(model_dir=folder)
+        self.status_label.setText(f"Models are now stored in {folder}")
+        self.preload_selected_model()
+    
+    def choose_model_mirror(self):
+        """Pick a folder or mounted share to copy models from instead of downloading"""
+        current = mirror_dir()
+        if current:
+            result = QMessageBox.question(
+                self, "Model Mirror",
+                f"Models are copied from:\n{current}\n\nChoose a different mirror folder? "
+                f"(No stops using a mirror.)",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No | QMessageBox.StandardButton.Cancel
+            )
+            if result == QMessageBox.StandardButton.Cancel:
+                return
+            if result == QMessageBox.StandardButton.No:
+                self.settings.setValue("model_mirror", "")
+                configure_store(mirror="")
+                return
+        
+        folder = QFileDialog.getExistingDirectory(self, "Select Model Mirror Folder")
+        if folder:
+            self.settings.setValue("model_mirror", folder)
+            configure_store(mirror=folder)
+    
+    def set_offline(self, checked):
+        self.settings.setValue("offline", checked)
+        configure_store(offline=checked)
+    
+    def set_mmap_weights(self, checked):
+        """Applies to models loaded from now on; resident models are unloaded so it takes effect"""
+        self.settings.setValue("mmap_weights", checked)
+        configure_store(mmap_weights=checked)
+        if not self.is_busy():
+            self.model_cache.clear()
+            self.preload_selected_model()
+    
+    def set_quantize(self, checked):
+        self.settings.setValue("quantize", checked)
+        self.preload_selected_model()
+    
+    def selected_backend(self):
+        return self.backend_group.checkedAction().data()
+    
+    def set_backend(self, action):
+        self.settings.setValue("backend", action.data())
+        self.preload_selected_model()
+    
+    def compare_quantized(self):
+        """Time the selected model in float32 and int8 on a clip and compare the transcripts"""
+        if not WHISPER_AVAILABLE:
+            QMessageBox.warning(self, "Whisper Not Installed", "Please install Whisper first.")
+            return
+        if self.is_busy():
+            return
+        clip, _ = QFileDialog.getOpenFileName(
+            self,
+            "Select a Short Reference Clip (1-2 minutes)",
+            "",
+            "Media Files (*.mp3 *.mp4 *.wav *.m4a *.flac *.ogg *.mov *.avi *.mkv *.webm);;All Files (*.*)"
+        )
+        if not clip:
+            return
+        
+        self.compare_worker = QuantizationCompareWorker(self.selected_model_name(), clip)
+        self.compare_worker.progress.connect(self.status_label.setText)
+        self.compare_worker.done.connect(self.on_compare_done)
+        self.compare_worker.failed.connect(
+            lambda error_msg: QMessageBox.critical(self, "Error", f"Comparison failed:\n\n{error_msg}")
+        )
+        self.compare_worker.start()
+    
+    def on_compare_done(self, summary):
+        self.status_label.setText("int8 comparison finished.")
+        QMessageBox.information(
+            self, "int8 vs fp32",
+            f"{summary}\n\nWord differences are measured against the full-precision "
+            f"transcript; a few percent is typical and mostly punctuation-level wording."
+        )
+    
+    def import_models(self):
+        if not WHISPER_AVAILABLE:
+            QMessageBox.warning(self, "Whisper Not Installed", "Please install Whisper first.")
+            return
+        bundle, _ = QFileDialog.getOpenFileName(
+            self, "Import Models", "", "Model Bundles (*.zip);;All Files (*.*)"
+        )
+        if bundle:
+            self.run_bundle_job("import", bundle)
+    
+    def export_models(self):
+        if not WHISPER_AVAILABLE:
+            QMessageBox.warning(self, "Whisper Not Installed", "Please install Whisper first.")
+            return
+        if not installed_models():
+            QMessageBox.information(self, "No Models", "No models have been downloaded yet.")
+            return
+        bundle, _ = QFileDialog.getSaveFileName(
+            self, "Export Models", "voxtext-models.zip", "Model Bundles (*.zip)"
+        )
+        if bundle:
+            self.run_bundle_job("export", bundle)
+    
+    def run_bundle_job(self, kind, bundle):
+        self.bundle_worker = ModelBundleWorker(kind, bundle)
+        self.bundle_worker.progress.connect(self.status_label.setText)
+        self.bundle_worker.done.connect(self.on_bundle_done)
+        self.bundle_worker.failed.connect(
+            lambda error_msg: QMessageBox.critical(self, "Error", f"Model {kind} failed:\n\n{error_msg}")
+        )
+        self.bundle_worker.start()
+    
+    def on_bundle_done(self, kind, names):
+        models = ", ".join(names) or "none"
+        if kind == "import":
+            self.status_label.setText(f"Imported models: {models}")
+            QMessageBox.information(self, "Success", f"Imported models: {models}\n\nStore: {models_dir()}")
+        else:
+            self.status_label.setText(f"Exported models: {models}")
+            QMessageBox.information(self, "Success", f"Exported models: {models}")
+    
     def show_getting_started(self):
         QMessageBox.information(
             self, "Getting Started",
@@ -1206,6 +2203,7 @@ class VoxtextWindow(QMainWindow):
 1. SELECT A FILE
    Click the drop zone or drag & drop an audio/video file
    Supported: MP3, MP4, WAV, M4A, MOV, and more
+   Drop several files or a whole folder to queue a batch
 
 2. CHOOSE A MODEL
    Tiny/Base: Fast, good for older computers
@@ -1231,7 +2229,72 @@ TIPS:
 • Models download once, then cached forever"""
         )
     
+    def run_benchmark(self):
+        """Measure every installed model on this computer for the speed guide and ETAs"""
+        from voxtext_bench import benchmark_targets
+        
+        if self.benchmark_worker and self.benchmark_worker.isRunning():
+            self.benchmark_worker.cancelled = True
+            self.status_label.setText("Stopping benchmark...")
+            return
+        if self.is_busy():
+            return
+        targets = benchmark_targets()
+        if not targets:
+            QMessageBox.information(
+                self, "Benchmark", "No models are installed yet. Download one with Tools > Download Models..."
+            )
+            return
+        
+        reply = QMessageBox.question(
+            self, "Benchmark This Computer",
+            f"Measure {len(targets)} installed model/engine combination(s)?\n\n"
+            f"Choose a speech recording of about a minute next. Without one, synthesized audio "
+            f"measures load time and memory only: Whisper skips most of it as non-speech, so its "
+            f"speed is not used for the speed guide or time estimates.\n\nEach model is loaded "
+            f"fresh, so this takes a while with the larger models. Choose Help > Benchmark This "
+            f"Computer... again to stop.",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+        clip_path, _ = QFileDialog.getOpenFileName(
+            self, "Select a Speech Recording (Cancel for Synthetic Audio)", "",
+            "Media Files (*.mp3 *.mp4 *.wav *.m4a *.flac *.ogg *.mov *.avi *.mkv *.webm);;All Files (*.*)"
+        )
+        
+        self.benchmark_worker = BenchmarkWorker(targets, self.quantize_action.isChecked(), clip_path or None)
+        self.benchmark_worker.progress.connect(self.status_label.setText)
+        self.benchmark_worker.done.connect(self.on_benchmark_done)
+        self.benchmark_worker.failed.connect(
+            lambda error_msg: QMessageBox.critical(self, "Error", f"Benchmark failed:\n\n{error_msg}")
+        )
+        self.benchmark_worker.start()
+    
+    def on_benchmark_done(self, runs):
+        from voxtext_bench import describe_run, is_synthetic
+        
+        if not runs:
+            self.status_label.setText("Benchmark stopped.")
+            return
+        self.status_label.setText("Benchmark finished.")
+        if any(is_synthetic(run) for run in runs):
+            note = ("Measured on synthetic audio, so these speeds are not used for the speed guide "
+                    "or time estimates. Benchmark with a speech recording for those.")
+        else:
+            note = "Help > Processing Speed Guide now shows these measured times."
+        QMessageBox.information(
+            self, "Benchmark Results", "\n".join(describe_run(run) for run in runs) + "\n\n" + note
+        )
+    
     def show_speed_guide(self):
+        from voxtext_bench import speed_guide_lines
+        
+        measured = speed_guide_lines()
+        if measured:
+            measured_text = "MEASURED ON THIS COMPUTER (for 10 min audio):\n" + "\n".join(measured) + "\n\n"
+        else:
+            measured_text = "Run Help > Benchmark This Computer... to see\ntimes measured on your own machine.\n\n"
         QMessageBox.information(
             self, "Processing Speed Guide",
             """Processing Speed Guide
@@ -1240,7 +2303,7 @@ WHY IS IT SLOW?
 Transcription happens locally on your computer.
 Speed depends on model size, CPU/GPU, and audio length.
 
-TYPICAL TIMES (for 10 min audio):
+""" + measured_text + """TYPICAL TIMES (for 10 min audio):
 
 MODERN COMPUTER (2020+):
 • Tiny: 30 seconds - 1 minute
@@ -1253,7 +2316,14 @@ OLDER COMPUTER:
 • Tiny: 2-3 minutes
 • Base: 3-5 minutes
 • Small: 5-10 minutes
-• Medium/Large: Not recommended
+• Medium/Large: Not recommended, unless
+  Tools > Fast CPU Mode (int8) is turned on
+
+FAST CPU MODE (int8):
+Shrinks the model's weights to 8-bit numbers.
+Often 1.5-2.5x faster on CPU with nearly
+identical text. Use Tools > Compare int8 Speed
+and Accuracy... to check on your own audio.
 
 RECOMMENDATIONS:
 • Podcasts: Medium or Small
@@ -1267,6 +2337,13 @@ REMEMBER:
         )
     
     def show_about(self):
+        timing = ""
+        if self.startup_seconds is not None:
+            timing = f"Window ready in {self.startup_seconds:.2f}s"
+            if self.warm_up_seconds is not None:
+                timing += f", Whisper loaded in the background in {self.warm_up_seconds:.2f}s"
+            timing = f"\n\n<p><small>{timing}</small></p>"
+        
         QMessageBox.about(
             self, "About Voxtext",
             """<h2>Voxtext</h2>
@@ -1286,7 +2363,7 @@ Part of the Vox Suite</p>
 
 <p><a href="https://donburnside.com">donburnside.com</a></p>
 
-<p><i>Also check out Voxsmith for AI narration</i></p>"""
+<p><i>Also check out Voxsmith for AI narration</i></p>""" + timing
         )
 
 
@@ -1294,6 +2371,14 @@ def main():
     # CRITICAL: Prevents PyInstaller from spawning duplicate windows
     multiprocessing.freeze_support()
     
+    # "voxtext cli ..." runs the headless CLI instead of the window. Anything
+    # else is files opened with the app ("Open With", dropped on the icon),
+    # which are queued in the window (macOS passes -psn_* from Finder)
+    args = [a for a in sys.argv[1:] if not a.startswith("-psn_")]
+    if args and args[0] == "cli":
+        from voxtext_cli import main as cli_main
+        sys.exit(cli_main(args[1:]))
+    
     app = QApplication(sys.argv)
     app.setApplicationName("Voxtext")
     app.setOrganizationName("Vox Suite")
@@ -1304,6 +2389,10 @@ def main():
     
     window = VoxtextWindow()
     window.show()
+    QTimer.singleShot(0, window.on_first_show)
+    opened = [a for a in args if os.path.exists(a)]
+    if opened:
+        QTimer.singleShot(0, lambda: window.add_to_queue(opened))
     
     sys.exit(app.exec())
 
@@ -0,0 +1,176 @@
+"""
+Voxtext int8 CPU mode
+
+Applies PyTorch dynamic int8 quantization to a Whisper model's linear layers
+(the bulk of its weights and compute), which makes the larger models
+practical on CPU-only machines. The quantized weights are saved next to the
+checkpoint in the model store (a state dict read back with torch.load's
+weights_only, so a file in a shared store cannot run code) and so the
+conversion runs once per model and torch version. compare_quantized()
+measures the speed and accuracy cost against the float32 model on a
+reference clip.
+"""
+
+import re
+import time
+from pathlib import Path
+
+QUANTIZED_SUFFIX = ".int8"  # not .pt, which the model store lists as checkpoints
+
+
+def quantized_path(checkpoint_path):
+    """Cached quantized weights for a checkpoint; tied to the torch version that packed them"""
+    import torch
+    
+    version = torch.__version__.split("+")[0]
+    checkpoint_path = Path(checkpoint_path)
+    return checkpoint_path.with_name(f"{checkpoint_path.stem}.torch{version}{QUANTIZED_SUFFIX}")
+
+
+def quantize_model(model):
+    """Quantize the model's linear layers to int8 in place (CPU only) and return it"""
+    import torch
+    from whisper.model import Linear as WhisperLinear
+    
+    # Whisper's Linear only adds a dtype cast to nn.Linear's forward; it must be
+    # a plain nn.Linear for quantize_dynamic to recognise and replace it
+    for module in model.modules():
+        if type(module) is WhisperLinear:
+            module.__class__ = torch.nn.Linear
+    return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+
+
+def save_quantized_weights(model, path):
+    """Write a quantized model's dims and state dict (atomically)"""
+    import torch
+    from dataclasses import asdict
+    from voxtext_cache import atomic_write_file
+    
+    checkpoint = {'dims': asdict(model.dims), 'model_state_dict': model.state_dict()}
+    atomic_write_file(path, lambda f: torch.save(checkpoint, f), private=False)
+
+
+def load_quantized_weights(model_name, path):
+    """Rebuild a quantized model from saved weights, without unpickling any code"""
+    import torch
+    from torch.ao.nn.quantized.dynamic import Linear as DynamicLinear
+    from whisper.model import ModelDimensions
+    from voxtext_weights import model_skeleton, finish_model
+    
+    checkpoint = torch.load(path, map_location="cpu", weights_only=True)
+    model = model_skeleton(ModelDimensions(**checkpoint['dims']))
+    # The layers quantize_model() replaces, empty and ready for the saved int8 weights
+    for module in list(model.modules()):
+        for name, child in module.named_children():
+            if isinstance(child, torch.nn.Linear):
+                setattr(module, name, DynamicLinear(
+                    child.in_features, child.out_features, bias_=child.bias is not None, dtype=torch.qint8
+                ))
+    model.to_empty(device="cpu")
+    model.load_state_dict(checkpoint['model_state_dict'])
+    return finish_model(model, model_name)
+
+
+def load_quantized_model(model_name, checkpoint_path, load_float_model):
+    """
+    Load the cached quantized weights, or quantize load_float_model() (a CPU
+    float32 model) and cache them. Returns (model, converted). When the store
+    cannot be written (a shared or read-only mirror) the model is quantized
+    in memory every time.
+    """
+    path = quantized_path(checkpoint_path)
+    if path.exists():
+        try:
+            return load_quantized_weights(model_name, path), False
+        except Exception:
+            try:
+                path.unlink()  # written by an incompatible torch/whisper; rebuilt below
+            except OSError:
+                pass
+    
+    model = quantize_model(load_float_model())
+    try:
+        save_quantized_weights(model, path)
+    except OSError:
+        pass
+    return model, True
+
+
+def word_error_rate(reference, hypothesis):
+    """Word-level edit distance divided by the reference length (case and punctuation ignored)"""
+    ref = re.findall(r"[\w']+", reference.lower())
+    hyp = re.findall(r"[\w']+", hypothesis.lower())
+    if not ref:
+        return 0.0 if not hyp else 1.0
+    previous = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, 1):
+        current = [i]
+        for j, hyp_word in enumerate(hyp, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ref_word != hyp_word),
+            ))
+        previous = current
+    return previous[-1] / len(ref)
+
+
+def compare_quantized(model_name, clip_path, decode_options=None, progress=None, is_cancelled=None):
+    """
+    Transcribe a reference clip with the float32 and the int8 model and
+    report both timings and the int8 word error rate against float32.
+    Raises TranscriptionCancelled within one forward pass of is_cancelled().
+    """
+    from voxtext_audio import load_audio, duration_seconds
+    from voxtext_engine import load_whisper_model, cancellation_hooks, TranscriptionCancelled, DEFAULT_OPTIONS
+    
+    progress = progress or (lambda message: None)
+    is_cancelled = is_cancelled or (lambda: False)
+    
+    def check_cancelled():
+        if is_cancelled():
+            raise TranscriptionCancelled()
+    
+    decode_options = decode_options or {
+        'language': DEFAULT_OPTIONS['language'], 'task': DEFAULT_OPTIONS['task']
+    }
+    audio = load_audio(clip_path)
+    
+    runs = {}
+    for label, quantize in (('fp32', False), ('int8', True)):
+        check_cancelled()
+        progress(f"Loading {model_name} ({label})...")
+        started = time.perf_counter()
+        model = load_whisper_model(model_name, is_cancelled=is_cancelled, quantize=quantize, device="cpu")
+        load_seconds = time.perf_counter() - started
+        check_cancelled()
+        progress(f"Transcribing the reference clip ({label})...")
+        started = time.perf_counter()
+        with cancellation_hooks(model, check_cancelled):
+            result = model.transcribe(audio, fp16=False, **decode_options)
+        runs[label] = {
+            'load_seconds': load_seconds,
+            'transcribe_seconds': time.perf_counter() - started,
+            'text': result['text'],
+        }
+        del model
+    
+    return {
+        'model': model_name,
+        'clip_seconds': duration_seconds(audio),
+        'fp32': runs['fp32'],
+        'int8': runs['int8'],
+        'speedup': runs['fp32']['transcribe_seconds'] / max(runs['int8']['transcribe_seconds'], 1e-6),
+        'word_error_rate': word_error_rate(runs['fp32']['text'], runs['int8']['text']),
+    }
+
+
+def describe_comparison(report):
+    """Human-readable summary of compare_quantized()"""
+    fp32, int8 = report['fp32'], report['int8']
+    return (
+        f"{report['model']} on a {report['clip_seconds']:.0f}s clip:\n"
+        f"  fp32: {fp32['transcribe_seconds']:.1f}s\n"
+        f"  int8: {int8['transcribe_seconds']:.1f}s ({report['speedup']:.2f}x faster)\n"
+        f"  int8 word differences vs fp32: {report['word_error_rate'] * 100:.1f}%"
+    )
@@ -0,0 +1,213 @@
+"""
+Voxtext transcript search index
+
+Every transcript Voxtext produces is recorded in a local SQLite database
+(search.db in the user cache folder): the media and output files plus each
+segment's text and timestamps. Segment text is indexed with SQLite's FTS5
+full-text engine (an external-content table kept in sync by triggers), so a
+query over hundreds of thousands of segments returns ranked hits with their
+timecodes in milliseconds. Re-transcribing a file replaces its entry.
+
+Saved JSON/.vxt transcripts made elsewhere can be added with add_saved(); a
+transcript Voxtext wrote updates the entry it already belongs to. prune()
+forgets entries whose files have all been deleted.
+"""
+
+import re
+import json
+import sqlite3
+from pathlib import Path
+from datetime import datetime
+
+SCHEMA_VERSION = 1
+# Outputs preferred as "the transcript" of an entry, best first
+TRANSCRIPT_PREFERENCE = ['.vxt', '.json', '.srt', '.vtt', '.txt', '.md', '.html']
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS transcripts (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    media TEXT,
+    transcript TEXT,
+    outputs TEXT NOT NULL,
+    model TEXT,
+    language TEXT,
+    duration REAL,
+    indexed_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS segments (
+    id INTEGER PRIMARY KEY,
+    transcript_id INTEGER NOT NULL REFERENCES transcripts(id),
+    start_seconds REAL NOT NULL,
+    end_seconds REAL NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS segments_by_transcript ON segments(transcript_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS segments_fts USING fts5(
+    text, content='segments', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS segments_added AFTER INSERT ON segments BEGIN
+    INSERT INTO segments_fts(rowid, text) VALUES (new.id, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS segments_removed AFTER DELETE ON segments BEGIN
+    INSERT INTO segments_fts(segments_fts, rowid, text) VALUES ('delete', old.id, old.text);
+END;
+"""
+
+
+def search_index_path():
+    from voxtext_cache import user_cache_dir
+    return user_cache_dir() / "search.db"
+
+
+def fts_query(text):
+    """
+    Turn what a user types into an FTS5 query: every word or "quoted phrase"
+    must appear; a trailing * matches any word starting with the prefix.
+    """
+    terms = []
+    for phrase, word in re.findall(r'"([^"]*)"|(\S+)', text):
+        term = phrase if phrase else word
+        prefix = not phrase and term.endswith('*')
+        term = term.rstrip('*').replace('"', '""').strip()
+        if term:
+            terms.append(f'"{term}"' + ('*' if prefix else ''))
+    return " ".join(terms)
+
+
+def _pick_transcript(created_files):
+    by_suffix = {Path(path).suffix.lower(): str(path) for path in created_files}
+    for suffix in TRANSCRIPT_PREFERENCE:
+        if suffix in by_suffix:
+            return by_suffix[suffix]
+    return None
+
+
+class SearchIndex:
+    """The search database; use as a context manager or close() it"""
+    
+    def __init__(self, path=None):
+        self.path = Path(path) if path else search_index_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(str(self.path), timeout=30)  # parallel workers take turns writing
+        try:
+            self.db.execute("PRAGMA journal_mode=WAL")  # searches do not wait for a job being indexed
+            version = self.db.execute("PRAGMA user_version").fetchone()[0]
+            if version != SCHEMA_VERSION:
+                with self.db:
+                    self.db.executescript(_SCHEMA)
+                    self.db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        except BaseException:
+            self.db.close()
+            raise
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def close(self):
+        self.db.close()
+    
+    def add(self, media_path, result, created_files=(), model=None):
+        """Record (or replace) a transcribed file's segments"""
+        media = str(Path(media_path).resolve()) if media_path else None
+        outputs = [str(Path(path).resolve()) for path in created_files]
+        transcript = _pick_transcript(outputs)
+        key = media or transcript
+        if key is None:
+            raise ValueError("a search entry needs a media file or a saved transcript")
+        segments = result['segments']
+        with self.db:
+            self._remove(key)
+            # A saved transcript indexed on its own before is now part of this entry
+            for output in outputs:
+                self._remove(output)
+            cursor = self.db.execute(
+                "INSERT INTO transcripts (key, media, transcript, outputs, model, language, duration, indexed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key, media, transcript, json.dumps(outputs), model, result.get('language'),
+                    max((segment['end'] for segment in segments), default=0.0),
+                    datetime.now().isoformat(timespec='seconds'),
+                )
+            )
+            transcript_id = cursor.lastrowid
+            self.db.executemany(
+                "INSERT INTO segments (transcript_id, start_seconds, end_seconds, text) VALUES (?, ?, ?, ?)",
+                ((transcript_id, segment['start'], segment['end'], segment['text'].strip()) for segment in segments)
+            )
+        return len(segments)
+    
+    def add_saved(self, transcript_path):
+        """
+        Record a saved JSON or .vxt transcript. One written by a job already
+        in the index refreshes that entry (keeping its media file); others
+        get an entry of their own.
+        """
+        from voxtext_engine import load_transcript
+        
+        result = load_transcript(transcript_path)
+        path = str(Path(transcript_path).resolve())
+        row = self.db.execute(
+            "SELECT media, outputs, model FROM transcripts "
+            "WHERE EXISTS (SELECT 1 FROM json_each(outputs) WHERE value = ?)",
+            (path,)
+        ).fetchone()
+        if row:
+            media, outputs, model = row
+            return self.add(media, result, json.loads(outputs), model)
+        return self.add(None, result, [path])
+    
+    def _remove(self, key):
+        row = self.db.execute("SELECT id FROM transcripts WHERE key = ?", (key,)).fetchone()
+        if row:
+            self.db.execute("DELETE FROM segments WHERE transcript_id = ?", row)
+            self.db.execute("DELETE FROM transcripts WHERE id = ?", row)
+    
+    def remove(self, path):
+        """Forget the entry for a media file or saved transcript"""
+        with self.db:
+            self._remove(str(Path(path).resolve()))
+    
+    def prune(self):
+        """Forget entries whose media and outputs are all gone; returns how many"""
+        stale = []
+        for entry_id, media, outputs in self.db.execute("SELECT id, media, outputs FROM transcripts"):
+            paths = ([media] if media else []) + json.loads(outputs)
+            if not any(Path(path).exists() for path in paths):
+                stale.append((entry_id,))
+        with self.db:
+            self.db.executemany("DELETE FROM segments WHERE transcript_id = ?", stale)
+            self.db.executemany("DELETE FROM transcripts WHERE id = ?", stale)
+        return len(stale)
+    
+    def counts(self):
+        """(transcripts, segments) in the index"""
+        return (
+            self.db.execute("SELECT count(*) FROM transcripts").fetchone()[0],
+            self.db.execute("SELECT count(*) FROM segments").fetchone()[0],
+        )
+    
+    def search(self, query, limit=50, mark=("[", "]")):
+        """
+        Best-matching segments first, as dicts with media, transcript, start,
+        end, text and snippet (the matched words wrapped in mark).
+        """
+        match = fts_query(query)
+        if not match:
+            return []
+        rows = self.db.execute(
+            "SELECT t.media, t.transcript, s.start_seconds, s.end_seconds, s.text, "
+            "snippet(segments_fts, 0, ?, ?, '…', 16) "
+            "FROM segments_fts "
+            "JOIN segments s ON s.id = segments_fts.rowid "
+            "JOIN transcripts t ON t.id = s.transcript_id "
+            "WHERE segments_fts MATCH ? ORDER BY rank LIMIT ?",
+            (mark[0], mark[1], match, limit)
+        )
+        return [
+            {'media': media, 'transcript': transcript, 'start': start, 'end': end, 'text': text, 'snippet': snippet}
+            for media, transcript, start, end, text, snippet in rows
+        ]
@@ -0,0 +1,126 @@
+"""
+Voxtext voice-activity detection
+
+Energy-based speech detection used as an optional pre-pass: only the speech
+regions are handed to Whisper (joined end to end), and the resulting
+timestamps are mapped back onto the original recording's timeline. Long
+silences in lecture captures and room recordings then cost no decoder time
+and cannot produce hallucinated text.
+"""
+
+from bisect import bisect_left, bisect_right
+
+from voxtext_audio import SAMPLE_RATE, FRAME_SECONDS, frame_energies, smooth
+
+THRESHOLD_ABOVE_FLOOR_DB = 12.0  # speech must be this much louder than the noise floor
+MIN_THRESHOLD_DB = -55.0  # ...and never quieter than this (digital silence files)
+MIN_SPEECH_SECONDS = 0.25  # shorter blips are dropped
+MIN_SILENCE_SECONDS = 0.8  # shorter pauses are kept inside the speech region
+PAD_SECONDS = 0.2  # context kept around every region so word edges are not clipped
+# Below this share of the recording the threshold is assumed to have missed
+# the speech (music beds, steady room noise, heavy compression) rather than
+# the file being silent, and the full audio is decoded instead
+MIN_SPEECH_SHARE = 0.05
+
+
+class SpeechMap:
+    """Speech regions of a recording and the mapping between both timelines"""
+    
+    def __init__(self, regions, total_samples):
+        self.regions = regions  # [(start_sample, end_sample)] in the original audio
+        self.total_samples = total_samples
+        # Where each region starts in the collapsed (speech-only) audio
+        self.collapsed_starts = []
+        position = 0
+        for start, end in regions:
+            self.collapsed_starts.append(position)
+            position += end - start
+        self.collapsed_samples = position
+    
+    @property
+    def speech_seconds(self):
+        return self.collapsed_samples / SAMPLE_RATE
+    
+    @property
+    def skipped_seconds(self):
+        return (self.total_samples - self.collapsed_samples) / SAMPLE_RATE
+    
+    @property
+    def is_reliable(self):
+        """False when so little speech was found that the detection likely failed"""
+        return self.collapsed_samples >= MIN_SPEECH_SHARE * self.total_samples
+    
+    def collapse(self, audio):
+        """Join the speech regions of the audio end to end"""
+        import numpy as np
+        
+        if not self.regions:
+            return np.zeros(0, dtype=np.float32)
+        return np.concatenate([audio[start:end] for start, end in self.regions])
+    
+    def to_original(self, seconds, is_end=False):
+        """Map a time in the collapsed audio back to the original recording"""
+        if not self.regions:
+            return seconds
+        sample = seconds * SAMPLE_RATE
+        # An end time exactly on a joint belongs to the region before it
+        if is_end:
+            index = bisect_left(self.collapsed_starts, sample) - 1
+        else:
+            index = bisect_right(self.collapsed_starts, sample) - 1
+        index = min(max(index, 0), len(self.regions) - 1)
+        start, end = self.regions[index]
+        original = start + (sample - self.collapsed_starts[index])
+        return min(original, end) / SAMPLE_RATE
+    
+    def remap_result(self, result):
+        """Move every segment (and word) timestamp onto the original timeline, in place"""
+        for segment in result.get('segments', []):
+            segment['start'] = self.to_original(segment['start'])
+            segment['end'] = max(self.to_original(segment['end'], is_end=True), segment['start'])
+            for word in segment.get('words') or []:
+                word['start'] = self.to_original(word['start'])
+                word['end'] = max(self.to_original(word['end'], is_end=True), word['start'])
+        return result
+
+
+def detect_speech(audio):
+    """Find speech regions with an adaptive threshold over the noise floor"""
+    import numpy as np
+    
+    total = len(audio)
+    levels = frame_energies(audio)
+    if len(levels) == 0:
+        return SpeechMap([], total)
+    
+    levels = smooth(levels, 5)  # 100 ms
+    floor = float(np.percentile(levels, 10))
+    threshold = max(floor + THRESHOLD_ABOVE_FLOOR_DB, MIN_THRESHOLD_DB)
+    voiced = levels > threshold
+    
+    # Runs of voiced frames -> (start_frame, end_frame)
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], voiced.astype(np.int8), [0]))))
+    runs = list(zip(edges[::2].tolist(), edges[1::2].tolist()))
+    
+    min_silence = int(MIN_SILENCE_SECONDS / FRAME_SECONDS)
+    min_speech = int(MIN_SPEECH_SECONDS / FRAME_SECONDS)
+    merged = []
+    for start, end in runs:
+        if merged and start - merged[-1][1] < min_silence:
+            merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    
+    frame = int(SAMPLE_RATE * FRAME_SECONDS)
+    pad = int(PAD_SECONDS * SAMPLE_RATE)
+    regions = []
+    for start, end in merged:
+        if end - start < min_speech:
+            continue
+        start_sample = max(0, start * frame - pad)
+        end_sample = min(total, end * frame + pad)
+        if regions and start_sample <= regions[-1][1]:
+            regions[-1] = (regions[-1][0], end_sample)
+        else:
+            regions.append((start_sample, end_sample))
+    return SpeechMap(regions, total)
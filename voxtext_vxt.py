@@ -0,0 +1,320 @@
+"""
+Voxtext binary transcript format (.vxt)
+
+A compact, columnar container for a Whisper result that can be queried
+without parsing the whole file:
+
+    preamble   b"VXT1", format version (uint32), header length (uint32)
+    header     UTF-8 JSON: segment count, the result's other fields and a
+               directory of columns (dtype, byte offset, length)
+    columns    little-endian arrays, each aligned to 8 bytes
+
+Per-segment start and end times are float64 arrays; the segment texts sit
+in one UTF-8 blob indexed by an offsets array (as do tokens, word timings
+and any fields that are not plain numbers). Two index columns, the running
+maximum of the end times and the suffix minimum of the start times, let
+VxtFile.segments(start, end) binary-search the segments overlapping a time
+range on a memory-mapped file, reading only those segments' bytes.
+
+encode_vxt(result) and VxtFile(path).to_result() round-trip the result dict.
+"""
+
+import mmap
+import json
+import struct
+from pathlib import Path
+
+import numpy as np
+
+MAGIC = b"VXT1"
+FORMAT_VERSION = 1
+ALIGNMENT = 8
+_PREAMBLE = struct.Struct("<4sII")
+
+WORD_KEYS = ('word', 'start', 'end', 'probability')
+_ABSENT = object()
+
+
+def _aligned(size):
+    return -(-size // ALIGNMENT) * ALIGNMENT
+
+
+def _offsets(lengths):
+    offsets = np.zeros(len(lengths) + 1, dtype='<u8')
+    np.cumsum(lengths, out=offsets[1:])
+    return offsets
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class VxtBuilder:
+    """Collects segments one at a time (in order), then encodes the file"""
+    
+    def __init__(self):
+        self.starts = []
+        self.ends = []
+        self.texts = []
+        self.tokens = []
+        self.words = []
+        self.others = []  # the remaining fields of each segment
+        self.key_order = []
+    
+    def add(self, segment):
+        for key in segment:
+            if key not in self.key_order:
+                self.key_order.append(key)
+        self.starts.append(segment['start'])
+        self.ends.append(segment['end'])
+        self.texts.append(segment['text'].encode('utf-8'))
+        self.tokens.append(segment.get('tokens', _ABSENT))
+        self.words.append(segment.get('words', _ABSENT))
+        self.others.append({
+            key: value for key, value in segment.items() if key not in ('start', 'end', 'text', 'tokens', 'words')
+        })
+    
+    def _token_columns(self, columns, extras):
+        if not all(isinstance(tokens, list) and all(isinstance(t, int) for t in tokens) for tokens in self.tokens):
+            for extra, tokens in zip(extras, self.tokens):
+                if tokens is not _ABSENT:
+                    extra['tokens'] = tokens
+            return
+        flat = [token for tokens in self.tokens for token in tokens]
+        wide = flat and (max(flat) >= 2 ** 31 or min(flat) < -2 ** 31)
+        columns['tokens_offsets'] = _offsets([len(tokens) for tokens in self.tokens])
+        columns['tokens'] = np.array(flat, dtype='<i8' if wide else '<i4')
+    
+    def _word_columns(self, columns, extras):
+        def plain(word):
+            return (
+                isinstance(word, dict) and tuple(word) == WORD_KEYS and isinstance(word['word'], str)
+                and all(_is_number(word[key]) for key in WORD_KEYS[1:])
+            )
+        
+        if not all(isinstance(words, list) and all(plain(w) for w in words) for words in self.words):
+            for extra, words in zip(extras, self.words):
+                if words is not _ABSENT:
+                    extra['words'] = words
+            return
+        flat = [word for words in self.words for word in words]
+        word_texts = [word['word'].encode('utf-8') for word in flat]
+        columns['words_offsets'] = _offsets([len(words) for words in self.words])
+        for key in WORD_KEYS[1:]:
+            columns[f'word_{key}'] = np.array([word[key] for word in flat], dtype='<f8')
+        columns['word_text_offsets'] = _offsets([len(text) for text in word_texts])
+        columns['word_text'] = np.frombuffer(b"".join(word_texts), dtype='u1')
+    
+    def finish(self, result):
+        """The encoded file for result, whose segments were all added"""
+        count = len(self.starts)
+        starts = np.array(self.starts, dtype='<f8')
+        ends = np.array(self.ends, dtype='<f8')
+        columns = {
+            'start': starts,
+            'end': ends,
+            # Index: the segments overlapping [a, b) all lie between
+            # searchsorted(end_max, a) and searchsorted(start_min, b)
+            'end_max': np.maximum.accumulate(ends) if count else ends,
+            'start_min': np.minimum.accumulate(starts[::-1])[::-1].copy() if count else starts,
+            'text_offsets': _offsets([len(text) for text in self.texts]),
+            'text': np.frombuffer(b"".join(self.texts), dtype='u1'),
+        }
+        extras = [{} for _ in range(count)]
+        self._token_columns(columns, extras)
+        self._word_columns(columns, extras)
+        
+        numeric = {}
+        for key in self.key_order:
+            if key in ('start', 'end', 'text', 'tokens', 'words'):
+                continue
+            values = [other.get(key) for other in self.others]
+            if all(_is_number(value) for value in values):
+                as_int = all(isinstance(value, int) for value in values)
+                numeric[key] = '<i8' if as_int else '<f8'
+                columns[f'field:{key}'] = np.array(values, dtype=numeric[key])
+            else:
+                for extra, other in zip(extras, self.others):
+                    if key in other:
+                        extra[key] = other[key]
+        if any(extras):
+            encoded = [json.dumps(extra, ensure_ascii=False).encode('utf-8') if extra else b"" for extra in extras]
+            columns['extras_offsets'] = _offsets([len(data) for data in encoded])
+            columns['extras'] = np.frombuffer(b"".join(encoded), dtype='u1')
+        
+        # The full text is usually just the segment texts joined; only store it when it is not
+        fields = {key: value for key, value in result.items() if key != 'segments'}
+        text_joined = fields.get('text') == b"".join(self.texts).decode('utf-8')
+        if text_joined:
+            fields['text'] = None
+        
+        directory = {}
+        position = 0
+        for name, array in columns.items():
+            directory[name] = [array.dtype.str, position, len(array)]
+            position = _aligned(position + array.nbytes)
+        header = json.dumps({
+            'count': count,
+            'order': list(result),
+            'fields': fields,
+            'text_joined': text_joined,
+            'keys': self.key_order,
+            'numeric': numeric,
+            'columns': directory,
+        }, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        
+        parts = [_PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header)), header]
+        parts.append(b"\0" * (_aligned(_PREAMBLE.size + len(header)) - _PREAMBLE.size - len(header)))
+        for array in columns.values():
+            data = array.tobytes()
+            parts.append(data)
+            parts.append(b"\0" * (_aligned(len(data)) - len(data)))
+        return b"".join(parts)
+
+
+def encode_vxt(result):
+    """A Whisper result dict as .vxt bytes"""
+    builder = VxtBuilder()
+    for segment in result['segments']:
+        builder.add(segment)
+    return builder.finish(result)
+
+
+def is_vxt(path):
+    try:
+        with open(path, 'rb') as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+class VxtFile:
+    """
+    A memory-mapped .vxt transcript. Columns are read on demand, so opening a
+    file and fetching a time range touches only the header, the index and
+    the requested segments.
+    """
+    
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            try:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty file
+                raise ValueError(f"{self.path.name} is not a Voxtext binary transcript") from None
+        try:
+            if len(self._map) < _PREAMBLE.size:
+                raise ValueError(f"{self.path.name} is not a Voxtext binary transcript")
+            magic, version, header_length = _PREAMBLE.unpack_from(self._map, 0)
+            if magic != MAGIC:
+                raise ValueError(f"{self.path.name} is not a Voxtext binary transcript")
+            if version > FORMAT_VERSION:
+                raise ValueError(f"{self.path.name} was written by a newer Voxtext (format {version})")
+            self.header = json.loads(self._map[_PREAMBLE.size:_PREAMBLE.size + header_length].decode('utf-8'))
+        except BaseException:
+            self._map.close()
+            raise
+        self._data_start = _aligned(_PREAMBLE.size + header_length)
+        self._columns = {}
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def __len__(self):
+        return self.header['count']
+    
+    def close(self):
+        self._columns.clear()
+        try:
+            self._map.close()
+        except BufferError:
+            pass  # a caller still holds a column array; the map closes with it
+    
+    def has_column(self, name):
+        return name in self.header['columns']
+    
+    def column(self, name):
+        """A column as a read-only numpy view of the mapped file"""
+        if name not in self._columns:
+            dtype, offset, length = self.header['columns'][name]
+            self._columns[name] = np.frombuffer(
+                self._map, dtype=np.dtype(dtype), count=length, offset=self._data_start + offset
+            )
+        return self._columns[name]
+    
+    def _blob(self, name, index):
+        offsets = self.column(f'{name}_offsets')
+        _, offset, _ = self.header['columns'][name]
+        begin = self._data_start + offset
+        return self._map[begin + int(offsets[index]):begin + int(offsets[index + 1])]
+    
+    def text(self, index):
+        return self._blob('text', index).decode('utf-8')
+    
+    def segment(self, index):
+        """Segment index as the dict Whisper produced"""
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        values = {
+            'start': float(self.column('start')[index]),
+            'end': float(self.column('end')[index]),
+            'text': self.text(index),
+        }
+        for key, dtype in self.header['numeric'].items():
+            value = self.column(f'field:{key}')[index]
+            values[key] = int(value) if dtype == '<i8' else float(value)
+        if self.has_column('tokens'):
+            offsets = self.column('tokens_offsets')
+            values['tokens'] = self.column('tokens')[int(offsets[index]):int(offsets[index + 1])].tolist()
+        if self.has_column('words_offsets'):
+            offsets = self.column('words_offsets')
+            words = []
+            for word_index in range(int(offsets[index]), int(offsets[index + 1])):
+                word = {'word': self._blob('word_text', word_index).decode('utf-8')}
+                for key in WORD_KEYS[1:]:
+                    word[key] = float(self.column(f'word_{key}')[word_index])
+                words.append(word)
+            values['words'] = words
+        if self.has_column('extras'):
+            data = self._blob('extras', index)
+            if data:
+                values.update(json.loads(data.decode('utf-8')))
+        
+        segment = {key: values.pop(key) for key in self.header['keys'] if key in values}
+        segment.update(values)
+        return segment
+    
+    def find(self, start=None, end=None):
+        """Indices of the segments overlapping [start, end) seconds"""
+        first, last = 0, len(self)
+        if start is not None:
+            first = int(np.searchsorted(self.column('end_max'), start, side='right'))
+        if end is not None:
+            last = int(np.searchsorted(self.column('start_min'), end, side='left'))
+        starts, ends = self.column('start'), self.column('end')
+        return [
+            index for index in range(first, max(first, last))
+            if (end is None or starts[index] < end) and (start is None or ends[index] > start)
+        ]
+    
+    def segments(self, start=None, end=None):
+        """The segments overlapping [start, end) seconds (all of them by default)"""
+        return [self.segment(index) for index in self.find(start, end)]
+    
+    def to_result(self):
+        """The full Whisper result dict"""
+        segments = self.segments()
+        fields = dict(self.header['fields'])
+        if self.header['text_joined']:
+            fields['text'] = "".join(segment['text'] for segment in segments)
+        fields['segments'] = segments
+        return {key: fields[key] for key in self.header['order']}
+
+
+def load_vxt(path):
+    """Read a whole .vxt transcript as a Whisper result dict"""
+    with VxtFile(path) as transcript:
+        return transcript.to_result()
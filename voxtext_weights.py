@@ -0,0 +1,201 @@
+"""
+Voxtext memory-mapped model weights
+
+whisper.load_model() reads the whole .pt checkpoint into memory and then
+copies it into a freshly allocated model, so peak memory while loading is
+about twice the model size. This loader converts each checkpoint once into a
+safetensors file in the model store (float32, the layout whisper.load_model()
+ends up with) and builds the model directly on top of a copy-on-write memory
+map of it: weights are paged in as they are first used, nothing is copied,
+and every process mapping the same file shares the same page-cache pages.
+
+The file follows the safetensors layout (8-byte header length, JSON header,
+raw little-endian tensor data) so it can be inspected with standard tools,
+but reading and writing it needs only numpy and torch.
+"""
+
+import sys
+import json
+import time
+import struct
+from pathlib import Path
+
+_DTYPES = {  # safetensors name -> numpy dtype name
+    'F32': 'float32',
+    'F16': 'float16',
+    'I64': 'int64',
+    'I32': 'int32',
+    'BOOL': 'bool',
+}
+
+
+def weights_path(checkpoint_path):
+    """The converted file that sits next to a .pt checkpoint in the store"""
+    checkpoint_path = Path(checkpoint_path)
+    return checkpoint_path.with_suffix(".safetensors")
+
+
+def peak_rss_mb():
+    """Peak resident memory of this process so far, or None where unknown"""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def convert_checkpoint(checkpoint_path, output_path=None):
+    """
+    Write a Whisper .pt checkpoint as a float32 safetensors file (once per
+    model; reused afterwards). Returns the output path. The file appears
+    atomically, so processes converting side by side never see a partial one.
+    """
+    import torch
+    import numpy as np
+    from voxtext_cache import atomic_write_file
+    
+    checkpoint_path = Path(checkpoint_path)
+    output_path = Path(output_path or weights_path(checkpoint_path))
+    checkpoint = torch.load(checkpoint_path, map_location="cpu")
+    
+    tensors = {}
+    for name, tensor in checkpoint["model_state_dict"].items():
+        if tensor.is_floating_point():
+            tensor = tensor.float()
+        tensors[name] = tensor.contiguous().numpy()
+    
+    # Widest dtypes first keeps every tensor aligned for zero-copy views
+    names = sorted(tensors, key=lambda n: (-tensors[n].dtype.itemsize, n))
+    numpy_to_st = {v: k for k, v in _DTYPES.items()}
+    header = {'__metadata__': {'format': 'pt', 'dims': json.dumps(checkpoint["dims"])}}
+    offset = 0
+    for name in names:
+        array = tensors[name]
+        header[name] = {
+            'dtype': numpy_to_st[array.dtype.name],
+            'shape': list(array.shape),
+            'data_offsets': [offset, offset + array.nbytes],
+        }
+        offset += array.nbytes
+    
+    header_bytes = json.dumps(header, separators=(',', ':')).encode('utf-8')
+    header_bytes += b' ' * (-len(header_bytes) % 8)  # data starts 8-byte aligned
+    
+    def write(f):
+        f.write(struct.pack('<Q', len(header_bytes)))
+        f.write(header_bytes)
+        for name in names:
+            f.write(tensors[name].tobytes())
+    
+    # Same permissions as the checkpoint downloaded next to it (umask-based)
+    atomic_write_file(output_path, write, private=False)
+    return output_path
+
+
+def ensure_mapped_weights(checkpoint_path):
+    """The converted weights of a checkpoint, converting it first if needed; returns (path, converted)"""
+    path = weights_path(checkpoint_path)
+    if path.exists():
+        return path, False
+    return convert_checkpoint(checkpoint_path, path), True
+
+
+def map_weights(path):
+    """Return (state_dict, metadata) whose tensors are views of a copy-on-write memory map"""
+    import torch
+    import numpy as np
+    
+    with open(path, 'rb') as f:
+        header_length = struct.unpack('<Q', f.read(8))[0]
+        header = json.loads(f.read(header_length))
+    metadata = header.pop('__metadata__', {})
+    
+    # 'c' maps pages shared and read-only until written, so tensors stay writable
+    # without every process getting its own copy of the weights
+    buffer = np.memmap(path, dtype=np.uint8, mode='c', offset=8 + header_length)
+    state_dict = {}
+    for name, info in header.items():
+        start, end = info['data_offsets']
+        array = buffer[start:end].view(_DTYPES[info['dtype']]).reshape(info['shape'])
+        state_dict[name] = torch.from_numpy(array)
+    return state_dict, metadata
+
+
+def model_skeleton(dims):
+    """
+    Whisper(dims) without its weight allocation: the encoder and decoder are
+    built on the meta device, to be handed their weights. (Whisper's own
+    __init__ cannot run on meta; it builds a sparse buffer.)
+    """
+    import torch
+    from whisper.model import Whisper, AudioEncoder, TextDecoder
+    
+    model = Whisper.__new__(Whisper)
+    torch.nn.Module.__init__(model)
+    model.dims = dims
+    with torch.device("meta"):
+        model.encoder = AudioEncoder(
+            dims.n_mels, dims.n_audio_ctx, dims.n_audio_state, dims.n_audio_head, dims.n_audio_layer
+        )
+        model.decoder = TextDecoder(
+            dims.n_vocab, dims.n_text_ctx, dims.n_text_state, dims.n_text_head, dims.n_text_layer
+        )
+    return model
+
+
+def finish_model(model, model_name):
+    """
+    Build the buffers that are not in the checkpoint as Whisper does (the
+    decoder's causal mask, and the default alignment heads, the upper half
+    of the decoder layers, unless Whisper ships tuned ones for the model)
+    and check that no weights were left on the meta device
+    """
+    import torch
+    from whisper import _ALIGNMENT_HEADS
+    
+    dims = model.dims
+    mask = torch.empty(dims.n_text_ctx, dims.n_text_ctx).fill_(-float("inf")).triu_(1)
+    model.decoder.register_buffer("mask", mask, persistent=False)
+    all_heads = torch.zeros(dims.n_text_layer, dims.n_text_head, dtype=torch.bool)
+    all_heads[dims.n_text_layer // 2:] = True
+    model.register_buffer("alignment_heads", all_heads.to_sparse(), persistent=False)
+    if model_name in _ALIGNMENT_HEADS:
+        model.set_alignment_heads(_ALIGNMENT_HEADS[model_name])
+    left_on_meta = [name for name, tensor in model.named_parameters() if tensor.is_meta]
+    left_on_meta += [name for name, tensor in model.named_buffers() if tensor.is_meta]
+    if left_on_meta:
+        raise RuntimeError(f"Unsupported Whisper version: no weights for {', '.join(sorted(set(left_on_meta)))}")
+    return model
+
+
+def load_mapped_model(model_name, checkpoint_path, device=None):
+    """
+    Build a Whisper model over memory-mapped weights, converting the
+    checkpoint first if needed. Returns (model, stats) where stats has the
+    load time and peak memory for reporting.
+    """
+    import torch
+    from whisper.model import ModelDimensions
+    
+    started = time.perf_counter()
+    path, converted = ensure_mapped_weights(checkpoint_path)
+    
+    state_dict, metadata = map_weights(path)
+    model = model_skeleton(ModelDimensions(**json.loads(metadata['dims'])))
+    model.load_state_dict(state_dict, assign=True)
+    finish_model(model, model_name)
+    
+    if device is None:
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+    if device != "cpu":
+        model = model.to(device)
+    
+    stats = {
+        'seconds': time.perf_counter() - started,
+        'peak_rss_mb': peak_rss_mb(),
+        'mapped_mb': path.stat().st_size / (1024 * 1024),
+        'converted': converted,
+    }
+    return model, stats
@@ -0,0 +1,338 @@
+"""
+Voxtext output writers
+
+Each output format is a writer class registered in WRITERS. render_outputs()
+walks the transcript's segments once, feeding every requested writer, and
+each writer collects its text as a list of parts joined once at the end.
+save_outputs() then writes every file atomically (temp file + rename), so a
+cancelled or failed job never leaves a half-written transcript behind. With
+threads > 1 the files are written concurrently, which helps on network shares
+where each file costs a few round trips.
+"""
+
+import json
+from pathlib import Path
+
+
+def format_timestamp(seconds, use_comma=True):
+    """Format seconds as SRT/VTT timestamp"""
+    hours = int(seconds // 3600)
+    minutes = int((seconds % 3600) // 60)
+    secs = int(seconds % 60)
+    millisecs = int((seconds % 1) * 1000)
+    separator = ',' if use_comma else '.'
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{separator}{millisecs:03d}"
+
+
+# How subtitle cues use word timings (when the transcript has them)
+WORD_CUE_MODES = {
+    'segments': "One cue per segment",
+    'karaoke': "Karaoke (VTT word highlighting)",
+    'words': "One cue per word",
+}
+
+
+class Cue:
+    """One subtitle cue; words are (start seconds, text) pairs for karaoke timing"""
+    __slots__ = ('start', 'end', 'text', 'words', 'start_stamp', 'end_stamp')
+    
+    def __init__(self, start, end, text, words=None):
+        self.start = start
+        self.end = end
+        self.text = text
+        self.words = words
+        # Formatted once and shared by every subtitle writer
+        self.start_stamp = format_timestamp(start, use_comma=False)
+        self.end_stamp = format_timestamp(end, use_comma=False)
+
+
+def segment_cues(segment, word_cues='segments'):
+    """
+    The cues for one segment. The word modes fall back to one cue for the
+    segment when it has no word timings.
+    """
+    words = [word for word in segment.get('words') or [] if word['word'].strip()]
+    if word_cues == 'words' and words:
+        return [Cue(word['start'], max(word['end'], word['start']), word['word'].strip()) for word in words]
+    cue = Cue(segment['start'], segment['end'], segment['text'].strip())
+    if word_cues == 'karaoke' and words:
+        cue.words = [(word['start'], word['word'].strip()) for word in words]
+    return [cue]
+
+
+def karaoke_text(cue):
+    """Cue text with a WebVTT timestamp tag before every word after the first"""
+    parts = [cue.words[0][1]]
+    last = cue.start
+    for start, word in cue.words[1:]:
+        # Tags must stay inside the cue and never go backwards
+        last = min(max(start, last), cue.end)
+        parts.append(f"<{format_timestamp(last, use_comma=False)}>{word}")
+    
+    # Keep the cue's line breaks (words are laid out one line after another)
+    lines = cue.text.split("\n")
+    counts = [len(line.split()) for line in lines]
+    if len(lines) == 1 or sum(counts) != len(parts):
+        return " ".join(parts)
+    tagged_lines = []
+    for count in counts:
+        tagged_lines.append(" ".join(parts[:count]))
+        parts = parts[count:]
+    return "\n".join(tagged_lines)
+
+
+class TranscriptWriter:
+    """
+    One output format. Writers that need the segments set uses_segments and
+    get add_segment() calls; subtitle writers set uses_cues and get add_cue()
+    calls; both in order, before render() returns the file text (or bytes,
+    for binary formats).
+    """
+    extension = ""
+    uses_segments = False
+    uses_cues = False
+    
+    def __init__(self, result, lms_settings=None):
+        self.result = result
+        self.lms_settings = lms_settings or {}
+        self.parts = []
+    
+    def add_segment(self, segment):
+        pass
+    
+    def add_cue(self, cue):
+        pass
+    
+    def render(self):
+        return "".join(self.parts)
+
+
+class TextWriter(TranscriptWriter):
+    """Plain text transcript"""
+    extension = "txt"
+    
+    def render(self):
+        return self.result['text']
+
+
+class SrtWriter(TranscriptWriter):
+    """SRT subtitles (no inline word timing: karaoke cues are written plain)"""
+    extension = "srt"
+    uses_cues = True
+    
+    def __init__(self, result, lms_settings=None):
+        super().__init__(result, lms_settings)
+        self.count = 0
+    
+    def add_cue(self, cue):
+        self.count += 1
+        start, end = cue.start_stamp.replace('.', ','), cue.end_stamp.replace('.', ',')
+        self.parts.append(f"{self.count}\n{start} --> {end}\n{cue.text}\n\n")
+
+
+class VttWriter(TranscriptWriter):
+    """WebVTT subtitles with optional LMS styling and karaoke word timing"""
+    extension = "vtt"
+    uses_cues = True
+    
+    def __init__(self, result, lms_settings=None):
+        super().__init__(result, lms_settings)
+        self.parts.append("WEBVTT\n")
+        self.cue_settings = ""
+        if self.lms_settings.get('enabled'):
+            css_content = self.lms_settings.get('css', '').strip()
+            if css_content:
+                self.parts.append(f"\nSTYLE\n{css_content}\n")
+            cue_settings = self.lms_settings.get('cue_settings', '').strip()
+            if cue_settings:
+                self.cue_settings = " " + cue_settings
+        self.parts.append("\n")
+    
+    def add_cue(self, cue):
+        text = karaoke_text(cue) if cue.words else cue.text
+        self.parts.append(f"{cue.start_stamp} --> {cue.end_stamp}{self.cue_settings}\n{text}\n\n")
+
+
+class HtmlWriter(TranscriptWriter):
+    """HTML with a collapsible details tag"""
+    extension = "html"
+    
+    def render(self):
+        return f"""<h3>Full Transcript</h3>
+<details>
+<summary>Click to expand transcript</summary>
+
+{self.result['text']}
+
+</details>
+
+<p><em>Transcribed with Voxtext using OpenAI Whisper</em></p>"""
+
+
+class MarkdownWriter(TranscriptWriter):
+    """Markdown transcript"""
+    extension = "md"
+    
+    def render(self):
+        return f"""# Transcript
+
+{self.result['text']}
+
+---
+
+*Transcribed with Voxtext using OpenAI Whisper*
+"""
+
+
+class JsonWriter(TranscriptWriter):
+    """
+    The full Whisper result as JSON, one segment per line: still readable and
+    diffable, but far smaller and faster than indenting every segment field.
+    """
+    extension = "json"
+    uses_segments = True
+    
+    def add_segment(self, segment):
+        self.parts.append(json.dumps(segment, ensure_ascii=False))
+    
+    def render(self):
+        fields = []
+        for key, value in self.result.items():
+            if key == 'segments':
+                value_text = "[\n    " + ",\n    ".join(self.parts) + "\n  ]" if self.parts else "[]"
+            else:
+                value_text = json.dumps(value, ensure_ascii=False)
+            fields.append(f"  {json.dumps(key, ensure_ascii=False)}: {value_text}")
+        return "{\n" + ",\n".join(fields) + "\n}"
+
+
+class VxtWriter(TranscriptWriter):
+    """Compact binary transcript with a time index (see voxtext_vxt)"""
+    extension = "vxt"
+    uses_segments = True
+    
+    def __init__(self, result, lms_settings=None):
+        from voxtext_vxt import VxtBuilder
+        
+        super().__init__(result, lms_settings)
+        self.builder = VxtBuilder()
+    
+    def add_segment(self, segment):
+        self.builder.add(segment)
+    
+    def render(self):
+        return self.builder.finish(self.result)
+
+
+# Output format -> writer, in the order files are written
+WRITERS = {
+    'txt': TextWriter,
+    'srt': SrtWriter,
+    'vtt': VttWriter,
+    'html': HtmlWriter,
+    'md': MarkdownWriter,
+    'json': JsonWriter,
+    'vxt': VxtWriter,
+}
+
+
+def caption_limits(lms_settings):
+    """The caption layout limits of enabled LMS settings, or None"""
+    lms_settings = lms_settings or {}
+    return lms_settings.get('caption_limits') if lms_settings.get('enabled') else None
+
+
+def render_outputs(result, output_formats, lms_settings=None, word_cues='segments'):
+    """
+    Render the requested formats from one pass over the segments.
+    Subtitle cues follow the segments unless the LMS settings carry caption
+    limits (see voxtext_captions); one cue per word ignores the limits.
+    Returns [(format, text or bytes)] in WRITERS order.
+    """
+    writers = [(fmt, writer(result, lms_settings)) for fmt, writer in WRITERS.items() if fmt in output_formats]
+    segment_writers = [writer for fmt, writer in writers if writer.uses_segments]
+    cue_writers = [writer for fmt, writer in writers if writer.uses_cues]
+    
+    layout = None
+    limits = caption_limits(lms_settings)
+    if cue_writers and limits and word_cues != 'words':
+        from voxtext_captions import CaptionLayout
+        layout = CaptionLayout(limits, karaoke=word_cues == 'karaoke')
+    
+    def add_cues(cues):
+        for cue in cues:
+            for writer in cue_writers:
+                writer.add_cue(cue)
+    
+    if segment_writers or cue_writers:
+        for segment in result['segments']:
+            for writer in segment_writers:
+                writer.add_segment(segment)
+            if layout:
+                add_cues(layout.add(segment))
+            elif cue_writers:
+                add_cues(segment_cues(segment, word_cues))
+        if layout:
+            add_cues(layout.finish())
+    return [(fmt, writer.render()) for fmt, writer in writers]
+
+
+def output_path(output_dir, base_name, fmt):
+    return Path(output_dir) / f"{base_name}_transcript.{WRITERS[fmt].extension}"
+
+
+def save_outputs(rendered, base_name, output_dir, on_written=None, is_cancelled=None, threads=1):
+    """
+    Atomically write rendered [(format, text)] files and return their paths.
+    on_written(path) is called in the calling thread after each file.
+    """
+    from voxtext_cache import atomic_write_bytes
+    from voxtext_engine import TranscriptionCancelled
+    
+    def save(fmt, text):
+        path = output_path(output_dir, base_name, fmt)
+        data = text.encode('utf-8') if isinstance(text, str) else text
+        atomic_write_bytes(path, data, private=False)
+        return path
+    
+    def check_cancelled():
+        if is_cancelled and is_cancelled():
+            raise TranscriptionCancelled()
+    
+    created_files = []
+    if threads <= 1 or len(rendered) <= 1:
+        for fmt, text in rendered:
+            check_cancelled()
+            path = save(fmt, text)
+            created_files.append(str(path))
+            if on_written:
+                on_written(path)
+        return created_files
+    
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    
+    check_cancelled()
+    with ThreadPoolExecutor(max_workers=min(threads, len(rendered))) as pool:
+        pending = [pool.submit(save, fmt, text) for fmt, text in rendered]
+        try:
+            for future in as_completed(pending):
+                path = future.result()
+                if on_written:
+                    on_written(path)
+                check_cancelled()
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            raise
+    # Report in format order, like the sequential path
+    return [str(future.result()) for future in pending]
+
+
+def write_outputs(result, base_name, output_dir, output_formats, lms_settings=None, on_written=None,
+                  is_cancelled=None, threads=1, word_cues='segments'):
+    """
+    Write every requested format for one transcript.
+    Returns the created paths; on_written(path) is called after each file.
+    """
+    rendered = render_outputs(result, output_formats, lms_settings, word_cues)
+    return save_outputs(rendered, base_name, output_dir, on_written, is_cancelled, threads)